@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+PolyFlup Exchange Emulator
+Serves Binance/Polymarket endpoints locally so the bot loop can be run and
+load-tested offline against recorded (or synthetic) market data.
+
+    python emulator.py serve                      # print env overrides, serve forever
+    python emulator.py record BTCUSDT ETHUSDT     # record live klines as fixtures
+    python emulator.py bench --markets 25 --duration 300
+    python emulator.py wsbench                    # Market Channel decode msg/s
+"""
+
+import sys
+import os
+import argparse
+import base64
+import tempfile
+import threading
+import time
+
+# Add src to python path if needed
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.emulator import ExchangeEmulator, FixtureSet
+from src.emulator.fixtures import DEFAULT_FIXTURES_DIR
+
+DEFAULT_MARKETS = ["BTC", "ETH", "XRP", "SOL"]
+
+
+def build_emulator(args) -> ExchangeEmulator:
+    overrides = {}
+    for item in args.service_latency or []:
+        service, _, ms = item.partition("=")
+        overrides[service] = float(ms)
+    return ExchangeEmulator(
+        host=args.host,
+        port=args.port,
+        ws_port=args.ws_port,
+        fixtures=FixtureSet(args.fixtures),
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        latency_overrides=overrides,
+        error_rate=args.error_rate,
+        ws_drop_rate=args.ws_drop_rate,
+        balance=args.balance,
+        workdir=args.workdir,
+    )
+
+
+def bench_markets(count: int) -> list:
+    """Real symbols first, then synthetic ones (M05, M06, ...) up to count"""
+    markets = DEFAULT_MARKETS[:count]
+    markets += [f"M{i:02d}" for i in range(len(markets) + 1, count + 1)]
+    return markets
+
+
+def cmd_serve(args):
+    emulator = build_emulator(args)
+    emulator.start()
+    for key, value in emulator.env().items():
+        print(f"export {key}={value}")
+    print(f"# Emulator running on :{args.port} (HTTP) and :{args.ws_port} (WS) - Ctrl+C to stop")
+    print(f"# Bot logs, trades.db and klines go to {emulator.workdir}")
+    try:
+        while True:
+            time.sleep(60)
+            print(f"# {emulator.format_stats()}")
+    except KeyboardInterrupt:
+        emulator.stop()
+
+
+def cmd_record(args):
+    from src.emulator import record_fixtures
+
+    for path in record_fixtures(args.fixtures, args.pairs, token_id=args.token_id):
+        print(f"📼 Recorded {path}")
+
+
+def cmd_bench(args):
+    from eth_account import Account
+
+    emulator = build_emulator(args)
+    emulator.start()
+
+    # Settings are read at import time, so everything must be in place before src.bot loads
+    os.environ.update(emulator.env())
+    os.environ.update(
+        {
+            "MARKETS": ",".join(bench_markets(args.markets)),
+            "BINANCE_PAIRS": ",".join(f"{m}={m}USDT" for m in bench_markets(args.markets)),
+            "PROXY_PK": Account.create().key.hex(),
+            "API_KEY": "emulator",
+            "API_SECRET": base64.urlsafe_b64encode(os.urandom(32)).decode(),
+            "API_PASSPHRASE": "emulator",
+            "DISCORD_WEBHOOK": "",
+            "ENABLE_BFXD": "NO",
+        }
+    )
+    if not os.environ["PROXY_PK"].startswith("0x"):
+        os.environ["PROXY_PK"] = "0x" + os.environ["PROXY_PK"]
+    os.environ["FUNDER_PROXY"] = Account.from_key(os.environ["PROXY_PK"]).address
+
+    from src.bot import main
+    from src.utils.http import http_client
+    from src.data.market_data.binance_weight import binance_weight
+    from src.utils.websocket_manager import ws_manager
+
+    print(f"🏁 Benchmarking {args.markets} markets for {args.duration}s (logs: {emulator.workdir})")
+    threading.Thread(target=main, daemon=True).start()
+    started = time.time()
+    while time.time() - started < args.duration:
+        time.sleep(1)
+
+    print(f"📈 Emulator requests: {emulator.format_stats()}")
+    print(f"🌐 HTTP latency: {http_client.format_stats()}")
+    print(f"⚖️  Binance weight: {binance_weight.format_stats()}")
+    print(f"📡 WebSocket: {ws_manager.format_stats()}")
+    sys.stdout.flush()
+    # The bot loop has no shutdown hook - exit without waiting for its threads
+    os._exit(0)
+
+
+def ws_bench_messages(tokens: int, count: int, seed: int = 7) -> list:
+    """
+    Market Channel frames for decoding benchmarks: a book snapshot per token,
+    then mostly two-sided price_change bursts with some best_bid_ask and
+    last_trade_price events, all consistent with one simulated book per token.
+    """
+    import json
+    import random
+
+    rng = random.Random(seed)
+    token_ids = [str(10**70 + i) for i in range(tokens)]
+    books = {
+        t: {("BUY", f"0.{p:02d}"): "100" for p in range(40, 50)}
+        | {("SELL", f"0.{p:02d}"): "100" for p in range(51, 61)}
+        for t in token_ids
+    }
+
+    def best(book):
+        bids = [float(p) for s, p in book if s == "BUY"]
+        asks = [float(p) for s, p in book if s == "SELL"]
+        return f"{max(bids):.2f}", f"{min(asks):.2f}"
+
+    def now_ms():
+        return str(int(time.time() * 1000))
+
+    frames = [
+        json.dumps(
+            [
+                {
+                    "event_type": "book",
+                    "asset_id": t,
+                    "market": "0xbench",
+                    "timestamp": now_ms(),
+                    "hash": f"{i:040x}",
+                    "bids": [
+                        {"price": p, "size": s}
+                        for (side, p), s in book.items()
+                        if side == "BUY"
+                    ],
+                    "asks": [
+                        {"price": p, "size": s}
+                        for (side, p), s in book.items()
+                        if side == "SELL"
+                    ],
+                }
+                for i, (t, book) in enumerate(books.items())
+            ]
+        )
+    ]
+    while len(frames) < count:
+        t = rng.choice(token_ids)
+        book = books[t]
+        roll = rng.random()
+        if roll < 0.8:
+            changes = []
+            for _ in range(2):
+                side = rng.choice(("BUY", "SELL"))
+                level = rng.randrange(40, 50) if side == "BUY" else rng.randrange(51, 61)
+                price = f"0.{level:02d}"
+                size = str(rng.choice((0, 50, 100, 250)))
+                if size == "0":
+                    if sum(1 for s, _ in book if s == side) <= 1:
+                        continue
+                    book.pop((side, price), None)
+                else:
+                    book[(side, price)] = size
+                b, a = best(book)
+                changes.append(
+                    {
+                        "asset_id": t,
+                        "price": price,
+                        "size": size,
+                        "side": side,
+                        "hash": f"{rng.getrandbits(160):040x}",
+                        "best_bid": b,
+                        "best_ask": a,
+                    }
+                )
+            event = {
+                "event_type": "price_change",
+                "market": "0xbench",
+                "price_changes": changes,
+                "timestamp": now_ms(),
+            }
+        elif roll < 0.9:
+            b, a = best(book)
+            event = {
+                "event_type": "best_bid_ask",
+                "asset_id": t,
+                "market": "0xbench",
+                "best_bid": b,
+                "best_ask": a,
+                "spread": f"{float(a) - float(b):.2f}",
+                "timestamp": now_ms(),
+            }
+        else:
+            b, _ = best(book)
+            event = {
+                "event_type": "last_trade_price",
+                "asset_id": t,
+                "market": "0xbench",
+                "price": b,
+                "side": "SELL",
+                "size": "25",
+                "fee_rate_bps": "0",
+                "timestamp": now_ms(),
+            }
+        frames.append(json.dumps(event))
+    return frames
+
+
+def cmd_wsbench(args):
+    """Measure Market Channel messages/second through WebSocketManager"""
+    import asyncio
+    import json
+
+    workdir = tempfile.mkdtemp(prefix="polyflup-wsbench-")
+    # Settings only need a well-formed key; nothing is signed
+    os.environ.setdefault("PROXY_PK", "0x" + os.urandom(32).hex())
+    os.environ.setdefault("LOG_DIR", os.path.join(workdir, "logs"))
+    os.environ.setdefault("DISCORD_WEBHOOK", "")
+
+    from src.utils.websocket_manager import WebSocketManager, DECODER
+
+    frames = ws_bench_messages(args.tokens, args.messages)
+    decoders = {"json": json.loads, DECODER: None}
+
+    async def run(loads):
+        manager = WebSocketManager(loads=loads)
+        started = time.perf_counter()
+        for frame in frames:
+            await manager._handle_message(frame)
+        return time.perf_counter() - started
+
+    print(f"🏁 {len(frames)} frames, {args.tokens} tokens, best of {args.rounds}")
+    for name, loads in decoders.items():
+        elapsed = min(asyncio.run(run(loads)) for _ in range(args.rounds))
+        print(
+            f"   {name:>8}: {len(frames) / elapsed:>10,.0f} msg/s ({elapsed * 1e6 / len(frames):.1f} µs/msg)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PolyFlup exchange emulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--ws-port", type=int, default=8766)
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES_DIR)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument(
+        "--service-latency",
+        action="append",
+        metavar="SERVICE=MS",
+        help="Per-service latency override, e.g. clob=120 (binance, fapi, clob, gamma, data, rpc, fng)",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--ws-drop-rate", type=float, default=0.0)
+    parser.add_argument("--balance", type=float, default=1000.0)
+    parser.add_argument(
+        "--workdir", help="Directory for the bot's logs, trades.db and klines (default: new temp dir)"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("serve", help="Run the emulator and print env overrides")
+
+    record = sub.add_parser("record", help="Record live klines (and a book) as fixtures")
+    record.add_argument("pairs", nargs="+", help="Binance pairs, e.g. BTCUSDT")
+    record.add_argument("--token-id", help="Polymarket token to record an order book from")
+
+    bench = sub.add_parser("bench", help="Run the bot loop against the emulator")
+    bench.add_argument("--markets", type=int, default=10)
+    bench.add_argument("--duration", type=int, default=300)
+
+    wsbench = sub.add_parser("wsbench", help="Benchmark Market Channel message decoding")
+    wsbench.add_argument("--tokens", type=int, default=20)
+    wsbench.add_argument("--messages", type=int, default=50000)
+    wsbench.add_argument("--rounds", type=int, default=3)
+
+    args = parser.parse_args()
+    {
+        "serve": cmd_serve,
+        "record": cmd_record,
+        "bench": cmd_bench,
+        "wsbench": cmd_wsbench,
+    }[args.command](args)
+
+
+if __name__ == "__main__":
+    main()
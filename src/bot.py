@@ -4,6 +4,7 @@ import time
 import os
 import sys
 import fcntl
+import threading
 from typing import Optional, List, Tuple
 from datetime import datetime
 from zoneinfo import ZoneInfo
@@ -17,12 +18,15 @@ from src.config.settings import (
     MAX_SPREAD,
     WINDOW_DELAY_SEC,
     MAX_ENTRY_LATENESS_SEC,
+    PREWARM_LEAD_SEC,
     ADX_ENABLED,
     ADX_PERIOD,
     ADX_INTERVAL,
+    ENABLE_BINANCE_STREAM,
     BET_PERCENT,
     CONFIDENCE_SCALING_FACTOR,
     ENABLE_STOP_LOSS,
+    ENABLE_EVENT_STOP_LOSS,
     STOP_LOSS_PERCENT,
     ENABLE_TAKE_PROFIT,
     TAKE_PROFIT_PERCENT,
@@ -40,10 +44,16 @@ from src.config.settings import (
     ENABLE_DIVERGENCE,
     ENABLE_VWM,
     ENABLE_BFXD,
+    WS_STALE_WARN_SEC,
 )
 
 from src.utils.logger import log, log_error, send_discord, set_log_window
 from src.utils.web3_utils import get_balance
+from src.utils.http import http_client
+from src.data.market_data.external import funding_bias_cache, fear_greed_cache
+from src.data.market_data.market_cache import market_cache
+from src.data.market_data.binance_weight import binance_weight
+from src.data.market_data.window_calendar import window_calendar
 from src.data.database import (
     init_database,
     save_trade,
@@ -55,10 +65,14 @@ from src.data.database import (
 from src.data.market_data import (
     get_token_ids,
     get_current_slug,
+    get_next_slug,
+    get_market_info,
+    discover_markets,
     get_window_times,
     format_window_range,
     get_funding_bias,
     get_window_start_price,
+    capture_window_start_price,
     get_current_spot_price,
 )
 from src.trading import (
@@ -80,6 +94,7 @@ from src.trading.orders import (
     get_spread,
     get_order,
     check_liquidity,
+    warm_order_params,
     BUY,
     SELL,
 )
@@ -90,10 +105,12 @@ from src.trading.position_manager import (
     sync_positions_with_exchange,
     sync_with_exchange,
     execute_first_entry,
+    init_stop_loss_events,
 )
 from src.utils.notifications import process_notifications, init_ws_callbacks
 from src.trading.settlement import check_and_settle_trades
 from src.utils.websocket_manager import ws_manager
+from src.data.market_data.binance_stream import binance_stream
 
 
 def trade_symbol(symbol: str, balance: float, verbose: bool = True) -> int:
@@ -132,11 +149,34 @@ def trade_symbol(symbol: str, balance: float, verbose: bool = True) -> int:
     return 1 if trade_id else 0
 
 
+def prewarm_next_window(symbols: list) -> None:
+    """Resolve and subscribe the next window's markets before the boundary"""
+    token_ids = []
+    symbol_map = {}
+    # One Gamma request resolves every symbol's next window
+    discover_markets(symbols)
+    for symbol in symbols:
+        # Warms the cache so entry preparation never waits on the funding endpoint
+        get_funding_bias(symbol)
+        info = get_market_info(get_next_slug(symbol))
+        if not info:
+            log(f"[{symbol}] 🔍 Next window market not listed yet - will resolve at entry")
+            continue
+        for token_id in (info["up_token_id"], info["down_token_id"]):
+            warm_order_params(token_id)
+            token_ids.append(token_id)
+            symbol_map[token_id] = symbol
+
+    if token_ids:
+        ws_manager.subscribe_to_prices(token_ids, symbol_map)
+
+
 def trade_symbols_batch(symbols: list, balance: float, verbose: bool = True) -> int:
     """Execute trading logic for multiple symbols using batch orders"""
     market_tokens = {}
     all_token_ids = []
 
+    discover_markets(symbols)
     for symbol in symbols:
         up_id, down_id = get_token_ids(symbol)
         if up_id and down_id:
@@ -361,6 +401,10 @@ def main():
 
     ws_manager.start()
     init_ws_callbacks()
+    if ENABLE_EVENT_STOP_LOSS:
+        init_stop_loss_events()
+    if ENABLE_BINANCE_STREAM:
+        binance_stream.start()
 
     if FUNDER_PROXY and FUNDER_PROXY.startswith("0x"):
         addr = FUNDER_PROXY
@@ -373,9 +417,13 @@ def main():
     )
     log(f"⚙️  MIN_EDGE: {MIN_EDGE:.1%} | BET: {BET_PERCENT}%")
     log(f"⚙️  HEDGED REVERSAL: {'ENABLED' if ENABLE_HEDGED_REVERSAL else 'DISABLED'}")
-    log(f"⚙️  STOP LOSS: Midpoint <= ${STOP_LOSS_PRICE:.2f}")
+    log(
+        f"⚙️  STOP LOSS: Midpoint <= ${STOP_LOSS_PRICE:.2f}{' (tick-driven + 1s poll)' if ENABLE_EVENT_STOP_LOSS else ''}"
+    )
     log("=" * 90)
 
+    # Resolve every market's current and next window in one Gamma request
+    discover_markets(MARKETS)
     recover_open_positions()
     sync_with_exchange(addr)
 
@@ -393,6 +441,8 @@ def main():
 
     # Initialize with current window so we don't log a duplicate "NEW WINDOW" immediately
     last_window_logged = None
+    last_window_prewarmed = None
+    pending_open_capture = set()
     if MARKETS:
         try:
             last_window_logged, _ = get_window_times(MARKETS[0])
@@ -402,11 +452,13 @@ def main():
     while True:
         try:
             now_ts = time.time()
-            now_et = datetime.now(tz=ZoneInfo("America/New_York"))
+            # One calendar lookup per tick - every market shares the window
+            window = window_calendar.current(now_ts)
+            w_start, w_end = window.start_et, window.end_et
+            lateness = now_ts - window.start_ts
 
             # Log new window start
             if MARKETS:
-                w_start, w_end = get_window_times(MARKETS[0])
                 if last_window_logged != w_start:
                     range_str = format_window_range(w_start, w_end)
                     # Update logger to use a new file for this window
@@ -414,6 +466,26 @@ def main():
                     log("")
                     log(f"🪟  NEW WINDOW: {range_str}")
                     last_window_logged = w_start
+                    pending_open_capture = set(MARKETS)
+
+                # Capture window open prices from the first streamed candle
+                if pending_open_capture:
+                    for m in list(pending_open_capture):
+                        if capture_window_start_price(m):
+                            pending_open_capture.discard(m)
+                        elif lateness >= 5:
+                            get_window_start_price(m)
+                            pending_open_capture.discard(m)
+
+                # Pre-warm the next window's markets shortly before the boundary
+                if (
+                    last_window_prewarmed != w_end
+                    and window.end_ts - now_ts <= PREWARM_LEAD_SEC
+                ):
+                    last_window_prewarmed = w_end
+                    threading.Thread(
+                        target=prewarm_next_window, args=(MARKETS,), daemon=True
+                    ).start()
 
             is_verbose_cycle = now_ts - last_verbose_log >= 60
             is_order_check_cycle = now_ts - last_order_check >= 10
@@ -431,13 +503,10 @@ def main():
                 current_balance = get_balance(addr)
 
                 eligible_markets = []
-                for m in MARKETS:
-                    w_start_et, _ = get_window_times(m)
-                    lateness = (now_et - w_start_et).total_seconds()
-
-                    if 0 <= lateness <= MAX_ENTRY_LATENESS_SEC:
+                if 0 <= lateness <= MAX_ENTRY_LATENESS_SEC:
+                    for m in MARKETS:
                         if ENABLE_HEDGED_REVERSAL or not has_trade_for_window(
-                            m, w_start_et.isoformat()
+                            m, w_start.isoformat()
                         ):
                             eligible_markets.append(m)
 
@@ -472,13 +541,31 @@ def main():
 
             if is_verbose_cycle:
                 last_verbose_log = now_ts
+                feed_age = ws_manager.feed_age()
+                if (
+                    ws_manager.market_connected
+                    and feed_age is not None
+                    and feed_age > WS_STALE_WARN_SEC
+                ):
+                    log(
+                        f"⚠️  Market WebSocket silent for {feed_age:.0f}s - tick-driven stop loss is blind | {ws_manager.format_stats()}"
+                    )
                 if now_ts - last_exit_stats_log >= 900:
                     exit_stats = get_exit_plan_stats()
+                    log(f"🌐 HTTP latency: {http_client.format_stats()}")
+                    log(f"📡 WebSocket: {ws_manager.format_stats()}")
+                    log(f"⚖️  Binance weight: {binance_weight.format_stats()}")
+                    log(
+                        f"🗃️  Cache: {funding_bias_cache.format_stats()} | {fear_greed_cache.format_stats()} | {market_cache.format_stats()}"
+                    )
                     last_exit_stats_log = now_ts
                 if int(now_ts) % 14400 < 60:
                     generate_statistics()
 
-            time.sleep(0.5)
+            # Wake on the boundary and the pre-warm point rather than up to 0.5s late
+            time.sleep(
+                window_calendar.sleep_until_event(0.5, (0.0, PREWARM_LEAD_SEC))
+            )
 
         except KeyboardInterrupt:
             log("\n⛔ Bot stopped by user")
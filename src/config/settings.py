@@ -34,6 +34,12 @@ STOP_LOSS_PERCENT = float(os.getenv("STOP_LOSS_PERCENT", "40.0"))
 STOP_LOSS_PRICE = float(
     os.getenv("STOP_LOSS_PRICE", "0.30")
 )  # Sell if midpoint <= 30 cents
+ENABLE_EVENT_STOP_LOSS = (
+    os.getenv("ENABLE_EVENT_STOP_LOSS", "YES").upper() == "YES"
+)  # Also evaluate stop loss on WebSocket price ticks, not just the 1s poll
+STOP_LOSS_EVENT_DEBOUNCE_SEC = float(
+    os.getenv("STOP_LOSS_EVENT_DEBOUNCE_SEC", "0.25")
+)  # Min gap between tick-triggered evaluations of the same token
 LOSING_SIDE_MIN_CONFIDENCE = float(
     os.getenv("LOSING_SIDE_MIN_CONFIDENCE", "0.40")
 )  # Min 40% confidence for losers
@@ -111,6 +117,57 @@ ENABLE_MOMENTUM_FILTER = os.getenv("ENABLE_MOMENTUM_FILTER", "YES").upper() == "
 ENABLE_ORDER_FLOW = os.getenv("ENABLE_ORDER_FLOW", "YES").upper() == "YES"
 ENABLE_DIVERGENCE = os.getenv("ENABLE_DIVERGENCE", "YES").upper() == "YES"
 ENABLE_VWM = os.getenv("ENABLE_VWM", "YES").upper() == "YES"
+KLINE_SNAPSHOT_TTL_SEC = float(
+    os.getenv("KLINE_SNAPSHOT_TTL_SEC", "2.0")
+)  # Share one 1m kline fetch per symbol across all signals in an evaluation
+KLINE_SNAPSHOT_LIMIT = max(
+    60, MOMENTUM_LOOKBACK_MINUTES + 20
+)  # Largest 1m window any signal or validator reads
+ENABLE_BINANCE_STREAM = (
+    os.getenv("ENABLE_BINANCE_STREAM", "YES").upper() == "YES"
+)  # Stream klines/trades over WebSocket instead of polling REST
+BINANCE_STREAM_HISTORY = max(
+    int(os.getenv("BINANCE_STREAM_HISTORY", "120")), KLINE_SNAPSHOT_LIMIT
+)  # 1m candles kept in memory per pair
+BINANCE_STREAM_STALE_SEC = float(
+    os.getenv("BINANCE_STREAM_STALE_SEC", "10.0")
+)  # Fall back to REST if no push received within this window
+FUNDING_BIAS_CACHE_TTL_SEC = float(
+    os.getenv("FUNDING_BIAS_CACHE_TTL_SEC", "300")
+)  # Funding rate is served from cache and refreshed in the background after this
+FEAR_GREED_CACHE_TTL_SEC = float(
+    os.getenv("FEAR_GREED_CACHE_TTL_SEC", "1800")
+)  # Fear & Greed index updates daily
+BINANCE_WEIGHT_LIMIT = int(
+    os.getenv("BINANCE_WEIGHT_LIMIT", "6000")
+)  # Binance spot REST request weight allowed per minute (per IP)
+SPOT_PRICE_CACHE_SEC = float(
+    os.getenv("SPOT_PRICE_CACHE_SEC", "1.0")
+)  # Reuse one batched spot price fetch for all symbols within a monitor tick
+MARKET_PRICE_CACHE_TTL_SEC = float(
+    os.getenv("MARKET_PRICE_CACHE_TTL_SEC", "10.0")
+)  # Gamma outcome prices / best bid-ask reused per market while the market WS is down
+MARKET_RESOLUTION_CACHE_TTL_SEC = float(
+    os.getenv("MARKET_RESOLUTION_CACHE_TTL_SEC", "30.0")
+)  # Re-check an unresolved market's resolution after this (resolved is final)
+MARKET_CACHE_RETENTION_SEC = float(
+    os.getenv("MARKET_CACHE_RETENTION_SEC", "3600")
+)  # Keep market metadata this long after its window ends (for settlement)
+PM_HISTORY_BUCKET_SEC = float(
+    os.getenv("PM_HISTORY_BUCKET_SEC", "5.0")
+)  # Polymarket WS midpoints are kept as the last price per bucket of this size
+PM_HISTORY_WINDOW_SEC = float(
+    os.getenv("PM_HISTORY_WINDOW_SEC", "900")
+)  # Length of locally captured price history per token (one market window)
+TICK_STORE_CAPACITY = max(
+    int(os.getenv("TICK_STORE_CAPACITY", "4096")), 16
+)  # Bid/ask/mid/last ticks kept per token in the WebSocket ring buffer
+WS_STALE_WARN_SEC = float(
+    os.getenv("WS_STALE_WARN_SEC", "30")
+)  # Warn when the connected Market Channel has been silent this long
+ENABLE_KLINE_STORE = (
+    os.getenv("ENABLE_KLINE_STORE", "YES").upper() == "YES"
+)  # Persist closed 1m candles to disk and warm-start from them
 
 # External Trend Filter (Legacy)
 ENABLE_BFXD = os.getenv("ENABLE_BFXD", "NO").upper() == "YES"
@@ -120,6 +177,9 @@ WINDOW_DELAY_SEC = int(os.getenv("WINDOW_DELAY_SEC", "12"))
 MAX_ENTRY_LATENESS_SEC = int(
     os.getenv("MAX_ENTRY_LATENESS_SEC", "600")
 )  # Skip entry if > 10m late (allowed more lateness)
+PREWARM_LEAD_SEC = int(
+    os.getenv("PREWARM_LEAD_SEC", "10")
+)  # Resolve next window's markets this many seconds before the boundary
 if WINDOW_DELAY_SEC < 0:
     WINDOW_DELAY_SEC = 0
 if WINDOW_DELAY_SEC > 300:
@@ -157,6 +217,12 @@ PRICE_VALIDATION_VOLATILITY_THRESHOLD = float(
 
 # Bayesian Confidence Calculation
 BAYESIAN_CONFIDENCE = os.getenv("BAYESIAN_CONFIDENCE", "NO").upper() == "YES"
+CONFIDENCE_DEADLINE_SEC = float(
+    os.getenv("CONFIDENCE_DEADLINE_SEC", "6.0")
+)  # Max wall time for all signal fetches in one confidence evaluation
+SIGNAL_FETCH_WORKERS = int(
+    os.getenv("SIGNAL_FETCH_WORKERS", "16")
+)  # Threads shared by concurrent signal fetches
 
 # Constants
 BINANCE_FUNDING_MAP = {
@@ -165,24 +231,43 @@ BINANCE_FUNDING_MAP = {
     "XRP": "XRPUSDT",
     "SOL": "SOLUSDT",
 }
+# Extra or overridden markets as SYMBOL=PAIR (e.g. "DOGE=DOGEUSDT"); markets
+# without a pair get no Binance signals
+for _item in os.getenv("BINANCE_PAIRS", "").split(","):
+    _market, _, _pair = _item.partition("=")
+    if _market.strip() and _pair.strip():
+        BINANCE_FUNDING_MAP[_market.strip().upper()] = _pair.strip().upper()
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-os.makedirs(f"{BASE_DIR}/logs", exist_ok=True)
-LOG_FILE = f"{BASE_DIR}/logs/trades_2025.log"
-ERROR_LOG_FILE = f"{BASE_DIR}/logs/errors.log"
+LOG_DIR = os.getenv("LOG_DIR", f"{BASE_DIR}/logs")
+os.makedirs(LOG_DIR, exist_ok=True)
+LOG_FILE = f"{LOG_DIR}/trades_2025.log"
+ERROR_LOG_FILE = f"{LOG_DIR}/errors.log"
 # Database Configuration
-DB_FILE = f"{BASE_DIR}/trades.db"
-REPORTS_DIR = f"{BASE_DIR}/logs/reports"
+DB_FILE = os.getenv("DB_FILE", f"{BASE_DIR}/trades.db")
+REPORTS_DIR = f"{LOG_DIR}/reports"
 os.makedirs(REPORTS_DIR, exist_ok=True)
+KLINE_STORE_DIR = os.getenv("KLINE_STORE_DIR", f"{LOG_DIR}/klines")
 
-# API Endpoints
-CLOB_HOST = "https://clob.polymarket.com"
-CLOB_WSS_HOST = "wss://ws-subscriptions-clob.polymarket.com"
-GAMMA_API_BASE = "https://gamma-api.polymarket.com"
-DATA_API_BASE = "https://data-api.polymarket.com"
+# API Endpoints (overridable to point the bot at a local emulator)
+CLOB_HOST = os.getenv("CLOB_HOST", "https://clob.polymarket.com")
+CLOB_WSS_HOST = os.getenv("CLOB_WSS_HOST", "wss://ws-subscriptions-clob.polymarket.com")
+BINANCE_API_BASE = os.getenv("BINANCE_API_BASE", "https://api.binance.com")
+BINANCE_FAPI_BASE = os.getenv("BINANCE_FAPI_BASE", "https://fapi.binance.com")
+BINANCE_WSS_HOST = os.getenv("BINANCE_WSS_HOST", "wss://stream.binance.com:9443")
+GAMMA_API_BASE = os.getenv("GAMMA_API_BASE", "https://gamma-api.polymarket.com")
+DATA_API_BASE = os.getenv("DATA_API_BASE", "https://data-api.polymarket.com")
+FEAR_GREED_URL = os.getenv("FEAR_GREED_URL", "https://api.alternative.me/fng/")
 CHAIN_ID = 137
 SIGNATURE_TYPE = 2
-POLYGON_RPC = "https://polygon-rpc.com"
+POLYGON_RPC = os.getenv("POLYGON_RPC", "https://polygon-rpc.com")
+
+# HTTP Transport (pooled keep-alive sessions, one per host)
+HTTP_TIMEOUT_SEC = float(os.getenv("HTTP_TIMEOUT_SEC", "5.0"))  # Default per-request timeout
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "10"))  # Kept-alive connections per host
+HTTP_RETRIES = int(
+    os.getenv("HTTP_RETRIES", "2")
+)  # GET retries on connection errors / 502-504
 
 # Contracts
 USDC_ADDRESS = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
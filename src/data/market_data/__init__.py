@@ -2,17 +2,23 @@
 
 from .polymarket import (
     get_current_slug,
+    get_next_slug,
     get_window_times,
     format_window_range,
     get_token_ids,
+    get_market_info,
+    discover_markets,
     get_polymarket_momentum,
     get_outcome_prices,
 )
 from .binance import (
     get_window_start_price,
+    capture_window_start_price,
     get_window_start_price_range,
     get_current_spot_price,
+    get_spot_prices,
 )
+from .klines import get_klines, get_kline_array
 from .external import get_funding_bias, get_fear_greed
 from .indicators import (
     get_adx_from_binance,
@@ -24,20 +30,28 @@ from .price_validation import (
     get_recent_price_movements,
     calculate_volatility_score,
     detect_price_manipulation,
+    analyze_price_action,
     validate_price_movement_for_trade,
 )
 
 __all__ = [
     "get_current_slug",
+    "get_next_slug",
     "get_window_times",
     "format_window_range",
     "get_token_ids",
+    "get_market_info",
+    "discover_markets",
     "get_funding_bias",
     "get_fear_greed",
     "get_polymarket_momentum",
     "get_window_start_price",
+    "capture_window_start_price",
     "get_window_start_price_range",
     "get_current_spot_price",
+    "get_spot_prices",
+    "get_klines",
+    "get_kline_array",
     "get_adx_from_binance",
     "get_price_momentum",
     "get_order_flow_analysis",
@@ -46,5 +60,6 @@ __all__ = [
     "get_recent_price_movements",
     "calculate_volatility_score",
     "detect_price_manipulation",
+    "analyze_price_action",
     "validate_price_movement_for_trade",
 ]
@@ -1,9 +1,7 @@
 """Market analysis and signal divergence"""
 
-import requests
-from typing import Any
 from src.config.settings import BINANCE_FUNDING_MAP
-from .binance import _create_klines_dataframe
+from .klines import get_kline_array
 
 
 def get_order_flow_analysis(symbol: str) -> dict:
@@ -17,21 +15,15 @@ def get_order_flow_analysis(symbol: str) -> dict:
             "trade_intensity": 0.0,
         }
     try:
-        import pandas as pd
-
-        url = f"https://api.binance.com/api/v3/klines?symbol={pair}&interval=1m&limit=5"
-        df: Any = _create_klines_dataframe(requests.get(url, timeout=10).json())
-        if df is None:
+        klines = get_kline_array(symbol, 5)
+        if klines is None:
             return {
                 "buy_pressure": 0.5,
                 "volume_ratio": 0.5,
                 "large_trade_direction": "NEUTRAL",
                 "trade_intensity": 0.0,
             }
-        vol, t_buy = (
-            pd.to_numeric(df["volume"]).sum(),
-            pd.to_numeric(df["taker_buy_base"]).sum(),
-        )
+        vol, t_buy = klines["volume"].sum(), klines["taker_buy_base"].sum()
         ratio = t_buy / vol if vol > 0 else 0.5
         return {
             "buy_pressure": ratio,
@@ -41,7 +33,7 @@ def get_order_flow_analysis(symbol: str) -> dict:
             else "SELL"
             if ratio < 0.45
             else "NEUTRAL",
-            "trade_intensity": pd.to_numeric(df["trades"]).mean(),
+            "trade_intensity": klines["trades"].mean(),
         }
     except:
         return {
@@ -63,21 +55,16 @@ def get_cross_exchange_divergence(symbol: str, polymarket_p_up: float) -> dict:
             "opportunity": "NEUTRAL",
         }
     try:
-        import pandas as pd
-
-        url = (
-            f"https://api.binance.com/api/v3/klines?symbol={pair}&interval=1m&limit=15"
-        )
-        df: Any = _create_klines_dataframe(requests.get(url, timeout=10).json())
-        if df is None or len(df) < 10:
+        klines = get_kline_array(symbol, 15)
+        if klines is None or len(klines) < 10:
             return {
                 "binance_direction": "NEUTRAL",
                 "polymarket_direction": "NEUTRAL",
                 "divergence": 0.0,
                 "opportunity": "NEUTRAL",
             }
-        close, open_p = pd.to_numeric(df["close"]), pd.to_numeric(df["open"])
-        p_chg = ((close.iloc[-1] - open_p.iloc[0]) / open_p.iloc[0]) * 100.0
+        close, open_p = klines["close"], klines["open"]
+        p_chg = ((close[-1] - open_p[0]) / open_p[0]) * 100.0
 
         # More aggressive probability mapping: 1% spot move = 20% prob move
         b_p_up = 0.5 + (p_chg / 5.0)
@@ -102,7 +89,7 @@ def get_cross_exchange_divergence(symbol: str, polymarket_p_up: float) -> dict:
             else "BUY_DOWN"
             if div > 0.05
             else "NEUTRAL",
-            "binance_price": float(close.iloc[-1]),
+            "binance_price": float(close[-1]),
         }
 
     except:
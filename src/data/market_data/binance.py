@@ -1,65 +1,105 @@
 """Binance price data fetching"""
 
-import requests
-from typing import Dict, Tuple, Any
-from datetime import datetime
-from zoneinfo import ZoneInfo
-from src.config.settings import BINANCE_FUNDING_MAP, WINDOW_START_PRICE_BUFFER_PCT
+import json
+import time
+import threading
+import numpy as np
+from typing import Dict, Optional, Tuple, Any
+from src.config.settings import (
+    BINANCE_API_BASE,
+    BINANCE_FUNDING_MAP,
+    SPOT_PRICE_CACHE_SEC,
+    WINDOW_START_PRICE_BUFFER_PCT,
+)
+from .binance_stream import binance_stream
+from .binance_weight import binance_weight, PRIORITY_HIGH
+from .window_calendar import window_calendar
 
 # Cache for window start prices
 _window_start_prices: Dict[str, float] = {}
 
-def _create_klines_dataframe(klines: Any) -> Any:
-    """Create DataFrame from Binance klines data"""
-    try:
-        import pandas as pd
+# Batched REST spot prices for every configured symbol, shared within a tick
+_spot_prices: Dict[str, float] = {}
+_spot_prices_timestamp: float = 0.0
+_spot_prices_lock = threading.Lock()
+
+# Binance kline row layout (the trailing "ignore" column is dropped)
+KLINE_DTYPE = np.dtype(
+    [
+        ("open_time", "i8"),
+        ("open", "f8"),
+        ("high", "f8"),
+        ("low", "f8"),
+        ("close", "f8"),
+        ("volume", "f8"),
+        ("close_time", "i8"),
+        ("quote_volume", "f8"),
+        ("trades", "i8"),
+        ("taker_buy_base", "f8"),
+        ("taker_buy_quote", "f8"),
+    ]
+)
 
+def _parse_klines(klines: Any) -> Optional[np.ndarray]:
+    """Decode Binance klines JSON rows into a KLINE_DTYPE array in one pass"""
+    try:
         if klines is None:
             return None
-        cols: Any = [
-            "open_time",
-            "open",
-            "high",
-            "low",
-            "close",
-            "volume",
-            "close_time",
-            "quote_volume",
-            "trades",
-            "taker_buy_base",
-            "taker_buy_quote",
-            "ignore",
-        ]
-        return pd.DataFrame(klines, columns=cols)
+        return np.fromiter(
+            (tuple(row[:11]) for row in klines), dtype=KLINE_DTYPE, count=len(klines)
+        )
     except:
         return None
 
+def _cache_window_start_price(cache_key: str, price: float):
+    _window_start_prices[cache_key] = price
+    # Keep the current and previous window for every symbol, evicting oldest first
+    while len(_window_start_prices) > max(10, 2 * len(BINANCE_FUNDING_MAP)):
+        del _window_start_prices[next(iter(_window_start_prices))]
+
+def capture_window_start_price(symbol: str) -> bool:
+    """
+    Cache the window start price from the streamed open of the first 1m candle
+    of the window. Returns False until the stream has seen that candle.
+    """
+    window_start_ts = window_calendar.current().start_ts
+    cache_key = f"{symbol}_{window_start_ts}"
+    if cache_key in _window_start_prices:
+        return True
+    pair = BINANCE_FUNDING_MAP.get(symbol.upper())
+    if not pair:
+        return False
+    price = binance_stream.get_candle_open(pair, window_start_ts * 1000)
+    if price is None:
+        return False
+    _cache_window_start_price(cache_key, price)
+    return True
+
 def get_window_start_price(symbol: str) -> float:
     """Get the spot price at the ACTUAL START of the window"""
-    now_utc = datetime.now(tz=ZoneInfo("UTC"))
-    minute_slot = (now_utc.minute // 15) * 15
-    window_start_utc = now_utc.replace(minute=minute_slot, second=0, microsecond=0)
-    window_start_ts = int(window_start_utc.timestamp())
+    now = time.time()
+    window_start_ts = window_calendar.current(now).start_ts
     cache_key = f"{symbol}_{window_start_ts}"
     if cache_key in _window_start_prices:
         return _window_start_prices[cache_key]
     pair = BINANCE_FUNDING_MAP.get(symbol.upper())
     if not pair:
         return -1.0
-    lateness = (now_utc - window_start_utc).total_seconds()
+    if capture_window_start_price(symbol):
+        return _window_start_prices[cache_key]
+    lateness = now - window_start_ts
     try:
         if lateness < 10:
-            url = f"https://api.binance.com/api/v3/ticker/price?symbol={pair}"
-            price = float(requests.get(url, timeout=5).json()["price"])
+            price = get_current_spot_price(symbol)
+            if price <= 0:
+                return -1.0
         else:
-            url = f"https://api.binance.com/api/v3/klines?symbol={pair}&interval=1m&startTime={window_start_ts * 1000}&limit=1"
-            klines = requests.get(url, timeout=5).json()
+            url = f"{BINANCE_API_BASE}/api/v3/klines?symbol={pair}&interval=1m&startTime={window_start_ts * 1000}&limit=1"
+            klines = binance_weight.get(url, 1, PRIORITY_HIGH).json()
             if not klines:
                 return -1.0
             price = float(klines[0][1])
-        _window_start_prices[cache_key] = price
-        if len(_window_start_prices) > 10:
-            del _window_start_prices[min(_window_start_prices.keys())]
+        _cache_window_start_price(cache_key, price)
         return price
     except:
         return -1.0
@@ -71,12 +111,56 @@ def get_window_start_price_range(symbol: str) -> Tuple[float, float, float]:
     buffer = center_price * (WINDOW_START_PRICE_BUFFER_PCT / 100.0)
     return center_price, center_price - buffer, center_price + buffer
 
+def _get_batched_spot_prices() -> Dict[str, float]:
+    """
+    Fetch spot prices for every configured symbol with one multi-symbol
+    /ticker/price request, reused for SPOT_PRICE_CACHE_SEC.
+    """
+    global _spot_prices, _spot_prices_timestamp
+
+    with _spot_prices_lock:
+        if _spot_prices and time.time() - _spot_prices_timestamp < SPOT_PRICE_CACHE_SEC:
+            return _spot_prices
+        symbol_by_pair = {pair: symbol for symbol, pair in BINANCE_FUNDING_MAP.items()}
+        try:
+            response = binance_weight.get(
+                f"{BINANCE_API_BASE}/api/v3/ticker/price",
+                4,
+                PRIORITY_HIGH,
+                params={"symbols": json.dumps(list(symbol_by_pair), separators=(",", ":"))},
+            )
+            response.raise_for_status()
+            _spot_prices = {
+                symbol_by_pair[t["symbol"]]: float(t["price"])
+                for t in response.json()
+                if t.get("symbol") in symbol_by_pair
+            }
+            _spot_prices_timestamp = time.time()
+        except:
+            return {}
+        return _spot_prices
+
+def get_spot_prices() -> Dict[str, float]:
+    """
+    Get spot prices for every configured symbol. Streamed prices are used
+    while fresh; any others come from a single batched REST request.
+    """
+    prices: Dict[str, float] = {}
+    for symbol, pair in BINANCE_FUNDING_MAP.items():
+        streamed = binance_stream.get_spot_price(pair)
+        if streamed is not None:
+            prices[symbol] = streamed
+    if len(prices) < len(BINANCE_FUNDING_MAP):
+        batched = _get_batched_spot_prices()
+        for symbol, price in batched.items():
+            prices.setdefault(symbol, price)
+    return prices
+
 def get_current_spot_price(symbol: str) -> float:
     pair = BINANCE_FUNDING_MAP.get(symbol.upper())
     if not pair:
         return -1.0
-    try:
-        url = f"https://api.binance.com/api/v3/ticker/price?symbol={pair}"
-        return float(requests.get(url, timeout=5).json()["price"])
-    except:
-        return -1.0
+    streamed = binance_stream.get_spot_price(pair)
+    if streamed is not None:
+        return streamed
+    return _get_batched_spot_prices().get(symbol.upper(), -1.0)
@@ -0,0 +1,288 @@
+"""Binance WebSocket kline/aggTrade streaming"""
+
+import json
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple, Union
+import websockets
+from src.config.settings import (
+    ADX_ENABLED,
+    ADX_INTERVAL,
+    ADX_PERIOD,
+    BINANCE_API_BASE,
+    BINANCE_FUNDING_MAP,
+    BINANCE_WSS_HOST,
+    BINANCE_STREAM_HISTORY,
+    BINANCE_STREAM_STALE_SEC,
+    ENABLE_KLINE_STORE,
+)
+from src.utils.logger import log, log_error
+from .streaming_indicators import create_indicator_set
+from .binance_weight import binance_weight, klines_weight
+
+INTERVAL_UNIT_MS = {"m": 60_000, "h": 3_600_000, "d": 86_400_000}
+
+
+def _interval_ms(interval: str) -> int:
+    """Convert a Binance interval string (1m, 15m, 1h...) to milliseconds"""
+    return int(interval[:-1]) * INTERVAL_UNIT_MS.get(interval[-1], 60_000)
+
+
+class BinanceStreamManager:
+    """
+    Streams Binance 1m klines and aggregated trades for every pair in
+    BINANCE_FUNDING_MAP (plus ADX_INTERVAL klines when ADX is enabled).
+    Keeps a rolling candle history in REST kline row format, the last trade
+    price and incrementally updated indicators, so market_data readers can
+    serve spot price, momentum, VWM, order flow and ADX from memory.
+    """
+
+    def __init__(self):
+        self.wss_base_url = BINANCE_WSS_HOST.rstrip("/")
+        self.pairs: List[str] = sorted(set(BINANCE_FUNDING_MAP.values()))
+        self.history_sizes: Dict[str, int] = {"1m": BINANCE_STREAM_HISTORY}
+        if ADX_ENABLED and ADX_INTERVAL != "1m":
+            self.history_sizes[ADX_INTERVAL] = ADX_PERIOD * 3 + 10
+        # (pair, interval) -> candles, newest (live) last
+        self.candles: Dict[Tuple[str, str], Deque[list]] = {
+            (pair, interval): deque(maxlen=size)
+            for pair in self.pairs
+            for interval, size in self.history_sizes.items()
+        }
+        self.indicators = {pair: create_indicator_set() for pair in self.pairs}
+        self.trade_prices: Dict[str, float] = {}  # pair -> last aggTrade price
+        self.last_update: Dict[Tuple[str, str], float] = {}  # local receive time
+        self._seeded: Dict[Tuple[str, str], bool] = {key: False for key in self.candles}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def start(self):
+        """Start the Binance stream in a background thread"""
+        if self._running or not self.pairs:
+            return
+
+        self._running = True
+        self._thread = threading.Thread(target=self._run_event_loop, daemon=True)
+        self._thread.start()
+        log(f"🚀 Binance stream started for {len(self.pairs)} pairs")
+
+    def stop(self):
+        """Stop the Binance stream"""
+        self._running = False
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def _run_event_loop(self):
+        """Internal method to run the asyncio event loop"""
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._stream_loop())
+        except Exception as e:
+            if self._running:
+                log_error(f"Binance stream event loop crashed: {e}")
+
+    async def _stream_loop(self):
+        """Handles the combined kline/aggTrade stream connection"""
+        streams = "/".join(
+            f"{pair.lower()}@{name}"
+            for pair in self.pairs
+            for name in [f"kline_{i}" for i in self.history_sizes] + ["aggTrade"]
+        )
+        url = f"{self.wss_base_url}/stream?streams={streams}"
+        while self._running:
+            try:
+                async with websockets.connect(url, ping_interval=20) as ws:
+                    log(f"✅ Binance stream connected ({len(self.pairs)} pairs)")
+                    # Messages queue up in the socket while history is seeded
+                    for pair, interval in self.candles:
+                        await self._loop.run_in_executor(
+                            None, self._seed_history, pair, interval
+                        )
+                    async for message in ws:
+                        if not self._running:
+                            break
+                        self._handle_message(message)
+            except Exception as e:
+                if self._running:
+                    log_error(
+                        f"Binance stream lost: {e}. Reconnecting in 5s...",
+                        include_traceback=False,
+                    )
+                    with self._lock:
+                        for key in self._seeded:
+                            self._seeded[key] = False
+                    await asyncio.sleep(5)
+
+    def _seed_history(self, pair: str, interval: str = "1m"):
+        """Load the rolling candle history (disk store, else REST) before applying pushes"""
+        try:
+            klines = None
+            if interval == "1m" and ENABLE_KLINE_STORE:
+                from .kline_store import kline_store
+
+                klines = kline_store.load_recent(pair, self.history_sizes[interval])
+            if klines is None:
+                url = f"{BINANCE_API_BASE}/api/v3/klines?symbol={pair}&interval={interval}&limit={self.history_sizes[interval]}"
+                response = binance_weight.get(
+                    url, klines_weight(self.history_sizes[interval]), timeout=10
+                )
+                response.raise_for_status()
+                klines = response.json()
+            if not isinstance(klines, list):
+                return
+            with self._lock:
+                history = self.candles[(pair, interval)]
+                pushed = [row for row in history if klines and row[0] > klines[-1][0]]
+                history.clear()
+                history.extend(klines)
+                history.extend(pushed)
+                rows = list(history)
+                for indicator in self.indicators[pair].values():
+                    if indicator.interval == interval:
+                        indicator.load(rows)
+                self._seeded[(pair, interval)] = True
+        except Exception as e:
+            log_error(
+                f"[{pair}] Binance {interval} history seed failed: {e}",
+                include_traceback=False,
+            )
+
+    def _handle_message(self, message: Union[str, bytes]):
+        """Process a combined-stream message"""
+        try:
+            payload = json.loads(message)
+            data = payload.get("data") if isinstance(payload, dict) else None
+            if not isinstance(data, dict):
+                return
+            event_type = data.get("e")
+            if event_type == "kline":
+                self._apply_kline(data.get("s", ""), data.get("k") or {})
+            elif event_type == "aggTrade":
+                pair = data.get("s", "")
+                if pair in self.indicators and data.get("p"):
+                    self.trade_prices[pair] = float(data["p"])
+                    self.last_update[(pair, "trade")] = time.time()
+        except Exception as e:
+            log_error(f"Error handling Binance stream message: {e}")
+
+    def _apply_kline(self, pair: str, k: dict):
+        """Update or append the pushed candle in REST row format"""
+        interval = k.get("i", "1m")
+        key = (pair, interval)
+        if key not in self.candles or "t" not in k:
+            return
+        row = [
+            int(k["t"]),
+            k.get("o"),
+            k.get("h"),
+            k.get("l"),
+            k.get("c"),
+            k.get("v"),
+            int(k.get("T", 0)),
+            k.get("q"),
+            int(k.get("n", 0)),
+            k.get("V"),
+            k.get("Q"),
+            "0",
+        ]
+        gap = False
+        with self._lock:
+            history = self.candles[key]
+            if history and history[-1][0] == row[0]:
+                history[-1] = row
+            elif not history or row[0] > history[-1][0]:
+                if history and row[0] - history[-1][0] > _interval_ms(interval):
+                    # Missed candles (e.g. dropped pushes) - history is no longer contiguous
+                    gap = self._seeded[key]
+                    self._seeded[key] = False
+                history.append(row)
+            else:
+                return
+            if self._seeded[key]:
+                for indicator in self.indicators[pair].values():
+                    if indicator.interval == interval:
+                        indicator.update(row)
+            self.last_update[key] = time.time()
+        if gap and self._loop:
+            log(f"⚠️  [{pair}] Binance {interval} kline gap detected. Re-seeding history...")
+            self._loop.run_in_executor(None, self._seed_history, pair, interval)
+        elif k.get("x") and interval == "1m" and ENABLE_KLINE_STORE:
+            # Final push for the candle - persist it
+            from .kline_store import kline_store
+
+            kline_store.append(pair, [row])
+
+    def is_fresh(self, pair: str, interval: str = "1m") -> bool:
+        """True if the pair's klines were pushed within BINANCE_STREAM_STALE_SEC"""
+        last = self.last_update.get((pair, interval))
+        return last is not None and time.time() - last < BINANCE_STREAM_STALE_SEC
+
+    def _is_warm(self, pair: str, interval: str) -> bool:
+        return (
+            self._running
+            and self._seeded.get((pair, interval), False)
+            and self.is_fresh(pair, interval)
+        )
+
+    def get_klines(self, pair: str, limit: int, interval: str = "1m") -> Optional[list]:
+        """Get the most recent `limit` klines from memory, or None if not warm"""
+        if not self._is_warm(pair, interval):
+            return None
+        with self._lock:
+            history = self.candles[(pair, interval)]
+            if len(history) < limit:
+                return None
+            return list(history)[-limit:]
+
+    def get_candle_open(self, pair: str, open_time_ms: int) -> Optional[float]:
+        """Get the open of the streamed 1m candle starting at open_time_ms, if seen"""
+        if not self._is_warm(pair, "1m"):
+            return None
+        with self._lock:
+            for row in reversed(self.candles[(pair, "1m")]):
+                if row[0] == open_time_ms:
+                    return float(row[1])
+                if row[0] < open_time_ms:
+                    break
+        return None
+
+    def get_indicator(self, pair: str, name: str, length: int) -> Optional[float]:
+        """
+        Get a streamed indicator value ("rsi", "adx", "vwap") computed over the
+        last `length` klines, or None if the stream is not warm or the indicator
+        tracks a different window.
+        """
+        indicator = self.indicators.get(pair, {}).get(name)
+        if indicator is None or indicator.length != length:
+            return None
+        if not self._is_warm(pair, indicator.interval):
+            return None
+        with self._lock:
+            if not indicator.ready:
+                return None
+            return indicator.value()
+
+    def get_spot_price(self, pair: str) -> Optional[float]:
+        """Get the latest streamed spot price, or None if the stream is stale"""
+        if not self._running:
+            return None
+        last_trade = self.last_update.get((pair, "trade"))
+        price = self.trade_prices.get(pair)
+        if price and time.time() - last_trade < BINANCE_STREAM_STALE_SEC:
+            return price
+        if not self.is_fresh(pair):
+            return None
+        with self._lock:
+            history = self.candles.get((pair, "1m"))
+            if history:
+                return float(history[-1][4])
+        return None
+
+
+# Singleton instance
+binance_stream = BinanceStreamManager()
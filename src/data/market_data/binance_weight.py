@@ -0,0 +1,134 @@
+"""Binance REST request-weight budgeting"""
+
+import time
+import threading
+from typing import Dict
+import requests
+from src.config.settings import BINANCE_WEIGHT_LIMIT
+from src.utils.http import http_client
+from src.utils.logger import log
+
+PRIORITY_HIGH = "high"  # Spot price / window start price
+PRIORITY_NORMAL = "normal"  # Signal klines (momentum, order flow, VWM, divergence)
+PRIORITY_LOW = "low"  # ADX, volatility/manipulation checks, history backfill
+
+# Share of the per-minute weight limit each priority may consume, so low
+# priority fetches are deferred well before spot price lookups are at risk
+PRIORITY_BUDGET = {PRIORITY_HIGH: 1.0, PRIORITY_NORMAL: 0.85, PRIORITY_LOW: 0.6}
+
+
+class BinanceThrottled(Exception):
+    """Raised instead of sending a request that would exceed its weight budget"""
+
+
+def klines_weight(limit: int) -> int:
+    """Request weight of /api/v3/klines for a given limit"""
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+class BinanceWeightScheduler:
+    """
+    Tracks Binance's per-minute IP request weight from the
+    X-MBX-USED-WEIGHT-1M response header plus the weight reserved by requests
+    still in flight, and admits each request only if it fits its priority's
+    share of BINANCE_WEIGHT_LIMIT. A 429/418 response blocks every request
+    until its Retry-After has passed. Deferred requests raise BinanceThrottled,
+    which callers treat like any other fetch failure, and are counted per
+    priority.
+    """
+
+    def __init__(self, limit: int = BINANCE_WEIGHT_LIMIT):
+        self.limit = limit
+        self._minute = int(time.time() // 60)
+        self._used = 0
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self._throttled: Dict[str, int] = {p: 0 for p in PRIORITY_BUDGET}
+        self._rate_limited = 0
+        self._last_logged_minute = -1
+
+    def _roll(self, now: float):
+        minute = int(now // 60)
+        if minute != self._minute:
+            self._minute = minute
+            self._used = 0
+
+    def acquire(self, weight: int, priority: str = PRIORITY_NORMAL) -> bool:
+        """Reserve weight for a request; False if it must be deferred"""
+        now = time.time()
+        with self._lock:
+            self._roll(now)
+            budget = self.limit * PRIORITY_BUDGET.get(priority, PRIORITY_BUDGET[PRIORITY_LOW])
+            if now < self._blocked_until or self._used + weight > budget:
+                self._throttled[priority] = self._throttled.get(priority, 0) + 1
+                should_log = self._last_logged_minute != self._minute
+                self._last_logged_minute = self._minute
+            else:
+                self._used += weight
+                return True
+        if should_log:
+            log(
+                f"⏳ Binance weight budget reached ({self._used}/{self.limit}) - deferring {priority} priority requests"
+            )
+        return False
+
+    def observe(self, response: requests.Response):
+        """Sync the used weight from response headers and honour 429/418 backoff"""
+        now = time.time()
+        headers = getattr(response, "headers", None) or {}
+        with self._lock:
+            self._roll(now)
+            used = headers.get("X-MBX-USED-WEIGHT-1M") or headers.get("X-MBX-USED-WEIGHT")
+            if used is not None:
+                try:
+                    self._used = max(self._used, int(used))
+                except ValueError:
+                    pass
+            if response.status_code in (418, 429):
+                self._rate_limited += 1
+                try:
+                    retry_after = float(headers.get("Retry-After", 60))
+                except ValueError:
+                    retry_after = 60.0
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+        if response.status_code in (418, 429):
+            log(
+                f"🚫 Binance rate limit hit (HTTP {response.status_code}) - pausing REST requests for {retry_after:.0f}s"
+            )
+
+    def get(
+        self, url: str, weight: int, priority: str = PRIORITY_NORMAL, **kwargs
+    ) -> requests.Response:
+        """GET a Binance REST endpoint within the weight budget"""
+        if not self.acquire(weight, priority):
+            raise BinanceThrottled(f"{priority} priority request deferred: {url}")
+        response = http_client.get(url, **kwargs)
+        self.observe(response)
+        return response
+
+    def get_stats(self) -> Dict[str, int]:
+        """Used weight this minute, limit, 429/418 count and deferrals per priority"""
+        with self._lock:
+            self._roll(time.time())
+            stats = {"used_weight": self._used, "limit": self.limit}
+            stats["rate_limited"] = self._rate_limited
+            for priority, count in self._throttled.items():
+                stats[f"throttled_{priority}"] = count
+            return stats
+
+    def format_stats(self) -> str:
+        s = self.get_stats()
+        return (
+            f"{s['used_weight']}/{s['limit']} weight, {s['rate_limited']} rate limited, "
+            f"deferred high/normal/low {s['throttled_high']}/{s['throttled_normal']}/{s['throttled_low']}"
+        )
+
+
+# Singleton instance
+binance_weight = BinanceWeightScheduler()
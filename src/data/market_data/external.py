@@ -1,7 +1,27 @@
 """External market sentiment and bias data"""
 
-import requests
-from src.config.settings import BINANCE_FUNDING_MAP
+from src.config.settings import (
+    BINANCE_FAPI_BASE,
+    BINANCE_FUNDING_MAP,
+    FEAR_GREED_URL,
+    FUNDING_BIAS_CACHE_TTL_SEC,
+    FEAR_GREED_CACHE_TTL_SEC,
+)
+from src.utils.http import http_client
+from src.utils.cache import TTLCache
+
+# Both values move on hour-scale intervals - serve cached values, refresh in the background
+funding_bias_cache = TTLCache("Funding bias", FUNDING_BIAS_CACHE_TTL_SEC)
+fear_greed_cache = TTLCache("Fear & greed", FEAR_GREED_CACHE_TTL_SEC)
+
+def _fetch_funding_bias(pair: str) -> float:
+    url = f"{BINANCE_FAPI_BASE}/fapi/v1/premiumIndex?symbol={pair}"
+    return float(http_client.get(url).json()["lastFundingRate"]) * 1000.0
+
+def _fetch_fear_greed() -> int:
+    return int(
+        http_client.get(FEAR_GREED_URL).json()["data"][0]["value"]
+    )
 
 def get_funding_bias(symbol: str) -> float:
     """Get funding rate bias from Binance futures"""
@@ -9,18 +29,13 @@ def get_funding_bias(symbol: str) -> float:
     if not pair:
         return 0.0
     try:
-        url = f"https://fapi.binance.com/fapi/v1/premiumIndex?symbol={pair}"
-        return float(requests.get(url, timeout=5).json()["lastFundingRate"]) * 1000.0
+        return funding_bias_cache.get(pair, lambda: _fetch_funding_bias(pair))
     except:
         return 0.0
 
 def get_fear_greed() -> int:
     """Get Fear & Greed Index"""
     try:
-        return int(
-            requests.get("https://api.alternative.me/fng/", timeout=5).json()["data"][
-                0
-            ]["value"]
-        )
+        return fear_greed_cache.get("fng", _fetch_fear_greed)
     except:
         return 50
@@ -1,32 +1,27 @@
 """Technical indicators and momentum calculations"""
 
-import requests
-from typing import Any
 from src.config.settings import BINANCE_FUNDING_MAP, ADX_INTERVAL, ADX_PERIOD
-from .binance import _create_klines_dataframe
+from .klines import get_kline_array
+from .binance_weight import PRIORITY_LOW
+from .binance_stream import binance_stream
+from .streaming_indicators import compute_adx, compute_rsi
 
 
 def get_adx_from_binance(symbol: str) -> float:
     """Calculate ADX for symbol/USDT pair"""
     try:
-        import pandas as pd
-        from ta.trend import ADXIndicator
-
         pair = BINANCE_FUNDING_MAP.get(symbol.upper())
         if not pair:
             return -1.0
-        url = f"https://api.binance.com/api/v3/klines?symbol={pair}&interval={ADX_INTERVAL}&limit={ADX_PERIOD * 3 + 10}"
-        klines = requests.get(url, timeout=10).json()
-        df: Any = _create_klines_dataframe(klines)
-        if df is None:
-            return -1.0
-        adx_indicator = ADXIndicator(
-            high=pd.to_numeric(df["high"]),
-            low=pd.to_numeric(df["low"]),
-            close=pd.to_numeric(df["close"]),
-            window=ADX_PERIOD,
+        streamed = binance_stream.get_indicator(pair, "adx", ADX_PERIOD * 3 + 10)
+        if streamed is not None:
+            return streamed
+        klines = get_kline_array(
+            symbol, ADX_PERIOD * 3 + 10, interval=ADX_INTERVAL, priority=PRIORITY_LOW
         )
-        return float(adx_indicator.adx().iloc[-1])
+        if klines is None:
+            return -1.0
+        return float(compute_adx(klines, window=ADX_PERIOD))
     except:
         return -1.0
 
@@ -34,9 +29,6 @@ def get_adx_from_binance(symbol: str) -> float:
 def get_price_momentum(symbol: str, lookback_minutes: int = 15) -> dict:
     """Calculate price momentum from Binance spot data"""
     try:
-        import pandas as pd
-        from ta.momentum import RSIIndicator
-
         pair = BINANCE_FUNDING_MAP.get(symbol.upper())
         if not pair:
             return {
@@ -46,10 +38,9 @@ def get_price_momentum(symbol: str, lookback_minutes: int = 15) -> dict:
                 "direction": "NEUTRAL",
                 "strength": 0.0,
             }
-        url = f"https://api.binance.com/api/v3/klines?symbol={pair}&interval=1m&limit={max(30, lookback_minutes + 20)}"
-        klines = requests.get(url, timeout=10).json()
-        df: Any = _create_klines_dataframe(klines)
-        if df is None or len(df) < lookback_minutes:
+        window = max(30, lookback_minutes + 20)
+        klines = get_kline_array(symbol, window)
+        if klines is None or len(klines) < lookback_minutes:
             return {
                 "velocity": 0.0,
                 "acceleration": 0.0,
@@ -57,16 +48,14 @@ def get_price_momentum(symbol: str, lookback_minutes: int = 15) -> dict:
                 "direction": "NEUTRAL",
                 "strength": 0.0,
             }
-        close: Any = pd.to_numeric(df["close"])
+        close = klines["close"]
         vel = (
-            (close.iloc[-1] - close.iloc[-lookback_minutes])
-            / close.iloc[-lookback_minutes]
+            (close[-1] - close[-lookback_minutes]) / close[-lookback_minutes]
         ) * 100.0
-        rsi = (
-            float(RSIIndicator(close=close, window=14).rsi().iloc[-1])
-            if len(close) >= 15
-            else 50.0
-        )
+        # RSI is kept up to date by the stream; compute it only on REST fallback
+        rsi = binance_stream.get_indicator(pair, "rsi", window)
+        if rsi is None:
+            rsi = float(compute_rsi(klines, window=14)) if len(close) >= 15 else 50.0
         return {
             "velocity": vel,
             "acceleration": 0.0,
@@ -93,27 +82,20 @@ def get_volume_weighted_momentum(symbol: str) -> dict:
     if not pair:
         return {"vwap_distance": 0.0, "volume_trend": "STABLE", "momentum_quality": 0.0}
     try:
-        import pandas as pd
-
-        url = (
-            f"https://api.binance.com/api/v3/klines?symbol={pair}&interval=1m&limit=15"
-        )
-        df: Any = _create_klines_dataframe(requests.get(url, timeout=10).json())
-        if df is None:
+        klines = get_kline_array(symbol, 15)
+        if klines is None or len(klines) == 0:
             return {
                 "vwap_distance": 0.0,
                 "volume_trend": "STABLE",
                 "momentum_quality": 0.0,
             }
-        c, h, l, v = (
-            pd.to_numeric(df["close"]),
-            pd.to_numeric(df["high"]),
-            pd.to_numeric(df["low"]),
-            pd.to_numeric(df["volume"]),
-        )
-        tp = (h + l + c) / 3
-        vwap = (tp * v).sum() / v.sum() if v.sum() > 0 else c.iloc[-1]
-        vwap_dist = ((c.iloc[-1] - vwap) / vwap) * 100.0
+        c = klines["close"]
+        vwap = binance_stream.get_indicator(pair, "vwap", 15)
+        if vwap is None:
+            h, l, v = klines["high"], klines["low"], klines["volume"]
+            tp = (h + l + c) / 3
+            vwap = (tp * v).sum() / v.sum() if v.sum() > 0 else c[-1]
+        vwap_dist = ((c[-1] - vwap) / vwap) * 100.0
 
         # Calculate momentum quality based on VWAP distance and price trend
         # If price is above VWAP and rising, quality is high.
@@ -0,0 +1,173 @@
+"""Persistent on-disk 1m kline history"""
+
+import os
+import time
+import threading
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from src.config.settings import (
+    BINANCE_API_BASE,
+    BINANCE_FUNDING_MAP,
+    BINANCE_STREAM_HISTORY,
+    KLINE_STORE_DIR,
+)
+from src.utils.logger import log, log_error
+from .binance import KLINE_DTYPE, _parse_klines
+from .binance_weight import binance_weight, klines_weight, PRIORITY_LOW
+
+KLINE_MS = 60_000
+BACKFILL_PAGE = 1000  # Binance /klines maximum per request
+
+
+class KlineStore:
+    """
+    Append-only file of closed 1m candles per pair, stored as raw KLINE_DTYPE
+    records sorted by open time. Reads memory-map the file, so analytics and
+    backtests can slice months of candles without loading them or touching
+    the network. Missing candles are backfilled from REST starting at the
+    last stored open time, so a restart only fetches the gap.
+    """
+
+    def __init__(self, base_dir: str = KLINE_STORE_DIR):
+        self.base_dir = base_dir
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        # pair -> (file size, memmap) so reads only remap after appends
+        self._maps: Dict[str, Tuple[int, np.ndarray]] = {}
+
+    def path(self, pair: str) -> str:
+        return os.path.join(self.base_dir, f"{pair}_1m.bin")
+
+    def _lock(self, pair: str) -> threading.Lock:
+        with self._locks_guard:
+            lock = self._locks.get(pair)
+            if lock is None:
+                lock = threading.Lock()
+                self._locks[pair] = lock
+            return lock
+
+    def _map(self, pair: str) -> np.ndarray:
+        """Memory-map the pair's file (empty array if missing)"""
+        path = self.path(pair)
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        count = size // KLINE_DTYPE.itemsize
+        if count == 0:
+            return np.empty(0, dtype=KLINE_DTYPE)
+        cached = self._maps.get(pair)
+        if cached is None or cached[0] != size:
+            # Ignore a partially written trailing record from an interrupted append
+            mapped = np.memmap(path, dtype=KLINE_DTYPE, mode="r", shape=(count,))
+            cached = (size, mapped)
+            self._maps[pair] = cached
+        return cached[1]
+
+    def last_open_time(self, pair: str) -> Optional[int]:
+        data = self._map(pair)
+        return int(data["open_time"][-1]) if len(data) else None
+
+    def read(
+        self, pair: str, start_ms: Optional[int] = None, end_ms: Optional[int] = None
+    ) -> np.ndarray:
+        """Get stored candles with start_ms <= open_time < end_ms (read-only view)"""
+        data = self._map(pair)
+        open_times = data["open_time"]
+        lo = 0 if start_ms is None else int(np.searchsorted(open_times, start_ms, "left"))
+        hi = len(data) if end_ms is None else int(np.searchsorted(open_times, end_ms, "left"))
+        return data[lo:hi]
+
+    def tail(self, pair: str, limit: int) -> np.ndarray:
+        """Get the most recent `limit` stored candles"""
+        data = self._map(pair)
+        return data[-limit:] if limit > 0 else data[:0]
+
+    def append(self, pair: str, klines) -> int:
+        """Append closed candles newer than the last stored one; returns count written"""
+        records = klines if isinstance(klines, np.ndarray) else _parse_klines(klines)
+        if records is None or len(records) == 0:
+            return 0
+        now_ms = int(time.time() * 1000)
+        with self._lock(pair):
+            last = self.last_open_time(pair)
+            keep = records["close_time"] < now_ms
+            if last is not None:
+                keep &= records["open_time"] > last
+            new = np.ascontiguousarray(records[keep], dtype=KLINE_DTYPE)
+            if len(new) == 0:
+                return 0
+            os.makedirs(self.base_dir, exist_ok=True)
+            path = self.path(pair)
+            # Drop any torn record left by an interrupted write before appending
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            whole = size - size % KLINE_DTYPE.itemsize
+            with open(path, "ab") as f:
+                if whole != size:
+                    f.truncate(whole)
+                f.write(new.tobytes())
+            return len(new)
+
+    def backfill(self, pair: str, min_candles: int = BINANCE_STREAM_HISTORY) -> List[list]:
+        """
+        Fetch only the candles missing since the last stored one (or the last
+        `min_candles` on an empty store) and append the closed ones.
+
+        Returns every fetched row, including the in-progress candle, so callers
+        can seed live state without a second request.
+        """
+        now_ms = int(time.time() * 1000)
+        last = self.last_open_time(pair)
+        start = last + KLINE_MS if last is not None else now_ms - min_candles * KLINE_MS
+        fetched: List[list] = []
+        try:
+            while start <= now_ms:
+                url = f"{BINANCE_API_BASE}/api/v3/klines?symbol={pair}&interval=1m&startTime={start}&limit={BACKFILL_PAGE}"
+                response = binance_weight.get(
+                    url, klines_weight(BACKFILL_PAGE), PRIORITY_LOW, timeout=10
+                )
+                response.raise_for_status()
+                page = response.json()
+                if not isinstance(page, list) or not page:
+                    break
+                self.append(pair, page)
+                fetched.extend(page)
+                if len(page) < BACKFILL_PAGE:
+                    break
+                start = int(page[-1][0]) + KLINE_MS
+            if len(fetched) > BACKFILL_PAGE:
+                log(f"📦 [{pair}] Backfilled {len(fetched)} candles into kline store")
+        except Exception as e:
+            log_error(f"[{pair}] Kline store backfill failed: {e}", include_traceback=False)
+        return fetched
+
+    def load_recent(self, pair: str, limit: int) -> Optional[List[list]]:
+        """
+        Get the last `limit` candles (stored closed candles plus the live one)
+        as kline rows, backfilling the gap first. Returns None unless the
+        result is a contiguous window ending at the current candle.
+        """
+        fetched = self.backfill(pair, min_candles=limit)
+        closed = self.tail(pair, limit)
+        last_closed = int(closed["open_time"][-1]) if len(closed) else None
+        rows = [list(record.tolist()) + ["0"] for record in closed]
+        rows.extend(
+            row for row in fetched if last_closed is None or int(row[0]) > last_closed
+        )
+        rows = rows[-limit:]
+        if len(rows) < limit:
+            return None
+        current_ms = int(time.time() * 1000) // KLINE_MS * KLINE_MS
+        expected = current_ms - (limit - 1) * KLINE_MS
+        if int(rows[0][0]) != expected or int(rows[-1][0]) != current_ms:
+            return None
+        return rows
+
+
+def load_klines(
+    symbol: str, start_ms: Optional[int] = None, end_ms: Optional[int] = None
+) -> np.ndarray:
+    """Read stored 1m candles for analytics/backtests (no network access)"""
+    pair = BINANCE_FUNDING_MAP.get(symbol.upper(), symbol.upper())
+    return kline_store.read(pair, start_ms, end_ms)
+
+
+# Singleton instance
+kline_store = KlineStore()
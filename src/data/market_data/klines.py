@@ -0,0 +1,108 @@
+"""Shared Binance kline snapshots"""
+
+import time
+import threading
+import numpy as np
+from typing import Dict, Optional, Tuple
+from src.config.settings import (
+    BINANCE_API_BASE,
+    BINANCE_FUNDING_MAP,
+    KLINE_SNAPSHOT_LIMIT,
+    KLINE_SNAPSHOT_TTL_SEC,
+)
+from .binance import _parse_klines
+from .binance_weight import binance_weight, klines_weight, PRIORITY_NORMAL
+from .binance_stream import binance_stream
+
+# (pair, interval) -> (fetched_at, fetched_limit, klines, parsed klines)
+_snapshots: Dict[Tuple[str, str], Tuple[float, int, list, Optional[np.ndarray]]] = {}
+_snapshot_locks: Dict[Tuple[str, str], threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _get_snapshot_lock(key: Tuple[str, str]) -> threading.Lock:
+    """Get (or create) the fetch lock for a pair/interval snapshot"""
+    with _locks_guard:
+        lock = _snapshot_locks.get(key)
+        if lock is None:
+            lock = threading.Lock()
+            _snapshot_locks[key] = lock
+        return lock
+
+
+def _get_snapshot(
+    pair: str, limit: int, interval: str, priority: str = PRIORITY_NORMAL
+) -> Tuple[float, int, list, Optional[np.ndarray]]:
+    """Get the shared REST snapshot for a pair, refetching if stale or too short"""
+    key = (pair, interval)
+    with _get_snapshot_lock(key):
+        now = time.time()
+        cached = _snapshots.get(key)
+        if (
+            cached is None
+            or now - cached[0] >= KLINE_SNAPSHOT_TTL_SEC
+            or limit > cached[1]
+        ):
+            fetch_limit = max(limit, KLINE_SNAPSHOT_LIMIT) if interval == "1m" else limit
+            url = f"{BINANCE_API_BASE}/api/v3/klines?symbol={pair}&interval={interval}&limit={fetch_limit}"
+            response = binance_weight.get(
+                url, klines_weight(fetch_limit), priority, timeout=10
+            )
+            response.raise_for_status()
+            klines = response.json()
+            if not isinstance(klines, list):
+                klines = None
+            cached = (now, fetch_limit, klines, _parse_klines(klines))
+            _snapshots[key] = cached
+    return cached
+
+
+def get_klines(
+    symbol: str, limit: int, interval: str = "1m", priority: str = PRIORITY_NORMAL
+) -> Optional[list]:
+    """
+    Get the most recent `limit` klines for a symbol from a shared snapshot.
+
+    The first caller in an evaluation tick fetches the largest window any
+    1m signal needs (KLINE_SNAPSHOT_LIMIT); every other caller within
+    KLINE_SNAPSHOT_TTL_SEC gets a slice of the same response. Slices match
+    what a direct `/klines?limit=N` call would return (newest candle last).
+
+    Streamed intervals are served straight from the Binance stream while it
+    is warm; REST snapshots are only used as the fallback, admitted by the
+    Binance weight scheduler at the given priority.
+
+    Raises on HTTP errors (or BinanceThrottled) so callers keep their
+    existing neutral fallbacks.
+    """
+    pair = BINANCE_FUNDING_MAP.get(symbol.upper())
+    if not pair:
+        return None
+
+    streamed = binance_stream.get_klines(pair, limit, interval)
+    if streamed is not None:
+        return streamed
+
+    klines = _get_snapshot(pair, limit, interval, priority)[2]
+    return klines[-limit:] if klines is not None else None
+
+
+def get_kline_array(
+    symbol: str, limit: int, interval: str = "1m", priority: str = PRIORITY_NORMAL
+) -> Optional[np.ndarray]:
+    """
+    Same window as get_klines, decoded into a KLINE_DTYPE structured array.
+
+    REST snapshots are parsed once when fetched and sliced without copying;
+    streamed windows are parsed on demand.
+    """
+    pair = BINANCE_FUNDING_MAP.get(symbol.upper())
+    if not pair:
+        return None
+
+    streamed = binance_stream.get_klines(pair, limit, interval)
+    if streamed is not None:
+        return _parse_klines(streamed)
+
+    parsed = _get_snapshot(pair, limit, interval, priority)[3]
+    return parsed[-limit:] if parsed is not None else None
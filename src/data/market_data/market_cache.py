@@ -0,0 +1,310 @@
+"""Per-slug Gamma market metadata cache"""
+
+import json
+import time
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from src.config.settings import (
+    GAMMA_API_BASE,
+    MARKET_PRICE_CACHE_TTL_SEC,
+    MARKET_RESOLUTION_CACHE_TTL_SEC,
+    MARKET_CACHE_RETENTION_SEC,
+    WS_STALE_WARN_SEC,
+)
+from src.utils.http import http_client
+from src.utils.websocket_manager import ws_manager
+
+WINDOW_SEC = 900
+FOREVER = float("inf")
+
+# Fields that never change for a slug once listed
+STATIC_FIELDS = ("token_ids", "condition_id", "neg_risk")
+# Fields that move with the market
+PRICE_FIELDS = ("outcome_prices", "best_bid", "best_ask")
+
+
+class GammaMarketError(Exception):
+    """A Gamma market lookup returned a non-200 response"""
+
+    def __init__(self, slug: str, status_code: int):
+        super().__init__(f"HTTP {status_code} for {slug}")
+        self.slug = slug
+        self.status_code = status_code
+
+
+def _parse_list(value: Any) -> Optional[list]:
+    """Parse Gamma's JSON-encoded (or comma-separated) list fields"""
+    if isinstance(value, list):
+        return value
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = json.loads(value)
+        if isinstance(parsed, list):
+            return parsed
+    except:
+        pass
+    return [x.strip().strip('"') for x in value.strip("[]").split(",")]
+
+
+def _parse_float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _window_end(slug: str) -> Optional[float]:
+    """Window end timestamp encoded in a <symbol>-updown-15m-<start ts> slug"""
+    ts = slug.rsplit("-", 1)[-1]
+    return int(ts) + WINDOW_SEC if ts.isdigit() else None
+
+
+def parse_market(m: dict) -> Dict[str, Any]:
+    """Extract the cached fields from a Gamma market payload"""
+    clob_ids = _parse_list(m.get("clobTokenIds") or m.get("clob_token_ids"))
+    token_ids = (clob_ids[0], clob_ids[1]) if clob_ids and len(clob_ids) >= 2 else None
+
+    outcome_prices = None
+    raw_prices = _parse_list(m.get("outcomePrices"))
+    if raw_prices and len(raw_prices) >= 2:
+        outcome_prices = [_parse_float(p) for p in raw_prices[:2]]
+
+    resolved = False
+    if outcome_prices and None not in outcome_prices:
+        p0, p1 = outcome_prices
+        # Loose check (>= 0.99 or <= 0.01) just in case
+        resolved = (p0 >= 0.99 and p1 <= 0.01) or (p0 <= 0.01 and p1 >= 0.99)
+
+    return {
+        "token_ids": token_ids,
+        "condition_id": m.get("conditionId") or m.get("condition_id"),
+        "neg_risk": bool(m.get("negRisk") or m.get("neg_risk")),
+        "outcome_prices": outcome_prices,
+        "best_bid": _parse_float(m.get("bestBid")),
+        "best_ask": _parse_float(m.get("bestAsk")),
+        "resolution": (True, outcome_prices) if resolved else (False, None),
+    }
+
+
+class MarketMetadataCache:
+    """
+    One cache entry per market slug, filled from a single Gamma
+    /markets/slug request and shared by entry, monitoring and settlement.
+
+    Each field carries its own expiry: token IDs, condition ID and the
+    neg-risk flag never change once Gamma has filled them in (until then
+    they expire like prices), outcome prices and best bid/ask expire after
+    MARKET_PRICE_CACHE_TTL_SEC, and an unresolved resolution state after
+    MARKET_RESOLUTION_CACHE_TTL_SEC (a resolved one is final). Reading a
+    stale field refetches the market and refreshes every field. Entries are
+    evicted MARKET_CACHE_RETENTION_SEC after their window ends, which leaves
+    settlement time to see the resolution. While the market WebSocket is
+    healthy, price fields are kept current from streamed quotes instead; a
+    streamed quote counts as expired once it is older than the price TTL or
+    the feed has been silent for WS_STALE_WARN_SEC, so a connected but
+    frozen socket still falls back to Gamma.
+    """
+
+    def __init__(
+        self,
+        price_ttl: float = MARKET_PRICE_CACHE_TTL_SEC,
+        resolution_ttl: float = MARKET_RESOLUTION_CACHE_TTL_SEC,
+        retention: float = MARKET_CACHE_RETENTION_SEC,
+    ):
+        self.price_ttl = price_ttl
+        self.resolution_ttl = resolution_ttl
+        self.retention = retention
+        # slug -> {"fields", "expires", "evict_at", "streamed", "streamed_at"}
+        self._entries: Dict[str, dict] = {}
+        self._slug_by_token: Dict[str, Tuple[str, int]] = {}  # token -> (slug, outcome index)
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "fetches": 0, "errors": 0, "evicted": 0, "streamed": 0}
+
+    def _expiries(self, fields: Dict[str, Any], now: float) -> Dict[str, float]:
+        # Gamma lists a new window before its token IDs are filled in, so a
+        # missing static field is retried like a price instead of kept
+        expires = {
+            f: FOREVER if fields[f] is not None else now + self.price_ttl
+            for f in STATIC_FIELDS
+        }
+        expires.update({f: now + self.price_ttl for f in PRICE_FIELDS})
+        expires["resolution"] = FOREVER if fields["resolution"][0] else now + self.resolution_ttl
+        return expires
+
+    def _evict_expired(self, now: float):
+        expired = [s for s, e in self._entries.items() if e["evict_at"] <= now]
+        for slug in expired:
+            for token_id in self._entries.pop(slug)["fields"]["token_ids"] or ():
+                self._slug_by_token.pop(str(token_id), None)
+        self._stats["evicted"] += len(expired)
+
+    def store(self, slug: str, market: dict) -> Dict[str, Any]:
+        """Cache a Gamma market payload fetched elsewhere"""
+        now = time.time()
+        fields = parse_market(market)
+        window_end = _window_end(slug)
+        evict_at = (window_end if window_end is not None else now) + self.retention
+        with self._lock:
+            self._evict_expired(now)
+            self._entries[slug] = {
+                "fields": fields,
+                "expires": self._expiries(fields, now),
+                "evict_at": evict_at,
+                "streamed": False,
+                "streamed_at": 0.0,
+            }
+            for outcome, token_id in enumerate(fields["token_ids"] or ()):
+                self._slug_by_token[str(token_id)] = (slug, outcome)
+        return fields
+
+    def _fetch(self, slug: str) -> Dict[str, Any]:
+        with self._lock:
+            self._stats["fetches"] += 1
+        try:
+            r = http_client.get(f"{GAMMA_API_BASE}/markets/slug/{slug}")
+            if r.status_code != 200:
+                raise GammaMarketError(slug, r.status_code)
+            return self.store(slug, r.json())
+        except Exception:
+            with self._lock:
+                self._stats["errors"] += 1
+            raise
+
+    def prefetch(self, slugs: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Resolve every slug not cached yet with one Gamma /markets?slug=...
+        request. Slugs Gamma does not list yet, or lists without token IDs,
+        are left out of the result and the cache; request failures are
+        counted and leave the cache unchanged. Either way callers fall back
+        to per-slug lookups.
+        """
+        with self._lock:
+            missing = [s for s in dict.fromkeys(slugs) if s not in self._entries]
+            if not missing:
+                return {}
+            self._stats["fetches"] += 1
+        try:
+            r = http_client.get(
+                f"{GAMMA_API_BASE}/markets",
+                params=[("slug", s) for s in missing] + [("limit", len(missing))],
+            )
+            if r.status_code != 200:
+                raise GammaMarketError(",".join(missing), r.status_code)
+            markets = r.json()
+        except Exception:
+            with self._lock:
+                self._stats["errors"] += 1
+            return {}
+        wanted = set(missing)
+        resolved = {}
+        for m in markets if isinstance(markets, list) else []:
+            if not isinstance(m, dict) or m.get("slug") not in wanted:
+                continue
+            # Listed ahead of its token IDs: leave it to the per-slug retries
+            if parse_market(m)["token_ids"] is None:
+                continue
+            resolved[m["slug"]] = self.store(m["slug"], m)
+        return resolved
+
+    def get(self, slug: str, field: str) -> Any:
+        """
+        Get one field for a slug, fetching the market if the field is missing
+        or expired. Raises GammaMarketError on non-200 responses and the
+        underlying exception on request/parse failures.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(slug)
+            if (
+                entry
+                and entry["expires"].get(field, 0.0) > now
+                and not (
+                    entry["streamed"]
+                    and field in PRICE_FIELDS
+                    and self._streamed_stale(entry, now)
+                )
+            ):
+                self._stats["hits"] += 1
+                return entry["fields"][field]
+        return self._fetch(slug)[field]
+
+    def _streamed_stale(self, entry: dict, now: float) -> bool:
+        """A streamed quote is too old, or the feed behind it has gone quiet"""
+        if now - entry["streamed_at"] > self.price_ttl:
+            return True
+        feed_age = ws_manager.feed_age()
+        return feed_age is None or feed_age > WS_STALE_WARN_SEC
+
+    def peek(self, slug: str, field: str) -> Any:
+        """Cached value of a field regardless of age, without fetching"""
+        with self._lock:
+            entry = self._entries.get(slug)
+            return entry["fields"].get(field) if entry else None
+
+    def apply_quote(self, token_id: str, best_bid: float, best_ask: float) -> bool:
+        """
+        Update a market's prices from a streamed best bid/ask of one of its
+        tokens. Streamed prices stay valid while quotes keep arriving within
+        the price TTL and the feed is live, or until expire_streamed() is
+        called (WebSocket disconnect). Returns False if the token's market
+        is not cached.
+        """
+        with self._lock:
+            ref = self._slug_by_token.get(str(token_id))
+            entry = self._entries.get(ref[0]) if ref else None
+            if entry is None:
+                return False
+            if ref[1] == 1:
+                # Gamma quotes the UP outcome; the DOWN book mirrors it
+                best_bid, best_ask = 1.0 - best_ask, 1.0 - best_bid
+            mid = (best_bid + best_ask) / 2.0
+            fields = entry["fields"]
+            fields["best_bid"] = round(best_bid, 4)
+            fields["best_ask"] = round(best_ask, 4)
+            fields["outcome_prices"] = [round(mid, 4), round(1.0 - mid, 4)]
+            for field in PRICE_FIELDS:
+                entry["expires"][field] = FOREVER
+            entry["streamed"] = True
+            entry["streamed_at"] = time.time()
+            self._stats["streamed"] += 1
+        return True
+
+    def expire_streamed(self):
+        """Expire streamed prices so the next read refetches them from Gamma"""
+        with self._lock:
+            for entry in self._entries.values():
+                if entry["streamed"]:
+                    for field in PRICE_FIELDS:
+                        entry["expires"][field] = 0.0
+                    entry["streamed"] = False
+
+    def invalidate(self, slug: str):
+        with self._lock:
+            entry = self._entries.pop(slug, None)
+            for token_id in (entry["fields"]["token_ids"] or ()) if entry else ():
+                self._slug_by_token.pop(str(token_id), None)
+
+    def get_token_ids(self, slug: str) -> Optional[Tuple[str, str]]:
+        return self.get(slug, "token_ids")
+
+    def get_resolution(self, slug: str) -> Tuple[bool, Optional[List[float]]]:
+        return self.get(slug, "resolution")
+
+    def get_stats(self) -> Dict[str, int]:
+        """Hit/fetch/error/eviction counters and current entry count"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            return stats
+
+    def format_stats(self) -> str:
+        s = self.get_stats()
+        return (
+            f"Markets: {s['entries']} cached, {s['hits']} hit, {s['fetches']} fetched, "
+            f"{s['streamed']} streamed, {s['errors']} err, {s['evicted']} evicted"
+        )
+
+
+# Singleton instance
+market_cache = MarketMetadataCache()
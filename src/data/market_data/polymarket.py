@@ -1,30 +1,30 @@
 """Polymarket-specific market data functions"""
 
 import time
-import json
-import requests
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
-from src.config.settings import GAMMA_API_BASE, CLOB_HOST
+from datetime import datetime
+from typing import List, Optional
+from src.config.settings import CLOB_HOST
+from src.utils.http import http_client
+from src.utils.websocket_manager import ws_manager
+from .market_cache import market_cache, GammaMarketError
+from .window_calendar import window_calendar
+
+PM_MOMENTUM_MIN_POINTS = 5
 
 
 def get_current_slug(symbol: str) -> str:
     """Generate slug for current 15-minute window"""
-    now_et = datetime.now(tz=ZoneInfo("America/New_York"))
-    minute_slot = (now_et.minute // 15) * 15
-    window_start_et = now_et.replace(minute=minute_slot, second=0, microsecond=0)
-    window_start_utc = window_start_et.astimezone(ZoneInfo("UTC"))
-    ts = int(window_start_utc.timestamp())
-    return f"{symbol.lower()}-updown-15m-{ts}"
+    return window_calendar.current().slug(symbol)
+
+
+def get_next_slug(symbol: str) -> str:
+    """Generate slug for the upcoming 15-minute window"""
+    return window_calendar.next().slug(symbol)
 
 
 def get_window_times(symbol: str):
     """Get window start and end times in ET"""
-    now_et = datetime.now(tz=ZoneInfo("America/New_York"))
-    minute_slot = (now_et.minute // 15) * 15
-    window_start_et = now_et.replace(minute=minute_slot, second=0, microsecond=0)
-    window_end_et = window_start_et + timedelta(minutes=15)
-    return window_start_et, window_end_et
+    return window_calendar.window_times()
 
 
 def format_window_range(start_et: datetime, end_et: datetime) -> str:
@@ -36,26 +36,46 @@ def format_window_range(start_et: datetime, end_et: datetime) -> str:
     return f"{month} {day}, {start_t}-{end_t} ET"
 
 
+def get_market_info(slug: str) -> Optional[dict]:
+    """
+    Get token IDs and condition ID for a market slug with a single Gamma
+    request (no retries), served from the market metadata cache.
+    """
+    try:
+        token_ids = market_cache.get_token_ids(slug)
+        if not token_ids:
+            return None
+        return {
+            "up_token_id": token_ids[0],
+            "down_token_id": token_ids[1],
+            "condition_id": market_cache.get(slug, "condition_id"),
+        }
+    except:
+        return None
+
+
+def discover_markets(symbols: List[str]) -> int:
+    """
+    Resolve the current and next window markets of every symbol with a
+    single Gamma request, filling the market metadata cache that
+    get_token_ids / get_market_info read from. Returns how many markets
+    were newly cached (markets not listed yet are left to per-slug lookups).
+    """
+    current, upcoming = window_calendar.current(), window_calendar.next()
+    slugs = [w.slug(symbol) for symbol in symbols for w in (current, upcoming)]
+    return len(market_cache.prefetch(slugs))
+
+
 def get_token_ids(symbol: str):
     """Get UP and DOWN token IDs from Gamma API"""
     slug = get_current_slug(symbol)
     for attempt in range(1, 13):
         try:
-            r = requests.get(f"{GAMMA_API_BASE}/markets/slug/{slug}", timeout=5)
-            if r.status_code == 200:
-                m = r.json()
-                clob_ids = m.get("clobTokenIds") or m.get("clob_token_ids")
-                if isinstance(clob_ids, str):
-                    try:
-                        clob_ids = json.loads(clob_ids)
-                    except:
-                        clob_ids = [
-                            x.strip().strip('"')
-                            for x in clob_ids.strip("[]").split(",")
-                        ]
-                if isinstance(clob_ids, list) and len(clob_ids) >= 2:
-                    return clob_ids[0], clob_ids[1]
-            elif r.status_code == 404 and attempt == 1:
+            token_ids = market_cache.get_token_ids(slug)
+            if token_ids:
+                return token_ids
+        except GammaMarketError as e:
+            if e.status_code == 404 and attempt == 1:
                 from src.utils.logger import log
 
                 log(f"[{symbol}] 🔍 Market slug not found: {slug}")
@@ -69,22 +89,38 @@ def get_token_ids(symbol: str):
     return None, None
 
 
+def _fetch_price_history(token_id: str, interval: str) -> list:
+    """Token price history from the CLOB prices-history endpoint"""
+    url = f"{CLOB_HOST}/prices-history"
+    params = {"interval": interval, "token_id": token_id}
+    resp = http_client.get(url, params=params, timeout=10)
+    resp.raise_for_status()
+    history = resp.json()
+    if isinstance(history, dict):
+        history = history.get("history")
+    if not history or not isinstance(history, list):
+        return []
+    prices = []
+    for h in history:
+        p = h.get("p") or h.get("price")
+        if p is not None:
+            prices.append(float(p))
+    return prices
+
+
 def get_polymarket_momentum(token_id: str, interval: str = "1m") -> dict:
-    """Calculate momentum based on Polymarket's own price history"""
+    """
+    Calculate momentum based on Polymarket's own price history. Uses the
+    history captured from the market WebSocket; prices-history is only
+    fetched while that is too short (cold start) or the channel is down.
+    """
     try:
-        url = f"{CLOB_HOST}/prices-history"
-        params = {"interval": interval, "token_id": token_id}
-        resp = requests.get(url, params=params, timeout=10)
-        resp.raise_for_status()
-        history = resp.json()
-        if not history or not isinstance(history, list) or len(history) < 5:
-            return {"velocity": 0.0, "direction": "NEUTRAL", "strength": 0.0}
         prices = []
-        for h in history:
-            p = h.get("p") or h.get("price")
-            if p is not None:
-                prices.append(float(p))
-        if len(prices) < 5:
+        if ws_manager.market_connected:
+            prices = [p for _, p in ws_manager.get_price_history(token_id)]
+        if len(prices) < PM_MOMENTUM_MIN_POINTS:
+            prices = _fetch_price_history(token_id, interval)
+        if len(prices) < PM_MOMENTUM_MIN_POINTS:
             return {"velocity": 0.0, "direction": "NEUTRAL", "strength": 0.0}
         velocity = (
             ((prices[-1] - prices[0]) / prices[0]) * 100.0 if prices[0] > 0 else 0
@@ -102,12 +138,6 @@ def get_polymarket_momentum(token_id: str, interval: str = "1m") -> dict:
         return {"velocity": 0.0, "direction": "NEUTRAL", "strength": 0.0}
 
 
-# Cache for outcome prices (UP and DOWN token prices from market slug API)
-_outcome_prices_cache: dict = {}
-_outcome_prices_cache_timestamp: float = 0.0
-CACHE_TTL_SECONDS = 10.0  # Refresh cache every 10 seconds
-
-
 def get_outcome_prices(symbol: str) -> dict:
     """
     Get UP and DOWN token prices from Polymarket market slug API.
@@ -120,78 +150,27 @@ def get_outcome_prices(symbol: str) -> dict:
         - "up_wins": Boolean - True if UP is winning (up_price >= 0.50)
         - "down_wins": Boolean - True if DOWN is winning (down_price <= 0.50)
     """
-    import time
     from src.utils.logger import log
 
-    global _outcome_prices_cache, _outcome_prices_cache_timestamp
-
     slug = get_current_slug(symbol)
-    now = time.time()
-
-    # Return cached data if still valid
-    if (
-        slug in _outcome_prices_cache
-        and (now - _outcome_prices_cache_timestamp) < CACHE_TTL_SECONDS
-    ):
-        return _outcome_prices_cache[slug]
 
     try:
-        r = requests.get(f"{GAMMA_API_BASE}/markets/slug/{slug}", timeout=5)
-        if r.status_code != 200:
-            log(f"⚠️  [{symbol}] Failed to fetch outcome prices: HTTP {r.status_code}")
+        # Prices share one cached Gamma fetch per slug (MARKET_PRICE_CACHE_TTL_SEC)
+        try:
+            outcome_prices = market_cache.get(slug, "outcome_prices")
+        except GammaMarketError as e:
+            log(f"⚠️  [{symbol}] Failed to fetch outcome prices: HTTP {e.status_code}")
             return {}
 
-        market_data = r.json()
-        outcome_prices = market_data.get("outcomePrices")
         if not outcome_prices:
             log(f"⚠️  [{symbol}] No outcome prices in market data")
             return {}
 
-        # Parse outcomePrices: format can be JSON array or comma-separated string
-        # e.g., ["0.835", "0.165"] or "0.835,0.165"
-        if isinstance(outcome_prices, str):
-            # Try parsing as JSON array first
-            try:
-                import json
-
-                parsed_prices = json.loads(outcome_prices)
-                if isinstance(parsed_prices, list) and len(parsed_prices) >= 2:
-                    up_price = float(parsed_prices[0]) if parsed_prices[0] else None
-                    down_price = float(parsed_prices[1]) if parsed_prices[1] else None
-                else:
-                    # Fallback to comma-separated parsing
-                    prices = outcome_prices.split(",")
-                    up_price = float(prices[0].strip()) if len(prices) > 0 else None
-                    down_price = float(prices[1].strip()) if len(prices) > 1 else None
-            except:
-                # JSON parsing failed, try comma-separated
-                prices = outcome_prices.split(",")
-                up_price = float(prices[0].strip()) if len(prices) > 0 else None
-                down_price = float(prices[1].strip()) if len(prices) > 1 else None
-        elif isinstance(outcome_prices, list):
-            # Already parsed as list
-            up_price = float(outcome_prices[0]) if len(outcome_prices) > 0 else None
-            down_price = float(outcome_prices[1]) if len(outcome_prices) > 1 else None
-        else:
-            # Fallback if not string format
-            up_price = None
-            down_price = None
-
-        # Get token IDs
-        clob_ids = market_data.get("clobTokenIds") or market_data.get("clob_token_ids")
         up_token_id, down_token_id = get_token_ids(symbol)
 
         # Use bestBid/bestAsk for midpoint prices (actual market data, not indices)
-        best_bid = (
-            float(market_data.get("bestBid", 0.50))
-            if market_data.get("bestBid")
-            else 0.50
-        )
-        best_ask = (
-            float(market_data.get("bestAsk", 0.50))
-            if market_data.get("bestAsk")
-            else 0.50
-        )
+        best_bid = market_cache.get(slug, "best_bid") or 0.50
+        best_ask = market_cache.get(slug, "best_ask") or 0.50
 
         # Determine winning sides based on midpoint prices
         up_wins = best_bid >= 0.50
@@ -206,10 +185,6 @@ def get_outcome_prices(symbol: str) -> dict:
             "down_wins": down_wins,
         }
 
-        # Cache the result
-        _outcome_prices_cache[slug] = result
-        _outcome_prices_cache_timestamp = now
-
         return result
 
     except Exception as e:
@@ -1,10 +1,125 @@
 """Price movement validation for high confidence trades"""
 
-import requests
-from typing import Dict, List, Optional
+import numpy as np
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from src.config.settings import BINANCE_FUNDING_MAP
-from .binance import _create_klines_dataframe
+from .klines import get_kline_array
+from .binance_weight import PRIORITY_LOW
+
+
+MANIPULATION_LOOKBACK = 60  # Candles inspected by the manipulation checks
+NEUTRAL_MANIPULATION = {"manipulation_detected": False, "score": 0.0, "reasons": []}
+
+
+def _price_movements(close: np.ndarray, timeframes_minutes: List[int]) -> Dict[str, float]:
+    """Percentage change of the last close against each timeframe's reference close"""
+    offsets = np.array(timeframes_minutes) + 1
+    past = close[-offsets]
+    moves = (close[-1] - past) / past * 100.0
+    return {f"{tf}m": move for tf, move in zip(timeframes_minutes, moves)}
+
+
+def _volatility_score(returns: np.ndarray) -> float:
+    """Annualized return volatility normalized to 0-1"""
+    if len(returns) < 5:
+        return 0.0
+    volatility = returns.std(ddof=1) * np.sqrt(1440)  # Annualized volatility (1440 min/day)
+    
+    # Normalize to 0-1 scale (assuming 100% annualized volatility is extremely high)
+    return min(volatility / 1.0, 1.0)
+
+
+def _manipulation_signals(klines: np.ndarray, returns: np.ndarray) -> Dict[str, any]:
+    """Wick, volume spike, reversal and gap heuristics over a kline array"""
+    close = klines["close"]
+    volume = klines["volume"]
+    manipulation_score = 0.0
+    reasons = []
+    
+    # Check 1: Extreme wicks (long shadows) in the last 15 minutes
+    recent_data = klines[-15:]
+    recent_open = recent_data["open"]
+    recent_close = recent_data["close"]
+    body_size = np.abs(recent_close - recent_open)
+    wick_size = (recent_data["high"] - recent_data["low"]) - body_size
+    wicks = np.flatnonzero(wick_size > body_size * 3)  # Wick is 3x larger than body
+    if len(wicks):
+        manipulation_score += 0.2
+        reasons.append(f"Extreme wick detected at minute {wicks[0]}")
+    
+    # Check 2: Volume spikes without significant price movement
+    avg_volume = volume[-20:].mean()
+    recent_volume = volume[-5:].mean()
+    
+    if recent_volume > avg_volume * 3:  # 3x average volume
+        recent_price_change = abs(close[-1] - close[-6]) / close[-6] * 100
+        if recent_price_change < 1.0:  # Less than 1% price change despite volume spike
+            manipulation_score += 0.3
+            reasons.append("Volume spike without price movement")
+    
+    # Check 3: Rapid price reversals
+    price_changes = returns[-10:]
+    positive_changes = np.count_nonzero(price_changes > 0.005)
+    negative_changes = np.count_nonzero(price_changes < -0.005)
+    
+    if positive_changes >= 4 and negative_changes >= 4:  # High volatility with reversals
+        manipulation_score += 0.25
+        reasons.append("Frequent price reversals")
+    
+    # Check 4: Price gaps (0.5%) between consecutive recent candles
+    gaps = np.abs(recent_open[1:] - recent_close[:-1]) / recent_close[:-1] * 100
+    gapped = np.flatnonzero(gaps > 0.5)
+    if len(gapped):
+        manipulation_score += 0.15
+        reasons.append(f"Price gap detected: {gaps[gapped[0]]:.2f}%")
+    
+    return {
+        "manipulation_detected": manipulation_score > 0.4,
+        "score": min(manipulation_score, 1.0),
+        "reasons": reasons
+    }
+
+
+def analyze_price_action(
+    klines: Optional[np.ndarray],
+    timeframes_minutes: List[int] = [5, 15, 30],
+    volatility_lookback: int = 30,
+) -> Tuple[Dict[str, float], float, Dict[str, any]]:
+    """
+    Compute multi-timeframe movements, volatility score and manipulation
+    signals from one kline array (newest last), sharing a single returns
+    computation. Each part falls back to its neutral value when the array is
+    shorter than that part needs, matching the standalone functions.
+    
+    Returns:
+        (movements, volatility_score, manipulation)
+    """
+    movement_window = max(timeframes_minutes) + 5
+    volatility_window = volatility_lookback + 5
+    n = 0 if klines is None else len(klines)
+    if n == 0:
+        return {f"{tf}m": 0.0 for tf in timeframes_minutes}, 0.0, dict(NEUTRAL_MANIPULATION)
+    
+    close = klines["close"]
+    returns = close[1:] / close[:-1] - 1
+    
+    if n >= movement_window:
+        movements = _price_movements(close[-movement_window:], timeframes_minutes)
+    else:
+        movements = {f"{tf}m": 0.0 for tf in timeframes_minutes}
+    
+    if min(n, volatility_window) >= volatility_lookback:
+        volatility_score = _volatility_score(returns[-(volatility_window - 1):])
+    else:
+        volatility_score = 0.0
+    
+    if n >= 30:
+        manipulation = _manipulation_signals(klines[-MANIPULATION_LOOKBACK:], returns)
+    else:
+        manipulation = dict(NEUTRAL_MANIPULATION)
+    
+    return movements, volatility_score, manipulation
 
 
 def get_recent_price_movements(symbol: str, timeframes_minutes: List[int] = [5, 15, 30]) -> Dict[str, float]:
@@ -23,32 +138,14 @@ def get_recent_price_movements(symbol: str, timeframes_minutes: List[int] = [5,
         return {f"{tf}m": 0.0 for tf in timeframes_minutes}
     
     try:
-        import pandas as pd
-        
         # Get max timeframe + buffer for calculations
         max_minutes = max(timeframes_minutes) + 5
         
-        url = f"https://api.binance.com/api/v3/klines?symbol={pair}&interval=1m&limit={max_minutes}"
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        
-        df = _create_klines_dataframe(response.json())
-        if df is None or len(df) < max_minutes:
+        klines = get_kline_array(symbol, max_minutes, priority=PRIORITY_LOW)
+        if klines is None or len(klines) < max_minutes:
             return {f"{tf}m": 0.0 for tf in timeframes_minutes}
         
-        close_prices = pd.to_numeric(df["close"])
-        movements = {}
-        
-        for timeframe in timeframes_minutes:
-            if len(close_prices) >= timeframe:
-                current_price = close_prices.iloc[-1]
-                past_price = close_prices.iloc[-(timeframe + 1)]
-                movement = ((current_price - past_price) / past_price) * 100.0
-                movements[f"{timeframe}m"] = movement
-            else:
-                movements[f"{tf}m"] = 0.0
-                
-        return movements
+        return _price_movements(klines["close"], timeframes_minutes)
         
     except Exception as e:
         print(f"Error calculating price movements for {symbol}: {e}")
@@ -71,30 +168,12 @@ def calculate_volatility_score(symbol: str, lookback_minutes: int = 30) -> float
         return 0.0
     
     try:
-        import pandas as pd
-        import numpy as np
-        
-        url = f"https://api.binance.com/api/v3/klines?symbol={pair}&interval=1m&limit={lookback_minutes + 5}"
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        
-        df = _create_klines_dataframe(response.json())
-        if df is None or len(df) < lookback_minutes:
-            return 0.0
-        
-        close_prices = pd.to_numeric(df["close"])
-        
-        # Calculate rolling volatility (standard deviation of returns)
-        returns = close_prices.pct_change().dropna()
-        if len(returns) < 5:
+        klines = get_kline_array(symbol, lookback_minutes + 5, priority=PRIORITY_LOW)
+        if klines is None or len(klines) < lookback_minutes:
             return 0.0
-            
-        volatility = returns.std() * np.sqrt(1440)  # Annualized volatility (1440 min/day)
-        
-        # Normalize to 0-1 scale (assuming 100% annualized volatility is extremely high)
-        volatility_score = min(volatility / 1.0, 1.0)
         
-        return volatility_score
+        close_prices = klines["close"]
+        return _volatility_score(close_prices[1:] / close_prices[:-1] - 1)
         
     except Exception as e:
         print(f"Error calculating volatility for {symbol}: {e}")
@@ -116,78 +195,13 @@ def detect_price_manipulation(symbol: str) -> Dict[str, any]:
         return {"manipulation_detected": False, "score": 0.0, "reasons": []}
     
     try:
-        import pandas as pd
-        
         # Get recent data for analysis
-        url = f"https://api.binance.com/api/v3/klines?symbol={pair}&interval=1m&limit=60"
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        
-        df = _create_klines_dataframe(response.json())
-        if df is None or len(df) < 30:
+        klines = get_kline_array(symbol, MANIPULATION_LOOKBACK, priority=PRIORITY_LOW)
+        if klines is None or len(klines) < 30:
             return {"manipulation_detected": False, "score": 0.0, "reasons": []}
         
-        high = pd.to_numeric(df["high"])
-        low = pd.to_numeric(df["low"])
-        close = pd.to_numeric(df["close"])
-        volume = pd.to_numeric(df["volume"])
-        
-        manipulation_score = 0.0
-        reasons = []
-        
-        # Check 1: Extreme wicks (long shadows)
-        recent_data = df.tail(15)  # Last 15 minutes
-        recent_high = pd.to_numeric(recent_data["high"])
-        recent_low = pd.to_numeric(recent_data["low"])
-        recent_close = pd.to_numeric(recent_data["close"])
-        
-        
-        for i in range(len(recent_data)):
-            curr_open = float(recent_data.iloc[i]['open'])
-            body_size = abs(recent_close.iloc[i] - curr_open)
-            wick_size = (recent_high.iloc[i] - recent_low.iloc[i]) - body_size
-            
-            if wick_size > body_size * 3:  # Wick is 3x larger than body
-                manipulation_score += 0.2
-                reasons.append(f"Extreme wick detected at minute {i}")
-                break
-        
-        # Check 2: Volume spikes without significant price movement
-        avg_volume = volume.tail(20).mean()
-        recent_volume = volume.tail(5).mean()
-        
-        if recent_volume > avg_volume * 3:  # 3x average volume
-            recent_price_change = abs(close.iloc[-1] - close.iloc[-6]) / close.iloc[-6] * 100
-            if recent_price_change < 1.0:  # Less than 1% price change despite volume spike
-                manipulation_score += 0.3
-                reasons.append("Volume spike without price movement")
-        
-        # Check 3: Rapid price reversals
-        price_changes = close.pct_change().tail(10)
-        positive_changes = sum(1 for x in price_changes if x > 0.005)
-        negative_changes = sum(1 for x in price_changes if x < -0.005)
-        
-        if positive_changes >= 4 and negative_changes >= 4:  # High volatility with reversals
-            manipulation_score += 0.25
-            reasons.append("Frequent price reversals")
-        
-        
-        # Check 4: Price gaps
-        for i in range(1, len(recent_data)):
-            prev_close = float(recent_close.iloc[i-1])
-            curr_open = float(recent_data.iloc[i]['open'])
-            gap = abs(curr_open - prev_close) / prev_close * 100
-            
-            if gap > 0.5:  # 0.5% gap
-                manipulation_score += 0.15
-                reasons.append(f"Price gap detected: {gap:.2f}%")
-                break
-        
-        return {
-            "manipulation_detected": manipulation_score > 0.4,
-            "score": min(manipulation_score, 1.0),
-            "reasons": reasons
-        }
+        close = klines["close"]
+        return _manipulation_signals(klines, close[1:] / close[:-1] - 1)
         
     except Exception as e:
         print(f"Error detecting manipulation for {symbol}: {e}")
@@ -225,14 +239,10 @@ def validate_price_movement_for_trade(
         }
     
     try:
-        # Get recent price movements
-        movements = get_recent_price_movements(symbol, [5, 15, 30])
-        
-        # Calculate volatility
-        volatility_score = calculate_volatility_score(symbol, 30)
-        
-        # Detect manipulation
-        manipulation = detect_price_manipulation(symbol)
+        # One kline fetch feeds movements, volatility and manipulation checks
+        movements, volatility_score, manipulation = analyze_price_action(
+            get_kline_array(symbol, MANIPULATION_LOOKBACK, priority=PRIORITY_LOW)
+        )
         
         # Initialize validation results
         validation_result = {
@@ -0,0 +1,239 @@
+"""Incremental RSI, ADX and VWAP fed by streamed klines"""
+
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Deque, Dict, Optional, Sequence
+import numpy as np
+from src.config.settings import (
+    ADX_INTERVAL,
+    ADX_PERIOD,
+    MOMENTUM_LOOKBACK_MINUTES,
+)
+
+
+class _StreamingIndicator(ABC):
+    """
+    Base class for indicators over a fixed trailing window of `length` klines.
+
+    The newest kline is the live (still updating) candle, exactly like the
+    last row of a REST `/klines?limit=length` response. Closed candles are
+    folded into cached state when they close, so each live update only has to
+    apply a single step on top of that state.
+
+    Rows may be REST kline lists or KLINE_DTYPE records; both are read by
+    position.
+    """
+
+    interval = "1m"
+
+    def __init__(self, length: int):
+        self.length = length
+        self.closed: Deque[list] = deque(maxlen=length - 1)
+        self.live: Optional[list] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.live is not None and len(self.closed) == self.length - 1
+
+    def load(self, rows: Sequence):
+        """Reset from a contiguous kline history (newest last)"""
+        self.closed.clear()
+        self.live = None
+        window = rows[-self.length :]
+        if len(window) == 0:
+            return
+        self.closed.extend(window[:-1])
+        self.live = window[-1]
+        self._anchor()
+        self._update_live()
+
+    def update(self, row: list):
+        """Apply a pushed kline (REST row format)"""
+        if self.live is not None and row[0] < self.live[0]:
+            return
+        if self.live is not None and row[0] > self.live[0]:
+            self.closed.append(self.live)
+            self.live = row
+            self._anchor()
+        else:
+            self.live = row
+        self._update_live()
+
+    @abstractmethod
+    def _anchor(self):
+        """Rebuild the cached state for the closed candles"""
+
+    @abstractmethod
+    def _update_live(self):
+        """Recompute the value from the cached state and the live candle"""
+
+
+class StreamingRSI(_StreamingIndicator):
+    """Wilder RSI over the window closes, matching ta.RSIIndicator(...).rsi().iloc[-1]"""
+
+    def __init__(self, length: int, window: int = 14):
+        super().__init__(length)
+        self.window = window
+        self.alpha = 1 / window
+        self._ema_up = 0.0
+        self._ema_dn = 0.0
+        self._last_close = 0.0
+        self._value = float("nan")
+
+    def _ewm_step(self, weighted: float, cur: float) -> float:
+        # pandas ewm(adjust=False) update, kept in the same operation order
+        old_wt = 1.0 - self.alpha
+        if weighted != cur:
+            weighted = (old_wt * weighted + self.alpha * cur) / (old_wt + self.alpha)
+        return weighted
+
+    def _anchor(self):
+        closes = [float(row[4]) for row in self.closed]
+        # First close has no diff; ta fills it with 0.0 and counts it
+        ema_up, ema_dn = 0.0, 0.0
+        for prev, cur in zip(closes, closes[1:]):
+            diff = cur - prev
+            ema_up = self._ewm_step(ema_up, diff if diff > 0 else 0.0)
+            ema_dn = self._ewm_step(ema_dn, -diff if diff < 0 else 0.0)
+        self._ema_up, self._ema_dn = ema_up, ema_dn
+        self._last_close = closes[-1] if closes else 0.0
+
+    def _update_live(self):
+        if not self.closed or self.length < self.window:
+            self._value = float("nan")
+            return
+        diff = float(self.live[4]) - self._last_close
+        ema_up = self._ewm_step(self._ema_up, diff if diff > 0 else 0.0)
+        ema_dn = self._ewm_step(self._ema_dn, -diff if diff < 0 else 0.0)
+        self._value = 100.0 if ema_dn == 0 else 100 - (100 / (1 + ema_up / ema_dn))
+
+    def value(self) -> float:
+        return self._value
+
+
+class StreamingADX(_StreamingIndicator):
+    """Wilder ADX over the window, matching ta.ADXIndicator(...).adx().iloc[-1]"""
+
+    interval = ADX_INTERVAL
+
+    def __init__(self, length: int, window: int = 14):
+        super().__init__(length)
+        self.window = window
+        self._trs = 0.0
+        self._dip = 0.0
+        self._din = 0.0
+        self._adx = 0.0
+        self._prev = None  # (high, low, close) of the last closed candle
+        self._value = -1.0
+
+    @staticmethod
+    def _moves(prev: tuple, high: float, low: float, close: float) -> tuple:
+        """True range and +DM/-DM of a candle against the previous one"""
+        prev_high, prev_low, prev_close = prev
+        tr = max(high, prev_close) - min(low, prev_close)
+        diff_up = high - prev_high
+        diff_down = prev_low - low
+        pos = abs(((diff_up > diff_down) & (diff_up > 0)) * diff_up)
+        neg = abs(((diff_down > diff_up) & (diff_down > 0)) * diff_down)
+        return tr, pos, neg
+
+    def _dx(self, trs: float, dip: float, din: float) -> float:
+        di_pos = 100 * (dip / trs) if trs != 0 else 0.0
+        di_neg = 100 * (din / trs) if trs != 0 else 0.0
+        if di_pos + di_neg == 0:
+            return 0.0
+        return 100 * np.abs((di_pos - di_neg) / (di_pos + di_neg))
+
+    def _anchor(self):
+        p = self.window
+        hlc = [(float(r[2]), float(r[3]), float(r[4])) for r in self.closed]
+        if len(hlc) < 2 * p:
+            self._prev = None
+            return
+        moves = [self._moves(hlc[i - 1], *hlc[i]) for i in range(1, len(hlc))]
+        trs = float(np.array([m[0] for m in moves[:p]]).sum())
+        dip = float(np.array([m[1] for m in moves[:p]]).sum())
+        din = float(np.array([m[2] for m in moves[:p]]).sum())
+        dx = [self._dx(trs, dip, din)]
+        for tr, pos, neg in moves[p:]:
+            trs = trs - (trs / float(p)) + tr
+            dip = dip - (dip / float(p)) + pos
+            din = din - (din / float(p)) + neg
+            dx.append(self._dx(trs, dip, din))
+        adx = float(np.array(dx[:p]).mean())
+        for value in dx[p:]:
+            adx = ((adx * (p - 1)) + value) / float(p)
+        self._trs, self._dip, self._din, self._adx = trs, dip, din, adx
+        self._prev = hlc[-1]
+
+    def _update_live(self):
+        if self._prev is None:
+            self._value = -1.0
+            return
+        p = self.window
+        tr, pos, neg = self._moves(
+            self._prev, float(self.live[2]), float(self.live[3]), float(self.live[4])
+        )
+        trs = self._trs - (self._trs / float(p)) + tr
+        dip = self._dip - (self._dip / float(p)) + pos
+        din = self._din - (self._din / float(p)) + neg
+        self._value = float(
+            ((self._adx * (p - 1)) + self._dx(trs, dip, din)) / float(p)
+        )
+
+    def value(self) -> float:
+        return self._value
+
+
+class StreamingVWAP(_StreamingIndicator):
+    """Typical-price VWAP over the window, matching get_volume_weighted_momentum"""
+
+    def __init__(self, length: int):
+        super().__init__(length)
+        self._tpv = np.zeros(length)
+        self._vol = np.zeros(length)
+        self._value = 0.0
+
+    def _anchor(self):
+        # Closed candles occupy the leading slots; the live candle is always last
+        offset = self.length - 1 - len(self.closed)
+        self._tpv[:] = 0.0
+        self._vol[:] = 0.0
+        for i, row in enumerate(self.closed, start=offset):
+            high, low, close, volume = (float(row[k]) for k in (2, 3, 4, 5))
+            self._tpv[i] = ((high + low + close) / 3) * volume
+            self._vol[i] = volume
+
+    def _update_live(self):
+        high, low, close, volume = (float(self.live[k]) for k in (2, 3, 4, 5))
+        self._tpv[-1] = ((high + low + close) / 3) * volume
+        self._vol[-1] = volume
+        tpv = self._tpv[self.length - 1 - len(self.closed) :]
+        vol = self._vol[self.length - 1 - len(self.closed) :]
+        self._value = float(tpv.sum() / vol.sum()) if vol.sum() > 0 else close
+
+    def value(self) -> float:
+        return self._value
+
+
+def compute_rsi(klines: Sequence, window: int = 14) -> float:
+    """One-shot RSI of the last close over the whole kline window"""
+    indicator = StreamingRSI(len(klines), window=window)
+    indicator.load(klines)
+    return indicator.value()
+
+
+def compute_adx(klines: Sequence, window: int = 14) -> float:
+    """One-shot ADX of the last candle over the whole kline window"""
+    indicator = StreamingADX(len(klines), window=window)
+    indicator.load(klines)
+    return indicator.value()
+
+
+def create_indicator_set() -> Dict[str, _StreamingIndicator]:
+    """Indicators kept per pair, sized to the windows the signal functions read"""
+    return {
+        "rsi": StreamingRSI(max(30, MOMENTUM_LOOKBACK_MINUTES + 20), window=14),
+        "vwap": StreamingVWAP(15),
+        "adx": StreamingADX(ADX_PERIOD * 3 + 10, window=ADX_PERIOD),
+    }
@@ -0,0 +1,99 @@
+"""Precomputed 15-minute window boundaries and slugs"""
+
+import time
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+WINDOW_SEC = 900
+WINDOWS_AHEAD = 96  # One day of windows per refill
+
+ET = ZoneInfo("America/New_York")
+
+
+class Window:
+    """One market window: epoch bounds, ET datetimes and per-symbol slugs"""
+
+    __slots__ = ("start_ts", "end_ts", "start_et", "end_et", "_slugs")
+
+    def __init__(self, start_ts: int):
+        self.start_ts = start_ts
+        self.end_ts = start_ts + WINDOW_SEC
+        self.start_et = datetime.fromtimestamp(start_ts, tz=ET)
+        self.end_et = datetime.fromtimestamp(self.end_ts, tz=ET)
+        self._slugs: Dict[str, str] = {}
+
+    def slug(self, symbol: str) -> str:
+        slug = self._slugs.get(symbol)
+        if slug is None:
+            slug = self._slugs[symbol] = f"{symbol.lower()}-updown-15m-{self.start_ts}"
+        return slug
+
+
+class WindowCalendar:
+    """
+    Window boundaries precomputed WINDOWS_AHEAD at a time. ET offsets are
+    whole hours, so every window starts on a multiple of WINDOW_SEC in epoch
+    time and the current window is a single index into the table; zoneinfo
+    is only touched when the table is refilled.
+    """
+
+    def __init__(self, ahead: int = WINDOWS_AHEAD):
+        self.ahead = ahead
+        # (window index of the first entry, windows); swapped as one reference
+        self._table: Tuple[int, List[Window]] = (0, [])
+        self._lock = threading.Lock()
+
+    def _refill(self, index: int) -> None:
+        with self._lock:
+            base, windows = self._table
+            if 0 <= index - base < len(windows):
+                return
+            windows = [Window((index + i) * WINDOW_SEC) for i in range(self.ahead + 1)]
+            self._table = (index, windows)
+
+    def window_at(self, ts: float) -> Window:
+        """The window containing epoch time ts"""
+        index = int(ts // WINDOW_SEC)
+        base, windows = self._table
+        if not 0 <= index - base < len(windows):
+            self._refill(index)
+            base, windows = self._table
+        return windows[index - base]
+
+    def current(self, now: Optional[float] = None) -> Window:
+        return self.window_at(time.time() if now is None else now)
+
+    def next(self, now: Optional[float] = None) -> Window:
+        return self.window_at(self.current(now).end_ts)
+
+    def upcoming(self, count: int, now: Optional[float] = None) -> List[Window]:
+        """The current window followed by the next count - 1"""
+        start = self.current(now).start_ts
+        return [self.window_at(start + i * WINDOW_SEC) for i in range(count)]
+
+    def window_times(self, now: Optional[float] = None) -> Tuple[datetime, datetime]:
+        window = self.current(now)
+        return window.start_et, window.end_et
+
+    def seconds_into_window(self, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        return now - self.current(now).start_ts
+
+    def seconds_until_boundary(self, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        return self.current(now).end_ts - now
+
+    def sleep_until_event(self, max_sleep: float, lead_times=(0.0,)) -> float:
+        """
+        Seconds to sleep before the next boundary (or a point lead_times
+        seconds before it), capped at max_sleep. Lets a polling loop wake
+        exactly on window events instead of up to max_sleep late.
+        """
+        remaining = self.seconds_until_boundary()
+        waits = [remaining - lead for lead in lead_times if remaining - lead > 0]
+        return max(0.0, min([max_sleep] + waits))
+
+
+window_calendar = WindowCalendar()
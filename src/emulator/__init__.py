@@ -0,0 +1,4 @@
+from .fixtures import FixtureSet, record_fixtures, synthetic_klines
+from .server import ExchangeEmulator
+
+__all__ = ["ExchangeEmulator", "FixtureSet", "record_fixtures", "synthetic_klines"]
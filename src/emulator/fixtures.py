@@ -0,0 +1,137 @@
+"""Recorded (or synthetic) market data fed to the exchange emulator"""
+
+import os
+import json
+import random
+import time
+import zlib
+from typing import Dict, List, Optional
+
+# Resolved without importing settings so the runner can set endpoint env vars first
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_FIXTURES_DIR = os.path.join(BASE_DIR, "fixtures", "emulator")
+SYNTHETIC_CANDLES = 1440  # One day of 1m candles per synthetic pair
+
+# Rough price levels so synthetic pairs look like their real counterparts
+BASE_PRICES = {"BTCUSDT": 95000.0, "ETHUSDT": 3300.0, "XRPUSDT": 2.2, "SOLUSDT": 190.0}
+
+DEFAULT_BOOK_SIZES = [150.0, 300.0, 500.0, 800.0, 1200.0]
+
+
+class FixtureSet:
+    """
+    Loads the emulator's source data from a fixtures directory:
+
+        binance/klines_<PAIR>.json   raw /api/v3/klines rows (1m, oldest first)
+        polymarket/book.json         a recorded /book response (level sizes reused)
+
+    Pairs without a recording get a deterministic synthetic random walk, so
+    any number of markets can be emulated without recording them first.
+    """
+
+    def __init__(self, fixtures_dir: str = DEFAULT_FIXTURES_DIR):
+        self.fixtures_dir = fixtures_dir
+        self._klines: Dict[str, List[list]] = {}
+
+    def _path(self, *parts: str) -> str:
+        return os.path.join(self.fixtures_dir, *parts)
+
+    def _load_json(self, *parts: str):
+        path = self._path(*parts)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def klines(self, pair: str) -> List[list]:
+        """1m kline rows for a pair (recorded if available, else synthetic)"""
+        rows = self._klines.get(pair)
+        if rows is None:
+            recorded = self._load_json("binance", f"klines_{pair}.json")
+            if isinstance(recorded, list) and len(recorded) >= 2:
+                rows = recorded
+            else:
+                rows = synthetic_klines(pair)
+            self._klines[pair] = rows
+        return rows
+
+    def book_sizes(self) -> List[float]:
+        """Per-level sizes taken from a recorded order book"""
+        book = self._load_json("polymarket", "book.json")
+        if not isinstance(book, dict):
+            return DEFAULT_BOOK_SIZES
+        try:
+            # Best level is last in CLOB responses
+            sizes = [float(level["size"]) for level in reversed(book.get("bids") or [])]
+        except (KeyError, TypeError, ValueError):
+            return DEFAULT_BOOK_SIZES
+        return sizes[:10] or DEFAULT_BOOK_SIZES
+
+
+def synthetic_klines(pair: str, count: int = SYNTHETIC_CANDLES) -> List[list]:
+    """Deterministic 1m random walk in /api/v3/klines row format"""
+    rng = random.Random(zlib.crc32(pair.encode()))
+    price = BASE_PRICES.get(pair) or rng.uniform(5.0, 500.0)
+    start = (int(time.time()) // 60 - count) * 60_000
+    rows = []
+    for i in range(count):
+        open_price = price
+        close_price = open_price * (1 + rng.gauss(0, 0.0008))
+        high = max(open_price, close_price) * (1 + abs(rng.gauss(0, 0.0003)))
+        low = min(open_price, close_price) * (1 - abs(rng.gauss(0, 0.0003)))
+        volume = rng.lognormvariate(3.0, 0.6) * 1000.0 / open_price
+        taker_buy = volume * rng.uniform(0.4, 0.6)
+        open_time = start + i * 60_000
+        rows.append(
+            [
+                open_time,
+                f"{open_price:.8f}",
+                f"{high:.8f}",
+                f"{low:.8f}",
+                f"{close_price:.8f}",
+                f"{volume:.8f}",
+                open_time + 59_999,
+                f"{volume * close_price:.8f}",
+                rng.randint(50, 2000),
+                f"{taker_buy:.8f}",
+                f"{taker_buy * close_price:.8f}",
+                "0",
+            ]
+        )
+        price = close_price
+    return rows
+
+
+def record_fixtures(
+    fixtures_dir: str, pairs: List[str], token_id: Optional[str] = None
+) -> List[str]:
+    """
+    Record live Binance klines (and optionally one Polymarket order book)
+    into a fixtures directory. Returns the written file paths.
+    """
+    from src.config.settings import BINANCE_API_BASE, CLOB_HOST
+    from src.utils.http import http_client
+
+    written = []
+    os.makedirs(os.path.join(fixtures_dir, "binance"), exist_ok=True)
+    for pair in pairs:
+        url = f"{BINANCE_API_BASE}/api/v3/klines?symbol={pair}&interval=1m&limit=1000"
+        response = http_client.get(url, timeout=10)
+        response.raise_for_status()
+        path = os.path.join(fixtures_dir, "binance", f"klines_{pair}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(response.json(), f)
+        written.append(path)
+
+    if token_id:
+        os.makedirs(os.path.join(fixtures_dir, "polymarket"), exist_ok=True)
+        response = http_client.get(f"{CLOB_HOST}/book", params={"token_id": token_id})
+        response.raise_for_status()
+        path = os.path.join(fixtures_dir, "polymarket", "book.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(response.json(), f)
+        written.append(path)
+    return written
@@ -0,0 +1,1030 @@
+"""Local HTTP + WebSocket stand-in for the Binance and Polymarket APIs"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import math
+import os
+import random
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
+import websockets
+from .fixtures import FixtureSet
+
+WINDOW_SEC = 900
+INTERVAL_MINUTES = {"m": 1, "h": 60, "d": 1440}
+MAX_UINT256 = str(2**256 - 1)
+END_CURSOR = "LTE="
+
+
+def _fmt(value: float) -> str:
+    return f"{value:.8f}"
+
+
+def _interval_minutes(interval: str) -> int:
+    return int(interval[:-1]) * INTERVAL_MINUTES.get(interval[-1], 1)
+
+
+class _PairReplay:
+    """
+    Replays a pair's recorded 1m candles onto the wall clock. The recording
+    loops, each pass rescaled so it starts where the previous one closed,
+    and the current candle fills in over its minute like a live candle.
+    """
+
+    def __init__(self, rows: List[list]):
+        self.rows = [
+            (
+                float(r[1]),
+                float(r[2]),
+                float(r[3]),
+                float(r[4]),
+                float(r[5]),
+                float(r[7]),
+                int(r[8]),
+                float(r[9]),
+                float(r[10]),
+            )
+            for r in rows
+        ]
+        self.length = len(self.rows)
+        # Last recorded candle lines up with the minute the emulator started
+        self.origin = int(time.time() // 60) - (self.length - 1)
+        self.cycle_ratio = self.rows[-1][3] / self.rows[0][0]
+
+    def candle(self, minute: int, now: float) -> list:
+        """The 1m candle opening at `minute` (epoch minutes) in REST row format"""
+        cycle, idx = divmod(minute - self.origin, self.length)
+        scale = self.cycle_ratio**cycle
+        o, h, l, c, v, q, n, tb, tq = self.rows[idx]
+        o, h, l, c, q, tq = (x * scale for x in (o, h, l, c, q, tq))
+        if minute >= int(now // 60):
+            f = min(max((now - minute * 60) / 60.0, 0.02), 1.0)
+            top, bottom = max(o, c), min(o, c)
+            c = o + (c - o) * f
+            h = max(o, c) + (h - top) * f
+            l = min(o, c) - (bottom - l) * f
+            v, q, tb, tq, n = v * f, q * f, tb * f, tq * f, int(n * f)
+        open_ms = minute * 60_000
+        return [
+            open_ms,
+            _fmt(o),
+            _fmt(h),
+            _fmt(l),
+            _fmt(c),
+            _fmt(v),
+            open_ms + 59_999,
+            _fmt(q),
+            n,
+            _fmt(tb),
+            _fmt(tq),
+            "0",
+        ]
+
+    def price_at(self, ts: float, now: float) -> float:
+        """Last price at a timestamp (close of its minute, or live)"""
+        return float(self.candle(int(min(ts, now) // 60), now)[4])
+
+    def _bucket(self, start: int, size: int, now: float) -> list:
+        current = int(now // 60)
+        rows = [self.candle(m, now) for m in range(start, min(start + size, current + 1))]
+        first, last = rows[0], rows[-1]
+        return [
+            first[0],
+            first[1],
+            _fmt(max(float(r[2]) for r in rows)),
+            _fmt(min(float(r[3]) for r in rows)),
+            last[4],
+            _fmt(sum(float(r[5]) for r in rows)),
+            first[0] + size * 60_000 - 1,
+            _fmt(sum(float(r[7]) for r in rows)),
+            sum(r[8] for r in rows),
+            _fmt(sum(float(r[9]) for r in rows)),
+            _fmt(sum(float(r[10]) for r in rows)),
+            "0",
+        ]
+
+    def klines(
+        self,
+        interval: str,
+        limit: int,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+    ) -> List[list]:
+        now = time.time()
+        size = _interval_minutes(interval)
+        current = int(now // 60)
+        current_bucket = current - current % size
+        if start_ms is not None:
+            first = -(-(start_ms // 60_000) // size) * size
+            buckets = list(range(first, current_bucket + 1, size))[:limit]
+        else:
+            buckets = [current_bucket - (limit - 1 - i) * size for i in range(limit)]
+        if end_ms is not None:
+            buckets = [b for b in buckets if b * 60_000 <= end_ms]
+        return [self._bucket(b, size, now) for b in buckets]
+
+
+class ExchangeEmulator:
+    """
+    Serves the subset of the Binance REST/stream and Polymarket CLOB, Gamma
+    and Data APIs (plus the Polygon RPC balance call and Fear & Greed) that
+    the bot uses, all from one HTTP port and one WebSocket port:
+
+        http://host:port/binance   /api/v3/klines, /api/v3/ticker/price
+        http://host:port/fapi      /fapi/v1/premiumIndex
+        http://host:port/clob      books, prices, orders, auth, balances
+        http://host:port/gamma     /markets/slug/<slug>, /markets?slug=
+        http://host:port/data      /positions, /closed-positions, /trades
+        http://host:port/rpc       Polygon JSON-RPC (USDC balanceOf only)
+        http://host:port/fng/      Fear & Greed index
+        ws://host:ws_port/binance  /stream?streams=<pair>@kline_<i>/<pair>@aggTrade
+        ws://host:ws_port/clob     /ws/market, /ws/user
+
+    Spot prices replay recorded klines; each 15m Up/Down market is priced
+    from the spot move since its window opened and resolves at the close.
+    Orders that cross the emulated book fill immediately; resting orders
+    fill once the book moves through them. Every HTTP request can be delayed
+    (latency_ms +/- jitter_ms, per-service overrides) or failed with a 503
+    (error_rate), and WebSocket connections can be dropped (ws_drop_rate).
+
+    env() also points the bot's logs, trade database and kline store at
+    `workdir` (a fresh temp dir by default), so synthetic fills and candles
+    never reach the production trades.db or logs/klines.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        ws_port: int = 8766,
+        fixtures: Optional[FixtureSet] = None,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        latency_overrides: Optional[Dict[str, float]] = None,
+        error_rate: float = 0.0,
+        ws_drop_rate: float = 0.0,
+        balance: float = 1000.0,
+        workdir: Optional[str] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.ws_port = ws_port
+        self.fixtures = fixtures or FixtureSet()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.latency_overrides = latency_overrides or {}
+        self.error_rate = error_rate
+        self.ws_drop_rate = ws_drop_rate
+        self.workdir = workdir or tempfile.mkdtemp(prefix="polyflup-emulator-")
+
+        self._pairs: Dict[str, _PairReplay] = {}
+        self._tokens: Dict[str, Tuple[str, int, int]] = {}  # token -> (symbol, window ts, outcome)
+        self._book_sizes = self.fixtures.book_sizes()
+        self._lock = threading.RLock()
+
+        # Single emulated account
+        self._cash = balance
+        self._positions: Dict[str, Dict[str, float]] = {}  # token -> size/cost
+        self._orders: Dict[str, dict] = {}
+        self._trades: List[dict] = []
+
+        self._weight_minute = 0
+        self._weight_used = 0
+        self._stats: Dict[str, int] = {}
+
+        self._http: Optional[ThreadingHTTPServer] = None
+        self._ws_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ws_stop: Optional[asyncio.Future] = None
+        self._ws_ready = threading.Event()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Start the HTTP and WebSocket servers in background threads"""
+        emulator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, so pooled client sessions behave as in production
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                emulator._handle_http(self, "GET")
+
+            def do_POST(self):
+                emulator._handle_http(self, "POST")
+
+            def do_DELETE(self):
+                emulator._handle_http(self, "DELETE")
+
+        self._http = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._http.daemon_threads = True
+        threading.Thread(target=self._http.serve_forever, daemon=True).start()
+        threading.Thread(target=self._run_ws, daemon=True).start()
+        self._ws_ready.wait(10)
+
+    def stop(self):
+        if self._http:
+            self._http.shutdown()
+        if self._ws_loop and self._ws_stop:
+            self._ws_loop.call_soon_threadsafe(self._ws_stop.set_result, None)
+
+    def env(self) -> Dict[str, str]:
+        """Environment overrides pointing the bot's endpoints and output files at this emulator"""
+        http = f"http://{self.host}:{self.port}"
+        ws = f"ws://{self.host}:{self.ws_port}"
+        return {
+            "BINANCE_API_BASE": f"{http}/binance",
+            "BINANCE_FAPI_BASE": f"{http}/fapi",
+            "CLOB_HOST": f"{http}/clob",
+            "GAMMA_API_BASE": f"{http}/gamma",
+            "DATA_API_BASE": f"{http}/data",
+            "POLYGON_RPC": f"{http}/rpc",
+            "FEAR_GREED_URL": f"{http}/fng/",
+            "BINANCE_WSS_HOST": f"{ws}/binance",
+            "CLOB_WSS_HOST": f"{ws}/clob",
+            "LOG_DIR": os.path.join(self.workdir, "logs"),
+            "DB_FILE": os.path.join(self.workdir, "trades.db"),
+            "KLINE_STORE_DIR": os.path.join(self.workdir, "klines"),
+        }
+
+    def _count(self, key: str):
+        with self._lock:
+            self._stats[key] = self._stats.get(key, 0) + 1
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def format_stats(self) -> str:
+        return ", ".join(f"{k}={v}" for k, v in sorted(self.get_stats().items()))
+
+    # ------------------------------------------------------------------
+    # Market model
+    # ------------------------------------------------------------------
+
+    def _pair(self, pair: str) -> _PairReplay:
+        with self._lock:
+            replay = self._pairs.get(pair)
+            if replay is None:
+                replay = _PairReplay(self.fixtures.klines(pair))
+                self._pairs[pair] = replay
+            return replay
+
+    @staticmethod
+    def _token_id(slug: str, outcome: int) -> str:
+        digest = hashlib.sha256(f"{slug}:{outcome}".encode()).hexdigest()
+        return str(int(digest, 16) % 10**77)
+
+    @staticmethod
+    def _condition_id(slug: str) -> str:
+        return "0x" + hashlib.sha256(slug.encode()).hexdigest()
+
+    def _resolve_slug(self, slug: str) -> Optional[Tuple[str, int]]:
+        """Parse <symbol>-updown-15m-<ts> and register its tokens"""
+        prefix, _, ts = slug.rpartition("-")
+        if not prefix.endswith("-updown-15m") or not ts.isdigit():
+            return None
+        ts = int(ts)
+        if ts % WINDOW_SEC or ts > time.time() + 86_400:
+            return None
+        symbol = prefix[: -len("-updown-15m")].upper()
+        with self._lock:
+            for outcome in (0, 1):
+                self._tokens[self._token_id(slug, outcome)] = (symbol, ts, outcome)
+        return symbol, ts
+
+    def _p_up(self, symbol: str, ts: int, at: Optional[float] = None) -> float:
+        """Up probability for a window, from the spot move since it opened"""
+        now = time.time()
+        at = now if at is None else at
+        if at < ts:
+            return 0.5
+        replay = self._pair(f"{symbol}USDT")
+        open_price = float(replay.candle(ts // 60, now)[1])
+        current = replay.price_at(min(at, ts + WINDOW_SEC - 1), now)
+        if at >= ts + WINDOW_SEC:
+            return 1.0 if current >= open_price else 0.0
+        move_pct = (current / open_price - 1) * 100.0
+        elapsed = (at - ts) / WINDOW_SEC
+        return 0.5 + 0.49 * math.tanh(move_pct * 5.5 * (1 + 2 * elapsed))
+
+    def _quote(self, token: str) -> Optional[Tuple[float, float]]:
+        """Best bid/ask for a token, or None if unknown or resolved"""
+        info = self._tokens.get(token)
+        if info is None:
+            return None
+        symbol, ts, outcome = info
+        if time.time() >= ts + WINDOW_SEC:
+            return None
+        p = self._p_up(symbol, ts)
+        mid = p if outcome == 0 else 1 - p
+        bid = min(max(math.floor(mid * 100) / 100, 0.01), 0.98)
+        return round(bid, 2), round(bid + 0.01, 2)
+
+    def _book(self, token: str) -> Optional[dict]:
+        quote = self._quote(token)
+        if quote is None:
+            return None
+        bid, ask = quote
+        symbol, ts, _ = self._tokens[token]
+        sizes = self._book_sizes
+        bids = [(bid - 0.01 * i, s) for i, s in enumerate(sizes) if bid - 0.01 * i >= 0.0099]
+        asks = [(ask + 0.01 * i, s) for i, s in enumerate(sizes) if ask + 0.01 * i <= 0.9901]
+        # CLOB convention: best level last on both sides
+        return {
+            "market": self._condition_id(f"{symbol.lower()}-updown-15m-{ts}"),
+            "asset_id": token,
+            "timestamp": str(int(time.time() * 1000)),
+            "hash": uuid.uuid4().hex,
+            "bids": [{"price": f"{p:.2f}", "size": f"{s:.2f}"} for p, s in reversed(bids)],
+            "asks": [{"price": f"{p:.2f}", "size": f"{s:.2f}"} for p, s in reversed(asks)],
+            "min_order_size": "5",
+            "tick_size": "0.01",
+            "neg_risk": False,
+            "last_trade_price": f"{(bid + ask) / 2:.3f}",
+        }
+
+    def _gamma_market(self, slug: str) -> Optional[dict]:
+        resolved = self._resolve_slug(slug)
+        if resolved is None:
+            return None
+        symbol, ts = resolved
+        ended = time.time() >= ts + WINDOW_SEC
+        p = self._p_up(symbol, ts)
+        up, down = self._token_id(slug, 0), self._token_id(slug, 1)
+        quote = self._quote(up)
+        iso = lambda t: datetime.fromtimestamp(t, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        return {
+            "id": str(ts),
+            "slug": slug,
+            "question": f"{symbol} Up or Down - {iso(ts)}",
+            "conditionId": self._condition_id(slug),
+            "clobTokenIds": json.dumps([up, down]),
+            "outcomes": json.dumps(["Up", "Down"]),
+            "outcomePrices": json.dumps(
+                [f"{p:g}", f"{1 - p:g}"] if ended else [f"{p:.3f}", f"{1 - p:.3f}"]
+            ),
+            "bestBid": quote[0] if quote else None,
+            "bestAsk": quote[1] if quote else None,
+            "active": not ended,
+            "closed": ended,
+            "acceptingOrders": not ended,
+            "startDate": iso(ts),
+            "endDate": iso(ts + WINDOW_SEC),
+            "umaResolutionStatus": "resolved" if ended else None,
+            "negRisk": False,
+            "orderPriceMinTickSize": 0.01,
+            "orderMinSize": 5,
+        }
+
+    # ------------------------------------------------------------------
+    # Account / order matching
+    # ------------------------------------------------------------------
+
+    def _fill(self, order: dict) -> bool:
+        """Fill an order against the current book if it crosses"""
+        quote = self._quote(order["asset_id"])
+        if quote is None:
+            return False
+        bid, ask = quote
+        size, price = float(order["original_size"]), float(order["price"])
+        position = self._positions.setdefault(order["asset_id"], {"size": 0.0, "cost": 0.0})
+        if order["side"] == "BUY":
+            if price < ask or size * ask > self._cash + 1e-9:
+                return False
+            fill_price = ask
+            self._cash -= size * ask
+            position["size"] += size
+            position["cost"] += size * ask
+        else:
+            if price > bid or size > position["size"] + 1e-6:
+                return False
+            fill_price = bid
+            avg = position["cost"] / position["size"] if position["size"] else 0.0
+            position["size"] = max(position["size"] - size, 0.0)
+            position["cost"] = avg * position["size"]
+            self._cash += size * bid
+        order["status"] = "MATCHED"
+        order["size_matched"] = order["original_size"]
+        trade = {
+            "id": uuid.uuid4().hex,
+            "taker_order_id": order["id"],
+            "market": order["market"],
+            "asset_id": order["asset_id"],
+            "side": order["side"],
+            "size": order["original_size"],
+            "price": f"{fill_price:.2f}",
+            "status": "CONFIRMED",
+            "match_time": str(int(time.time())),
+            "outcome": order["outcome"],
+        }
+        order["associate_trades"].append(trade["id"])
+        self._trades.append(trade)
+        return True
+
+    def _match_resting(self):
+        with self._lock:
+            for order in self._orders.values():
+                if order["status"] == "LIVE":
+                    self._fill(order)
+
+    def _post_order(self, body: dict) -> Tuple[int, dict]:
+        signed = body.get("order") or {}
+        token = str(signed.get("tokenId", ""))
+        info = self._tokens.get(token)
+        if info is None:
+            return 400, {"success": False, "errorMsg": "market not found", "orderID": ""}
+        side = signed.get("side")
+        side = "BUY" if side in ("BUY", 0, "0") else "SELL"
+        maker, taker = int(signed.get("makerAmount", 0)), int(signed.get("takerAmount", 0))
+        if maker <= 0 or taker <= 0:
+            return 400, {"success": False, "errorMsg": "invalid amounts", "orderID": ""}
+        if side == "BUY":
+            size, price = taker / 1e6, maker / taker
+        else:
+            size, price = maker / 1e6, taker / maker
+        order_type = body.get("orderType", "GTC")
+        symbol, ts, outcome = info
+        with self._lock:
+            held = self._positions.get(token, {}).get("size", 0.0)
+            if (side == "BUY" and size * price > self._cash + 1e-9) or (
+                side == "SELL" and size > held + 1e-6
+            ):
+                return 400, {
+                    "success": False,
+                    "errorMsg": "not enough balance / allowance",
+                    "orderID": "",
+                }
+            order = {
+                "id": "0x" + uuid.uuid4().hex + uuid.uuid4().hex,
+                "status": "LIVE",
+                "owner": body.get("owner", ""),
+                "market": self._condition_id(f"{symbol.lower()}-updown-15m-{ts}"),
+                "asset_id": token,
+                "side": side,
+                "original_size": f"{size:.6f}",
+                "size_matched": "0",
+                "price": f"{price:.4f}",
+                "outcome": "Up" if outcome == 0 else "Down",
+                "order_type": order_type,
+                "created_at": int(time.time()),
+                "associate_trades": [],
+            }
+            filled = self._fill(order)
+            if not filled and order_type in ("FOK", "FAK"):
+                return 400, {
+                    "success": False,
+                    "errorMsg": "order couldn't be fully filled. FOK orders are fully filled or killed.",
+                    "orderID": "",
+                }
+            self._orders[order["id"]] = order
+        return 200, {
+            "success": True,
+            "errorMsg": "",
+            "orderID": order["id"],
+            "status": "matched" if filled else "live",
+            "makingAmount": str(maker / 1e6) if filled else "",
+            "takingAmount": str(taker / 1e6) if filled else "",
+            "transactionsHashes": [],
+        }
+
+    def _cancel(self, order_ids: List[str]) -> dict:
+        canceled, not_canceled = [], {}
+        with self._lock:
+            for order_id in order_ids:
+                order = self._orders.get(order_id)
+                if order and order["status"] == "LIVE":
+                    order["status"] = "CANCELED"
+                    canceled.append(order_id)
+                else:
+                    not_canceled[order_id] = "order not found or already canceled"
+        return {"canceled": canceled, "not_canceled": not_canceled}
+
+    def _position_rows(self, asset_id: Optional[str] = None) -> List[dict]:
+        rows = []
+        with self._lock:
+            for token, position in self._positions.items():
+                if position["size"] <= 0.001 or (asset_id and token != asset_id):
+                    continue
+                symbol, ts, outcome = self._tokens[token]
+                slug = f"{symbol.lower()}-updown-15m-{ts}"
+                quote = self._quote(token)
+                if quote:
+                    cur_price = (quote[0] + quote[1]) / 2
+                else:
+                    p = self._p_up(symbol, ts)
+                    cur_price = p if outcome == 0 else 1 - p
+                rows.append(
+                    {
+                        "asset": token,
+                        "conditionId": self._condition_id(slug),
+                        "size": round(position["size"], 6),
+                        "avgPrice": position["cost"] / position["size"],
+                        "curPrice": cur_price,
+                        "outcome": "Up" if outcome == 0 else "Down",
+                        "slug": slug,
+                        "redeemable": quote is None,
+                    }
+                )
+        return rows
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    def _handle_http(self, request: BaseHTTPRequestHandler, method: str):
+        parts = urlsplit(request.path)
+        service, _, rest = parts.path.lstrip("/").partition("/")
+        route = "/" + rest
+        query_lists = parse_qs(parts.query)
+        query = {k: v[-1] for k, v in query_lists.items()}
+        query["__lists__"] = query_lists
+        length = int(request.headers.get("Content-Length") or 0)
+        raw = request.rfile.read(length) if length else b""
+        try:
+            body = json.loads(raw) if raw else None
+        except ValueError:
+            body = None
+
+        delay = self.latency_overrides.get(service, self.latency_ms)
+        if delay or self.jitter_ms:
+            time.sleep(max(0.0, delay + random.uniform(-self.jitter_ms, self.jitter_ms)) / 1000.0)
+
+        headers: Dict[str, str] = {}
+        if self.error_rate and random.random() < self.error_rate:
+            self._count(f"{service}:injected_error")
+            status, payload = 503, {"error": "injected failure"}
+        else:
+            handler = {
+                "binance": self._binance,
+                "fapi": self._fapi,
+                "clob": self._clob,
+                "gamma": self._gamma,
+                "data": self._data,
+                "rpc": self._rpc,
+                "fng": self._fng,
+            }.get(service)
+            # Collapse per-slug / per-order paths so stats stay one line per endpoint
+            endpoint = route
+            for prefix in ("/markets/slug/", "/data/order/"):
+                if route.startswith(prefix):
+                    endpoint = prefix + "*"
+            self._count(f"{service}:{endpoint}")
+            if handler is None:
+                status, payload = 404, {"error": f"unknown service {service}"}
+            else:
+                try:
+                    result = handler(method, route, query, body)
+                except Exception as e:
+                    result = (500, {"error": str(e)})
+                status, payload = result[0], result[1]
+                if len(result) > 2:
+                    headers = result[2]
+
+        data = json.dumps(payload).encode()
+        request.send_response(status)
+        request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(data)))
+        for key, value in headers.items():
+            request.send_header(key, value)
+        request.end_headers()
+        request.wfile.write(data)
+
+    def _use_weight(self, weight: int) -> Dict[str, str]:
+        minute = int(time.time() // 60)
+        with self._lock:
+            if minute != self._weight_minute:
+                self._weight_minute, self._weight_used = minute, 0
+            self._weight_used += weight
+            return {"X-MBX-USED-WEIGHT-1M": str(self._weight_used)}
+
+    def _binance(self, method, route, query, body):
+        if route == "/api/v3/klines":
+            pair = query.get("symbol", "")
+            limit = min(int(query.get("limit", 500)), 1000)
+            start = int(query["startTime"]) if "startTime" in query else None
+            end = int(query["endTime"]) if "endTime" in query else None
+            weight = 1 if limit < 100 else 2 if limit < 500 else 5
+            rows = self._pair(pair).klines(query.get("interval", "1m"), limit, start, end)
+            return 200, rows, self._use_weight(weight)
+        if route == "/api/v3/ticker/price":
+            now = time.time()
+            if "symbols" in query:
+                pairs = json.loads(query["symbols"])
+                prices = [
+                    {"symbol": p, "price": _fmt(self._pair(p).price_at(now, now))} for p in pairs
+                ]
+                return 200, prices, self._use_weight(4)
+            pair = query.get("symbol", "")
+            price = {"symbol": pair, "price": _fmt(self._pair(pair).price_at(now, now))}
+            return 200, price, self._use_weight(2)
+        if route == "/api/v3/ping":
+            return 200, {}, self._use_weight(1)
+        if route == "/api/v3/time":
+            return 200, {"serverTime": int(time.time() * 1000)}, self._use_weight(1)
+        return 404, {"code": -1, "msg": f"unsupported {route}"}
+
+    def _fapi(self, method, route, query, body):
+        if route == "/fapi/v1/premiumIndex":
+            pair = query.get("symbol", "")
+            now = time.time()
+            return 200, {
+                "symbol": pair,
+                "markPrice": _fmt(self._pair(pair).price_at(now, now)),
+                "lastFundingRate": "0.00010000",
+                "time": int(now * 1000),
+            }
+        return 404, {"code": -1, "msg": f"unsupported {route}"}
+
+    def _fng(self, method, route, query, body):
+        return 200, {
+            "name": "Fear and Greed Index",
+            "data": [{"value": "52", "value_classification": "Neutral", "timestamp": str(int(time.time()))}],
+        }
+
+    def _gamma(self, method, route, query, body):
+        if route.startswith("/markets/slug/"):
+            market = self._gamma_market(route[len("/markets/slug/"):])
+            return (200, market) if market else (404, {"error": "market not found"})
+        if route == "/markets":
+            slugs = query["__lists__"].get("slug", [])
+            return 200, [m for m in (self._gamma_market(s) for s in slugs) if m]
+        return 404, {"error": f"unsupported {route}"}
+
+    def _data(self, method, route, query, body):
+        self._match_resting()
+        if route == "/positions":
+            return 200, self._position_rows(query.get("asset_id"))
+        if route == "/closed-positions":
+            return 200, []
+        if route == "/trades":
+            with self._lock:
+                trades = [
+                    {
+                        "asset": t["asset_id"],
+                        "conditionId": t["market"],
+                        "side": t["side"],
+                        "size": float(t["size"]),
+                        "price": float(t["price"]),
+                        "timestamp": int(t["match_time"]),
+                        "outcome": t["outcome"],
+                    }
+                    for t in reversed(self._trades)
+                ]
+            return 200, trades
+        return 404, {"error": f"unsupported {route}"}
+
+    def _paginated(self, rows: List[dict]) -> dict:
+        return {"data": rows, "next_cursor": END_CURSOR, "limit": len(rows), "count": len(rows)}
+
+    def _clob(self, method, route, query, body):
+        token = query.get("token_id") or query.get("market", "")
+        if route == "/" or route == "":
+            return 200, "OK"
+        if route == "/time":
+            return 200, int(time.time())
+        if route in ("/auth/api-key", "/auth/derive-api-key"):
+            return 200, {
+                "apiKey": str(uuid.uuid4()),
+                "secret": base64.urlsafe_b64encode(hashlib.sha256(b"emulator").digest()).decode(),
+                "passphrase": uuid.uuid4().hex,
+            }
+        if route == "/auth/ban-status/closed-only":
+            return 200, {"closed_only": False}
+        if route == "/tick-size":
+            return 200, {"minimum_tick_size": 0.01}
+        if route == "/neg-risk":
+            return 200, {"neg_risk": False}
+        if route == "/fee-rate":
+            return 200, {"base_fee": 0}
+        if route == "/book":
+            book = self._book(token)
+            return (200, book) if book else (404, {"error": "No orderbook exists for the requested token id"})
+        if route == "/books":
+            books = [self._book(str(p.get("token_id"))) for p in body or []]
+            return 200, [b for b in books if b]
+        if route in ("/midpoint", "/spread", "/price", "/last-trade-price"):
+            quote = self._quote(token)
+            if quote is None:
+                return 404, {"error": "No orderbook exists for the requested token id"}
+            bid, ask = quote
+            return 200, {
+                "/midpoint": {"mid": f"{(bid + ask) / 2:.3f}"},
+                "/spread": {"spread": f"{ask - bid:.2f}"},
+                "/price": {"price": f"{ask if query.get('side') == 'BUY' else bid:.2f}"},
+                "/last-trade-price": {"price": f"{(bid + ask) / 2:.3f}", "side": "BUY"},
+            }[route]
+        if route in ("/midpoints", "/spreads"):
+            result = {}
+            for p in body or []:
+                quote = self._quote(str(p.get("token_id")))
+                if quote:
+                    bid, ask = quote
+                    value = (bid + ask) / 2 if route == "/midpoints" else ask - bid
+                    result[str(p.get("token_id"))] = f"{value:.3f}"
+            return 200, result
+        if route == "/prices-history":
+            info = self._tokens.get(token)
+            if info is None:
+                return 200, {"history": []}
+            symbol, ts, outcome = info
+            now = time.time()
+            points = []
+            for t in range(max(ts, int(now) - 3600), int(min(now, ts + WINDOW_SEC)) + 1, 60):
+                p = self._p_up(symbol, ts, at=t)
+                points.append({"t": t, "p": round(p if outcome == 0 else 1 - p, 4)})
+            return 200, {"history": points}
+        if route == "/order" and method == "POST":
+            return self._post_order(body or {})
+        if route == "/orders" and method == "POST":
+            results = [self._post_order(item)[1] for item in body or []]
+            return 200, results
+        if route == "/order" and method == "DELETE":
+            return 200, self._cancel([(body or {}).get("orderID", "")])
+        if route == "/orders" and method == "DELETE":
+            return 200, self._cancel(list(body or []))
+        if route == "/cancel-all":
+            with self._lock:
+                live = [oid for oid, o in self._orders.items() if o["status"] == "LIVE"]
+            return 200, self._cancel(live)
+        if route == "/cancel-market-orders":
+            params = body or {}
+            with self._lock:
+                live = [
+                    oid
+                    for oid, o in self._orders.items()
+                    if o["status"] == "LIVE"
+                    and (not params.get("asset_id") or o["asset_id"] == params["asset_id"])
+                    and (not params.get("market") or o["market"] == params["market"])
+                ]
+            return 200, self._cancel(live)
+        if route.startswith("/data/order/"):
+            self._match_resting()
+            with self._lock:
+                order = self._orders.get(route[len("/data/order/"):])
+                return (200, dict(order)) if order else (404, {"error": "order not found"})
+        if route == "/data/orders":
+            self._match_resting()
+            with self._lock:
+                rows = [
+                    dict(o)
+                    for o in self._orders.values()
+                    if o["status"] == "LIVE"
+                    and query.get("id") in (None, o["id"])
+                    and query.get("market") in (None, o["market"])
+                    and query.get("asset_id") in (None, o["asset_id"])
+                ]
+            return 200, self._paginated(rows)
+        if route == "/data/trades":
+            with self._lock:
+                return 200, self._paginated(list(reversed(self._trades)))
+        if route == "/balance-allowance":
+            self._match_resting()
+            with self._lock:
+                if query.get("asset_type") == "CONDITIONAL":
+                    amount = self._positions.get(query.get("token_id", ""), {}).get("size", 0.0)
+                else:
+                    amount = self._cash
+            return 200, {"balance": str(int(amount * 1e6)), "allowance": MAX_UINT256}
+        if route == "/balance-allowance/update":
+            return 200, {}
+        if route == "/notifications":
+            return 200, [] if method == "GET" else None
+        if route == "/order-scoring":
+            return 200, {"scoring": False}
+        if route == "/orders-scoring":
+            return 200, {order_id: False for order_id in body or []}
+        return 404, {"error": f"unsupported {route}"}
+
+    def _rpc(self, method, route, query, body):
+        def answer(call: dict) -> dict:
+            name, params = call.get("method"), call.get("params") or []
+            reply = {"jsonrpc": "2.0", "id": call.get("id")}
+            if name == "eth_chainId":
+                reply["result"] = hex(137)
+            elif name == "net_version":
+                reply["result"] = "137"
+            elif name == "eth_blockNumber":
+                reply["result"] = hex(int(time.time()))
+            elif name == "eth_call":
+                data = (params[0] or {}).get("data") or (params[0] or {}).get("input") or ""
+                # balanceOf(address) on the USDC contract reports the emulated cash
+                amount = int(self._cash * 1e6) if data.startswith("0x70a08231") else 0
+                reply["result"] = "0x" + format(amount, "064x")
+            elif name in ("eth_getBalance", "eth_getTransactionCount"):
+                reply["result"] = "0x0"
+            elif name == "eth_gasPrice":
+                reply["result"] = hex(30 * 10**9)
+            else:
+                reply["error"] = {"code": -32601, "message": f"{name} not supported by emulator"}
+            return reply
+
+        if isinstance(body, list):
+            return 200, [answer(call) for call in body]
+        return 200, answer(body or {})
+
+    # ------------------------------------------------------------------
+    # WebSocket
+    # ------------------------------------------------------------------
+
+    def _run_ws(self):
+        self._ws_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._ws_loop)
+
+        async def serve():
+            self._ws_stop = self._ws_loop.create_future()
+            async with websockets.serve(self._ws_handler, self.host, self.ws_port):
+                self._ws_ready.set()
+                await self._ws_stop
+
+        self._ws_loop.run_until_complete(serve())
+
+    async def _ws_handler(self, ws, path: Optional[str] = None):
+        path = path or ws.request.path
+        parts = urlsplit(path)
+        self._count(f"ws:{parts.path}")
+        try:
+            if parts.path == "/binance/stream":
+                streams = parse_qs(parts.query).get("streams", [""])[0].split("/")
+                await self._binance_stream(ws, [s for s in streams if "@" in s])
+            elif parts.path == "/clob/ws/market":
+                await self._clob_market_stream(ws)
+            elif parts.path == "/clob/ws/user":
+                async for message in ws:
+                    if message == "PING":
+                        await ws.send("PONG")
+            else:
+                await ws.close(code=1008, reason="unknown stream")
+        except websockets.ConnectionClosed:
+            pass
+
+    def _should_drop(self) -> bool:
+        if self.ws_drop_rate and random.random() < self.ws_drop_rate:
+            self._count("ws:injected_drop")
+            return True
+        return False
+
+    async def _binance_stream(self, ws, streams: List[str]):
+        last_open: Dict[str, int] = {}
+        while True:
+            now = time.time()
+            for name in streams:
+                pair, _, kind = name.partition("@")
+                pair = pair.upper()
+                replay = self._pair(pair)
+                if kind == "aggTrade":
+                    data = {
+                        "e": "aggTrade",
+                        "E": int(now * 1000),
+                        "s": pair,
+                        "p": _fmt(replay.price_at(now, now)),
+                        "q": "0.01000000",
+                        "T": int(now * 1000),
+                        "m": False,
+                    }
+                    await ws.send(json.dumps({"stream": name, "data": data}))
+                    continue
+                interval = kind[len("kline_"):]
+                size = _interval_minutes(interval)
+                rows = replay.klines(interval, 2)
+                pushes = []
+                if name in last_open and rows[-1][0] != last_open[name]:
+                    pushes.append((rows[-2], True))  # Final push of the candle that just closed
+                pushes.append((rows[-1], False))
+                last_open[name] = rows[-1][0]
+                for row, closed in pushes:
+                    k = {
+                        "t": row[0],
+                        "T": row[0] + size * 60_000 - 1,
+                        "s": pair,
+                        "i": interval,
+                        "o": row[1],
+                        "h": row[2],
+                        "l": row[3],
+                        "c": row[4],
+                        "v": row[5],
+                        "n": row[8],
+                        "x": closed,
+                        "q": row[7],
+                        "V": row[9],
+                        "Q": row[10],
+                    }
+                    data = {"e": "kline", "E": int(now * 1000), "s": pair, "k": k}
+                    await ws.send(json.dumps({"stream": name, "data": data}))
+            if self._should_drop():
+                await ws.close()
+                return
+            await asyncio.sleep(1.0)
+
+    def _book_levels(self, token: str) -> Dict[Tuple[str, str], str]:
+        book = self._book(token)
+        if book is None:
+            return {}
+        levels = {("BUY", l["price"]): l["size"] for l in book["bids"]}
+        levels.update({("SELL", l["price"]): l["size"] for l in book["asks"]})
+        return levels
+
+    @staticmethod
+    def _best(levels: Dict[Tuple[str, str], str]) -> Tuple[str, str]:
+        bids = [float(p) for (side, p) in levels if side == "BUY"]
+        asks = [float(p) for (side, p) in levels if side == "SELL"]
+        return (
+            f"{max(bids):.2f}" if bids else "0",
+            f"{min(asks):.2f}" if asks else "0",
+        )
+
+    def _price_changes(self, token: str, old: dict, new: dict) -> List[dict]:
+        """Level deltas from old to new, each with the best bid/ask after it"""
+        removed = [k for k in old if k not in new]
+        updated = [k for k in new if old.get(k) != new[k]]
+        # Removals first so the book never crosses mid-update
+        current = dict(old)
+        changes = []
+        for key in removed + updated:
+            size = new.get(key, "0")
+            if size == "0":
+                current.pop(key, None)
+            else:
+                current[key] = size
+            best_bid, best_ask = self._best(current)
+            changes.append(
+                {
+                    "asset_id": token,
+                    "price": key[1],
+                    "size": size,
+                    "side": key[0],
+                    "hash": uuid.uuid4().hex,
+                    "best_bid": best_bid,
+                    "best_ask": best_ask,
+                }
+            )
+        return changes
+
+    async def _clob_market_stream(self, ws):
+        sent: Dict[str, dict] = {}  # token -> levels last sent to this client
+
+        async def receive():
+            async for message in ws:
+                if message == "PING":
+                    await ws.send("PONG")
+                    continue
+                try:
+                    request = json.loads(message)
+                except ValueError:
+                    continue
+                assets = {str(a) for a in request.get("assets_ids") or []}
+                if request.get("operation") == "unsubscribe":
+                    for token in assets:
+                        sent.pop(token, None)
+                    continue
+                # New subscriptions start with a full book snapshot
+                snapshots = []
+                for token in assets:
+                    book = self._book(token)
+                    sent[token] = self._book_levels(token)
+                    if book:
+                        snapshots.append(dict(book, event_type="book"))
+                if snapshots:
+                    await ws.send(json.dumps(snapshots))
+
+        async def push():
+            while True:
+                await asyncio.sleep(1.0)
+                self._match_resting()
+                events = []
+                for token in list(sent):
+                    levels = self._book_levels(token)
+                    changes = self._price_changes(token, sent[token], levels)
+                    sent[token] = levels
+                    if changes:
+                        events.append(
+                            {
+                                "event_type": "price_change",
+                                "market": self._book(token)["market"] if levels else "",
+                                "price_changes": changes,
+                                "timestamp": str(int(time.time() * 1000)),
+                            }
+                        )
+                if events:
+                    await ws.send(json.dumps(events))
+                if self._should_drop():
+                    await ws.close()
+                    return
+
+        tasks = [asyncio.ensure_future(receive()), asyncio.ensure_future(push())]
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
@@ -24,6 +24,7 @@ from .market_info import (
     get_midpoint,
     get_multiple_market_prices,
     get_tick_size,
+    warm_order_params,
     get_spread,
     get_bulk_spreads,
     get_server_time,
@@ -46,6 +47,7 @@ __all__ = [
     "get_order_status",
     "get_midpoint",
     "get_tick_size",
+    "warm_order_params",
     "get_spread",
     "get_bulk_spreads",
     "get_multiple_market_prices",
@@ -13,6 +13,7 @@ from src.trading.orders import get_balance_allowance, get_current_positions
 from src.trading.orders.utils import normalize_token_id
 from src.config.settings import DATA_API_BASE
 import requests
+from src.utils.http import http_client
 
 
 # Symbol-specific tolerance settings for API reliability issues
@@ -125,7 +126,7 @@ def get_position_from_data_api(
 
         # Removed POSITION API CALL debug spam - was causing excessive logging
 
-        resp = requests.get(url, timeout=15)  # Longer timeout for reliability
+        resp = http_client.get(url, timeout=15)  # Longer timeout for reliability
         resp.raise_for_status()
         data = resp.json()
 
@@ -157,7 +158,7 @@ def get_actual_positions_from_data_api(user_address: str) -> List[Dict[str, Any]
     """
     try:
         url = f"{DATA_API_BASE}/positions?user={user_address}"
-        resp = requests.get(url, timeout=15)
+        resp = http_client.get(url, timeout=15)
         resp.raise_for_status()
         data = resp.json()
 
@@ -4,6 +4,7 @@ import time
 from typing import List, Dict, Optional, Any
 from py_clob_client.clob_types import BookParams, TradeParams
 from src.utils.logger import log
+from src.utils.websocket_manager import ws_manager
 from .client import client
 from .utils import is_404_error
 
@@ -86,8 +87,21 @@ def get_tick_size(token_id: str) -> float:
         return MIN_TICK_SIZE
 
 
+def warm_order_params(token_id: str) -> None:
+    """Prime the CLOB client's tick size and neg-risk caches for a token"""
+    try:
+        client.get_tick_size(token_id)
+        client.get_neg_risk(token_id)
+    except Exception as e:
+        if not is_404_error(e):
+            log(f"⚠️  Error pre-warming order params for {token_id[:10]}...: {e}")
+
+
 def get_spread(token_id: str) -> Optional[float]:
-    """Get the spread for a token"""
+    """Get the spread for a token (local WebSocket book first, then REST)"""
+    local_spread = ws_manager.get_book_spread(token_id)
+    if local_spread is not None:
+        return local_spread
     try:
         result: Any = client.get_spread(token_id)
         if isinstance(result, dict):
@@ -106,13 +120,23 @@ def get_spread(token_id: str) -> Optional[float]:
 
 
 def get_bulk_spreads(token_ids: List[str]) -> Dict[str, float]:
-    """Get spreads for multiple tokens in a single call"""
+    """
+    Get spreads for multiple tokens, from the local WebSocket books where
+    they are in sync and a single REST call for the rest
+    """
     if not token_ids:
         return {}
+    result = {}
+    for tid in token_ids:
+        spread = ws_manager.get_book_spread(tid)
+        if spread is not None:
+            result[str(tid)] = spread
+    token_ids = [tid for tid in token_ids if str(tid) not in result]
+    if not token_ids:
+        return result
     try:
         params = [BookParams(token_id=str(tid)) for tid in token_ids]
         resp: Any = client.get_spreads(params)
-        result = {}
         if isinstance(resp, dict):
             for tid, val in resp.items():
                 if val is not None:
@@ -135,7 +159,7 @@ def get_bulk_spreads(token_ids: List[str]) -> Dict[str, float]:
     except Exception as e:
         if not is_404_error(e):
             log(f"⚠️  Error getting bulk spreads: {e}")
-        return {}
+        return result
 
 
 def get_server_time() -> Optional[int]:
@@ -174,7 +198,7 @@ def get_trades_for_user(
     """Get trade history for a specific user from Data API"""
     try:
         from src.config.settings import DATA_API_BASE
-        import requests
+        from src.utils.http import http_client
 
         url = f"{DATA_API_BASE}/trades?user={user}"
         if market:
@@ -184,7 +208,7 @@ def get_trades_for_user(
         if limit:
             url += f"&limit={limit}"
 
-        resp = requests.get(url, timeout=10)
+        resp = http_client.get(url, timeout=10)
         resp.raise_for_status()
         data = resp.json()
         if isinstance(data, list):
@@ -1,10 +1,10 @@
 """Position and balance management"""
 
 from typing import Optional, List, Any
-import requests
 from py_clob_client.clob_types import BalanceAllowanceParams, AssetType
 from src.utils.logger import log
 from src.config.settings import DATA_API_BASE
+from src.utils.http import http_client
 from .client import client
 from .constants import SELL
 from .market import place_market_order
@@ -47,7 +47,7 @@ def get_current_positions(user_address: str) -> List[dict]:
         url = f"{DATA_API_BASE}/positions?user={user_address}"
         log(f"   🔍 Fetching positions from Data API for {user_address[:10]}...")
 
-        resp = requests.get(url, timeout=10)
+        resp = http_client.get(url, timeout=10)
         resp.raise_for_status()
         data = resp.json()
 
@@ -80,7 +80,7 @@ def get_closed_positions(user: str, limit: int = 100) -> List[dict]:
         if limit:
             url += f"&limit={limit}"
 
-        resp = requests.get(url, timeout=10)
+        resp = http_client.get(url, timeout=10)
         resp.raise_for_status()
         data = resp.json()
         if isinstance(data, list):
@@ -10,6 +10,7 @@ from .stats import get_exit_plan_stats
 from .monitor import check_open_positions
 from .entry import execute_first_entry
 from .reversal import check_and_trigger_reversal
+from .stop_loss_events import init_stop_loss_events
 
 __all__ = [
     "sync_orders_with_exchange",
@@ -20,4 +21,5 @@ __all__ = [
     "check_open_positions",
     "execute_first_entry",
     "check_and_trigger_reversal",
+    "init_stop_loss_events",
 ]
@@ -21,6 +21,7 @@ from .shared import _scale_in_order_lock
 from .reconciliation import safe_cancel_order, is_recently_filled, track_recent_fill
 from .pnl import _get_position_pnl
 from .stop_loss import _check_stop_loss
+from .stop_loss_events import watch_position_triggers
 from .scale import _check_scale_in
 from .exit import _check_exit_plan
 
@@ -40,6 +41,11 @@ def check_open_positions(verbose=True, check_orders=False, user_address=None):
                 (now.isoformat(),),
             )
             open_positions = c.fetchall()
+            # Keep the tick-driven triggers watching exactly these positions
+            watch_position_triggers(
+                ((p[0], p[3], p[5], p[14], p[9], p[16], p[17]) for p in open_positions),
+                user_address,
+            )
             if not open_positions:
                 if verbose:
                     log("💤 No open positions. Monitoring markets...")
@@ -48,15 +54,12 @@ def check_open_positions(verbose=True, check_orders=False, user_address=None):
             # PRIORITY 1: Batch price fetching
             token_ids = list(set([str(p[3]) for p in open_positions if p[3]]))
 
-            # Try to get prices from WS cache first
-            cached_prices = {}
-            missing_tokens = []
-            for tid in token_ids:
-                price = ws_manager.get_price(tid)
-                if price:
-                    cached_prices[tid] = price
-                else:
-                    missing_tokens.append(tid)
+            # Try to get prices from WS cache first (one consistent snapshot per token)
+            snapshots = ws_manager.snapshot(token_ids)
+            cached_prices = {
+                tid: snap.price for tid, snap in snapshots.items() if snap.price
+            }
+            missing_tokens = [tid for tid in token_ids if tid not in cached_prices]
 
             # Fetch missing prices in batch
             if missing_tokens:
@@ -112,11 +115,11 @@ def check_open_positions(verbose=True, check_orders=False, user_address=None):
 
                         if b_status in ["FILLED", "MATCHED"]:
                             # Filled/Matched positions with PnL
-                            pnl_pct = _get_position_pnl(tok, entry, size)
+                            pnl_pct = _get_position_pnl(tok, entry, size, cached_prices)
 
                             # Build aligned position details with trade ID, scaled-in and exit plan status
                             # Use fixed width formatting for consistent alignment
-                            pnl_result = _get_position_pnl(tok, entry, size)
+                            pnl_result = _get_position_pnl(tok, entry, size, cached_prices)
                             if (
                                 pnl_result
                                 and isinstance(pnl_result, dict)
@@ -168,7 +171,7 @@ def check_open_positions(verbose=True, check_orders=False, user_address=None):
 
                         if b_status in ["FILLED", "MATCHED"]:
                             # Get PnL data
-                            pnl_result = _get_position_pnl(tok, entry, size)
+                            pnl_result = _get_position_pnl(tok, entry, size, cached_prices)
                             if (
                                 pnl_result
                                 and isinstance(pnl_result, dict)
@@ -18,6 +18,7 @@ from src.trading import (
     _determine_trade_side,
     get_clob_client,
 )
+from .triggers import stop_loss_trigger
 
 
 def _trigger_price_based_reversal(
@@ -151,7 +152,7 @@ def check_and_trigger_reversal(
         return False
 
     # Dynamic trigger based on entry price with minimum headroom
-    dynamic_trigger = min(STOP_LOSS_PRICE, entry_price - 0.10)
+    dynamic_trigger = stop_loss_trigger(entry_price)
 
     # If price is above trigger, no action needed
     if current_price > dynamic_trigger:
@@ -6,7 +6,6 @@ from zoneinfo import ZoneInfo
 from src.config.settings import (
     ENABLE_STOP_LOSS,
     STOP_LOSS_PERCENT,
-    STOP_LOSS_PRICE,
     ENABLE_HEDGED_REVERSAL,
 )
 from src.utils.logger import log, log_error, send_discord
@@ -24,6 +23,7 @@ from src.data.market_data import (
 )
 from src.trading import calculate_confidence
 from .reversal import check_and_trigger_reversal
+from .triggers import CRITICAL_FLOOR_PRICE, stop_loss_trigger
 
 
 def _check_stop_loss(
@@ -63,7 +63,7 @@ def _check_stop_loss(
 
     # STOP LOSS / REVERSAL TRIGGER: Dynamic Headroom
     # We use the $0.30 floor, but ensure at least $0.10 headspace for low-priced entries
-    dynamic_trigger = min(STOP_LOSS_PRICE, entry_price - 0.10)
+    dynamic_trigger = stop_loss_trigger(entry_price)
 
     # If price is above trigger, no action needed
     if current_price > dynamic_trigger or size == 0:
@@ -87,7 +87,7 @@ def _check_stop_loss(
 
     # HEDGED STOP LOSS LOGIC (Triple Check)
     # 1. Immediate Price Floor
-    if current_price <= 0.15:
+    if current_price <= CRITICAL_FLOOR_PRICE:
         log(
             f"🛑 [{symbol}] #{trade_id} CRITICAL FLOOR hit (${current_price:.2f}). Executing immediate stop loss."
         )
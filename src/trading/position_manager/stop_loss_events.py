@@ -0,0 +1,212 @@
+"""Event-driven stop loss and scale-in: evaluate positions as soon as a WebSocket tick crosses one of their triggers"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+from src.config.settings import STOP_LOSS_EVENT_DEBOUNCE_SEC
+from src.data.db_connection import db_connection
+from src.utils.logger import log, log_error
+from src.utils.websocket_manager import ws_manager
+from .shared import _position_check_lock
+from .pnl import _get_position_pnl
+from .stop_loss import _check_stop_loss
+from .scale import _check_scale_in
+from .triggers import SCALE_IN, TriggerIndex, position_triggers, stop_loss_trigger
+
+# Give up on an event if the polling pass holds the lock longer than this;
+# that pass (or the next one, at most 1s later) covers the position anyway
+LOCK_TIMEOUT_SEC = 2.0
+
+_index = TriggerIndex()
+_last_tick: Dict[str, float] = {}  # token_id -> previous tick price
+_user_address: Optional[str] = None
+_pending: Set[Tuple[str, str]] = set()  # (token_id, "stop_loss" | "scale_in")
+_last_evaluated: Dict[Tuple[str, str], float] = {}
+_state_lock = threading.Lock()
+# One worker: evaluations place orders and write the DB, so they never overlap
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stop-loss")
+
+
+def watch_position_triggers(positions: Iterable[tuple], user_address: Optional[str]):
+    """
+    Rebuild the trigger index from (trade_id, token_id, entry_price,
+    order_status, scaled_in, scale_in_order_id, reversal_triggered) of the
+    open positions seen by the latest polling pass
+    """
+    global _user_address
+    _index.rebuild(
+        (str(token_id), trigger)
+        for trade_id, token_id, entry, status, sc_in, sc_id, rev_trig in positions
+        if token_id and status in ("FILLED", "MATCHED")
+        for trigger in position_triggers(trade_id, entry, sc_in, sc_id, rev_trig)
+    )
+    if user_address:
+        _user_address = user_address
+
+
+def _on_price_tick(token_id: str, price: float):
+    """
+    WebSocket price callback: queue an evaluation for the triggers this tick
+    crossed. A price that stays beyond a trigger is left to the 1s poll,
+    which also handles the reversal cooldown and hedge confirmation.
+    """
+    if token_id not in _index:
+        _last_tick.pop(token_id, None)
+        return
+    last = _last_tick.get(token_id)
+    _last_tick[token_id] = price
+    crossed = _index.crossed(token_id, last, price)
+    if not crossed:
+        return
+    kinds = {"scale_in" if t.kind == SCALE_IN else "stop_loss" for t in crossed}
+    now = time.monotonic()
+    for kind in kinds:
+        key = (token_id, kind)
+        with _state_lock:
+            if key in _pending:
+                continue
+            if now - _last_evaluated.get(key, 0.0) < STOP_LOSS_EVENT_DEBOUNCE_SEC:
+                continue
+            _pending.add(key)
+            _last_evaluated[key] = now
+        _executor.submit(_evaluate_token, token_id, kind, price)
+
+
+def _evaluate_token(token_id: str, kind: str, tick_price: float):
+    """Run the stop loss or scale-in check for every filled open position on the token"""
+    try:
+        if not _position_check_lock.acquire(timeout=LOCK_TIMEOUT_SEC):
+            return
+        try:
+            if kind == "scale_in":
+                _scale_in_token_positions(token_id, tick_price)
+            else:
+                _check_token_positions(token_id, tick_price)
+        finally:
+            _position_check_lock.release()
+    except Exception as e:
+        log_error(f"Event {kind.replace('_', ' ')} error for {token_id[:10]}...: {e}")
+    finally:
+        with _state_lock:
+            _pending.discard((token_id, kind))
+
+
+def _check_token_positions(token_id: str, tick_price: float):
+    # Latest price at evaluation time; the tick itself if the snapshot is gone
+    price = ws_manager.get_price(token_id) or tick_price
+    with db_connection() as conn:
+        c = conn.cursor()
+        now = datetime.now(tz=ZoneInfo("UTC"))
+        c.execute(
+            "SELECT id, symbol, side, entry_price, size, is_reversal, target_price, limit_sell_order_id, order_status, scale_in_order_id, reversal_triggered, reversal_triggered_at FROM trades WHERE token_id = ? AND settled = 0 AND exited_early = 0 AND order_status IN ('FILLED', 'MATCHED') AND datetime(window_end) > datetime(?)",
+            (token_id, now.isoformat()),
+        )
+        for (
+            tid,
+            sym,
+            side,
+            entry,
+            size,
+            rev,
+            target,
+            l_sell,
+            b_status,
+            sc_id,
+            rev_trig,
+            rev_trig_at,
+        ) in c.fetchall():
+            if price > stop_loss_trigger(entry):
+                continue
+            pnl_i = _get_position_pnl(token_id, entry, size, {token_id: price})
+            if not pnl_i:
+                continue
+            log(
+                f"⚡ [{sym}] #{tid} {side} tick ${price:.2f} crossed stop trigger - evaluating now"
+            )
+            _check_stop_loss(
+                _user_address,
+                sym,
+                tid,
+                token_id,
+                side,
+                entry,
+                size,
+                pnl_i["pnl_pct"],
+                pnl_i["pnl_usd"],
+                pnl_i["current_price"],
+                target,
+                l_sell,
+                rev,
+                c,
+                conn,
+                now,
+                b_status,
+                sc_id,
+                rev_trig,
+                rev_trig_at,
+            )
+
+
+def _scale_in_token_positions(token_id: str, tick_price: float):
+    """_check_scale_in for positions on the token that have not scaled in yet"""
+    price = ws_manager.get_price(token_id) or tick_price
+    with db_connection() as conn:
+        c = conn.cursor()
+        now = datetime.now(tz=ZoneInfo("UTC"))
+        c.execute(
+            "SELECT id, symbol, side, entry_price, size, bet_usd, window_end, scaled_in, scale_in_order_id, order_status, edge, target_price FROM trades WHERE token_id = ? AND settled = 0 AND exited_early = 0 AND scaled_in = 0 AND scale_in_order_id IS NULL AND order_status IN ('FILLED', 'MATCHED') AND datetime(window_end) > datetime(?)",
+            (token_id, now.isoformat()),
+        )
+        for (
+            tid,
+            sym,
+            side,
+            entry,
+            size,
+            bet,
+            w_end,
+            sc_in,
+            sc_id,
+            b_status,
+            edge,
+            target,
+        ) in c.fetchall():
+            pnl_i = _get_position_pnl(token_id, entry, size, {token_id: price})
+            if not pnl_i:
+                continue
+            try:
+                w_dt = (
+                    datetime.fromisoformat(w_end) if isinstance(w_end, str) else w_end
+                )
+                t_left = (w_dt - now).total_seconds()
+            except:
+                t_left = 0
+            # Same gates as the poll (time left, price band, winning side)
+            _check_scale_in(
+                sym,
+                tid,
+                token_id,
+                entry,
+                size,
+                bet,
+                sc_in,
+                sc_id,
+                t_left,
+                pnl_i["current_price"],
+                False,
+                c,
+                conn,
+                side,
+                pnl_i["price_change_pct"],
+                b_status,
+                confidence=edge,
+                target_price=target,
+            )
+
+
+def init_stop_loss_events():
+    """Register the tick callback that drives event-driven stop loss and scale-in"""
+    ws_manager.register_callback("price", _on_price_tick)
@@ -0,0 +1,122 @@
+"""Sorted per-token index of position trigger prices for tick-driven checks"""
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from src.config.settings import (
+    ENABLE_SCALE_IN,
+    SCALE_IN_MIN_PRICE,
+    SCALE_IN_MAX_PRICE,
+    STOP_LOSS_PRICE,
+)
+
+CRITICAL_FLOOR_PRICE = 0.15  # Stop loss skips the hedge cooldown at or below this
+
+# Trigger kinds
+REVERSAL = "reversal"
+STOP_LOSS = "stop_loss"
+CRITICAL_FLOOR = "critical_floor"
+SCALE_IN = "scale_in"
+
+DOWN, UP = -1, 1
+
+
+class Trigger(NamedTuple):
+    price: float
+    direction: int  # DOWN fires when a tick falls to/through price, UP when it rises
+    kind: str
+    trade_id: int
+
+
+def stop_loss_trigger(entry_price: float) -> float:
+    """Dynamic stop loss / reversal trigger ($0.10 headroom under the entry)"""
+    return min(STOP_LOSS_PRICE, entry_price - 0.10)
+
+
+def position_triggers(
+    trade_id: int,
+    entry_price: float,
+    scaled_in: bool = False,
+    scale_in_order_id: Optional[str] = None,
+    reversal_triggered: bool = False,
+) -> List[Trigger]:
+    """Price levels at which a filled position needs a stop loss, reversal or scale-in check"""
+    trigger = stop_loss_trigger(entry_price or 0.0)
+    if not reversal_triggered:
+        triggers = [Trigger(trigger, DOWN, REVERSAL, trade_id)]
+    else:
+        triggers = [
+            Trigger(trigger, DOWN, STOP_LOSS, trade_id),
+            Trigger(CRITICAL_FLOOR_PRICE, DOWN, CRITICAL_FLOOR, trade_id),
+        ]
+    if ENABLE_SCALE_IN and not scaled_in and not scale_in_order_id:
+        # Entering the band from either side
+        triggers.append(Trigger(SCALE_IN_MIN_PRICE, UP, SCALE_IN, trade_id))
+        triggers.append(Trigger(SCALE_IN_MAX_PRICE, DOWN, SCALE_IN, trade_id))
+    return triggers
+
+
+class TriggerIndex:
+    """
+    Trigger prices per token, kept as sorted arrays for each direction, so a
+    tick from `last` to `price` finds exactly the triggers it crossed with
+    two bisects: O(log n + crossed) however many positions are open.
+
+    rebuild() swaps in a whole new mapping, so the WebSocket thread reading
+    crossed() never sees a half-built index.
+    """
+
+    def __init__(self):
+        # token_id -> (down prices, down triggers, up prices, up triggers)
+        self._tokens: Dict[
+            str, Tuple[List[float], List[Trigger], List[float], List[Trigger]]
+        ] = {}
+
+    def rebuild(self, triggers: Iterable[Tuple[str, Trigger]]) -> None:
+        """Replace the index with (token_id, trigger) pairs"""
+        by_token: Dict[str, Tuple[List[Trigger], List[Trigger]]] = {}
+        for token_id, trigger in triggers:
+            down, up = by_token.setdefault(str(token_id), ([], []))
+            (down if trigger.direction == DOWN else up).append(trigger)
+        tokens = {}
+        for token_id, (down, up) in by_token.items():
+            down.sort()
+            up.sort()
+            tokens[token_id] = (
+                [t.price for t in down],
+                down,
+                [t.price for t in up],
+                up,
+            )
+        self._tokens = tokens
+
+    def __contains__(self, token_id: str) -> bool:
+        return token_id in self._tokens
+
+    def __len__(self) -> int:
+        return sum(len(e[1]) + len(e[3]) for e in self._tokens.values())
+
+    def crossed(
+        self, token_id: str, last: Optional[float], price: float
+    ) -> List[Trigger]:
+        """
+        Triggers crossed by a move from `last` to `price`. With no previous
+        tick, every trigger the price is already beyond counts as crossed.
+        """
+        entry = self._tokens.get(token_id)
+        if entry is None:
+            return []
+        down_prices, down, up_prices, up = entry
+        if last is None:
+            return (
+                down[bisect_left(down_prices, price) :]
+                + up[: bisect_right(up_prices, price)]
+            )
+        if price < last:
+            # Falling: DOWN triggers in [price, last)
+            return down[
+                bisect_left(down_prices, price) : bisect_left(down_prices, last)
+            ]
+        if price > last:
+            # Rising: UP triggers in (last, price]
+            return up[bisect_right(up_prices, last) : bisect_right(up_prices, price)]
+        return []
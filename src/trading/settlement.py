@@ -1,11 +1,10 @@
 """Trade settlement logic"""
 
-import json
-import requests
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from src.config.settings import GAMMA_API_BASE, PROXY_PK
+from src.config.settings import PROXY_PK
 from src.utils.logger import log, log_error, send_discord
+from src.data.market_data.market_cache import market_cache, GammaMarketError
 from src.trading.orders import cancel_order, get_closed_positions
 from src.data.db_connection import db_connection
 from eth_account import Account
@@ -13,34 +12,16 @@ from eth_account import Account
 
 def get_market_resolution(slug: str):
     """
-    Fetch market resolution from Gamma API.
+    Fetch market resolution from Gamma API (via the market metadata cache).
     Returns:
         (resolved, outcome_prices)
         resolved: bool - True if market is fully resolved (prices are 0 or 1)
         outcome_prices: list[float] - [price_up, price_down] e.g. [1.0, 0.0]
     """
     try:
-        r = requests.get(f"{GAMMA_API_BASE}/markets/slug/{slug}", timeout=5)
-        if r.status_code == 200:
-            data = r.json()
-
-            # Check outcomePrices
-            outcome_prices = data.get("outcomePrices")
-            if isinstance(outcome_prices, str):
-                outcome_prices = json.loads(outcome_prices)
-
-            if not outcome_prices or len(outcome_prices) < 2:
-                return False, None
-
-            # Parse prices
-            p0 = float(outcome_prices[0])
-            p1 = float(outcome_prices[1])
-
-            # Check if resolved (one is 1, one is 0)
-            # We use a loose check (>= 0.99 or <= 0.01) just in case
-            if (p0 >= 0.99 and p1 <= 0.01) or (p0 <= 0.01 and p1 >= 0.99):
-                return True, [p0, p1]
-
+        return market_cache.get_resolution(slug)
+    except GammaMarketError:
+        pass
     except Exception as e:
         log_error(f"Error fetching resolution for {slug}: {e}")
 
@@ -111,15 +92,8 @@ def force_settle_trade(trade_id: int):
             if not is_resolved:
                 return
 
-            # 2. Identify which token we hold
-            r = requests.get(f"{GAMMA_API_BASE}/markets/slug/{slug}", timeout=5)
-            data = r.json()
-            clob_ids = data.get("clobTokenIds") or data.get("clob_token_ids")
-            if isinstance(clob_ids, str):
-                try:
-                    clob_ids = json.loads(clob_ids)
-                except:
-                    pass
+            # 2. Identify which token we hold (cached with the resolution)
+            clob_ids = market_cache.get_token_ids(slug)
 
             final_price = 0.0
             if prices and clob_ids and len(clob_ids) >= 2:
@@ -207,19 +181,8 @@ def check_and_settle_trades():
                 involved_windows.add((window_start, window_end))
 
                 # 2. Identify which token we hold (UP or DOWN)
-                # Fetch specific market data to match IDs safely
-                r = requests.get(f"{GAMMA_API_BASE}/markets/slug/{slug}", timeout=5)
-                data = r.json()
-                clob_ids = data.get("clobTokenIds") or data.get("clob_token_ids")
-                if isinstance(clob_ids, str):
-                    try:
-                        clob_ids = json.loads(clob_ids)
-                    except:
-                        # fallback parsing if simple string
-                        clob_ids = [
-                            x.strip().strip('"')
-                            for x in clob_ids.strip("[]").split(",")
-                        ]
+                # Token IDs come from the same cached market entry as the resolution
+                clob_ids = market_cache.get_token_ids(slug)
 
                 # Determine outcome value
                 final_price = 0.0
@@ -1,5 +1,8 @@
 """Trading strategy logic"""
 
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from typing import Optional
 from py_clob_client.client import ClobClient
 from src.config.settings import (
     MAX_SPREAD,
@@ -16,8 +19,12 @@ from src.config.settings import (
     PRICE_VALIDATION_MAX_MOVEMENT,
     PRICE_VALIDATION_MIN_CONFIDENCE,
     BAYESIAN_CONFIDENCE,
+    CONFIDENCE_DEADLINE_SEC,
+    SIGNAL_FETCH_WORKERS,
 )
+from src.utils.http import http_client
 from src.utils.logger import log, log_error
+from src.utils.websocket_manager import ws_manager
 from src.trading.orders.utils import is_404_error
 from src.data.market_data import (
     get_funding_bias,
@@ -31,9 +38,71 @@ from src.data.market_data import (
     get_polymarket_momentum,
     validate_price_movement_for_trade,
 )
-import requests
 import numpy as np
 
+# Shared pool for the independent signal fetches in calculate_confidence
+_signal_executor = ThreadPoolExecutor(
+    max_workers=SIGNAL_FETCH_WORKERS, thread_name_prefix="signals"
+)
+
+# Results used when a signal misses the deadline (same as each fetcher's error fallback)
+NEUTRAL_SIGNALS = {
+    "momentum": {
+        "velocity": 0.0,
+        "acceleration": 0.0,
+        "rsi": 50.0,
+        "direction": "NEUTRAL",
+        "strength": 0.0,
+    },
+    "order_flow": {
+        "buy_pressure": 0.5,
+        "volume_ratio": 0.5,
+        "large_trade_direction": "NEUTRAL",
+        "trade_intensity": 0.0,
+    },
+    "divergence": {
+        "binance_direction": "NEUTRAL",
+        "polymarket_direction": "NEUTRAL",
+        "divergence": 0.0,
+        "opportunity": "NEUTRAL",
+    },
+    "vwm": {"vwap_distance": 0.0, "volume_trend": "STABLE", "momentum_quality": 0.0},
+    "pm_momentum": {"velocity": 0.0, "direction": "NEUTRAL", "strength": 0.0},
+    "adx": -1.0,
+}
+
+
+def _await_signal(symbol: str, name: str, future, deadline: float):
+    """Wait for a signal fetch until the shared deadline, else use its neutral value"""
+    try:
+        return future.result(timeout=max(0.0, deadline - time.monotonic()))
+    except FuturesTimeoutError:
+        future.cancel()
+        log(f"[{symbol}] ⏱️  {name} signal missed the {CONFIDENCE_DEADLINE_SEC:.0f}s deadline")
+    except Exception as e:
+        log_error(f"[{symbol}] {name} signal failed: {e}", include_traceback=False)
+    neutral = NEUTRAL_SIGNALS[name]
+    return dict(neutral) if isinstance(neutral, dict) else neutral
+
+
+def _book_best_bid_ask(book) -> tuple[Optional[float], Optional[float]]:
+    """Best bid and ask of a CLOB book (dict or OrderBookSummary), None if a side is empty"""
+    if isinstance(book, dict):
+        bids = book.get("bids", []) or []
+        asks = book.get("asks", []) or []
+    else:
+        bids = getattr(book, "bids", []) or []
+        asks = getattr(book, "asks", []) or []
+    if not bids or not asks:
+        return None, None
+    best_bid = float(
+        bids[-1].price if hasattr(bids[-1], "price") else bids[-1].get("price", 0)
+    )
+    best_ask = float(
+        asks[-1].price if hasattr(asks[-1], "price") else asks[-1].get("price", 0)
+    )
+    return best_bid, best_ask
+
 
 def calculate_confidence(symbol: str, up_token: str, client: ClobClient):
     """
@@ -46,38 +115,63 @@ def calculate_confidence(symbol: str, up_token: str, client: ClobClient):
         - bias: "UP", "DOWN", or "NEUTRAL"
         - signals: Dictionary of detailed signal information
         - raw_scores: Dictionary of raw signal scores for backtesting
+
+    The order book and all signals are fetched concurrently under a single
+    CONFIDENCE_DEADLINE_SEC; divergence starts once the book gives p_up.
+    The best bid/ask come from the streamed quote snapshot while the market
+    channel is connected, else from the WebSocket-maintained local book when
+    it is in sync, otherwise from the CLOB REST API.
     """
+    deadline = time.monotonic() + CONFIDENCE_DEADLINE_SEC
+    submit = _signal_executor.submit
+    quote = ws_manager.get_quote(up_token)
+    local_book = None if quote else ws_manager.get_order_book(up_token)
+    book_future = (
+        None if quote or local_book else submit(client.get_order_book, up_token)
+    )
+    futures = {
+        "momentum": submit(
+            get_price_momentum, symbol, lookback_minutes=MOMENTUM_LOOKBACK_MINUTES
+        ),
+        "order_flow": submit(get_order_flow_analysis, symbol),
+        "vwm": submit(get_volume_weighted_momentum, symbol),
+        "pm_momentum": submit(get_polymarket_momentum, up_token),
+    }
+    if ADX_ENABLED:
+        futures["adx"] = submit(get_adx_from_binance, symbol)
+
+    def abandon():
+        for future in futures.values():
+            future.cancel()
+
     try:
-        book = client.get_order_book(up_token)
-        if isinstance(book, dict):
-            bids = book.get("bids", []) or []
-            asks = book.get("asks", []) or []
+        if quote:
+            best_bid, best_ask = quote.bid, quote.ask
         else:
-            bids = getattr(book, "bids", []) or []
-            asks = getattr(book, "asks", []) or []
+            best_bid, best_ask = _book_best_bid_ask(
+                local_book
+                or book_future.result(timeout=max(0.0, deadline - time.monotonic()))
+            )
     except Exception as e:
         if is_404_error(e):
             # Log the token ID occasionally or during 404 to help debug "wrong ID" vs "not ready"
             log(f"[{symbol}] Order book not ready for token {up_token[:10]}... (404)")
         else:
             log_error(f"[{symbol}] Order book error for {up_token}: {e}")
+        abandon()
         return 0.0, "NEUTRAL", 0.5, None, None, {}, {}
 
-    if not bids or not asks:
+    if best_bid is None or best_ask is None:
+        abandon()
         return 0.0, "NEUTRAL", 0.5, None, None, {}, {}
 
-    best_bid = float(
-        bids[-1].price if hasattr(bids[-1], "price") else bids[-1].get("price", 0)
-    )
-    best_ask = float(
-        asks[-1].price if hasattr(asks[-1], "price") else asks[-1].get("price", 0)
-    )
-
     if not best_bid or not best_ask:
+        abandon()
         return 0.0, "NEUTRAL", 0.5, best_bid, best_ask, {}, {}
 
     spread = best_ask - best_bid
     if spread > MAX_SPREAD:
+        abandon()
         return (
             0.0,
             "NEUTRAL",
@@ -90,11 +184,16 @@ def calculate_confidence(symbol: str, up_token: str, client: ClobClient):
 
     # Base Polymarket probability
     p_up = (best_bid + best_ask) / 2.0
+    futures["divergence"] = submit(get_cross_exchange_divergence, symbol, p_up)
+    fetched = {
+        name: _await_signal(symbol, name, future, deadline)
+        for name, future in futures.items()
+    }
 
     # 1. Price Momentum (Binance) - Weight: 0.35
     momentum_score = 0.0
     momentum_dir = "NEUTRAL"
-    momentum = get_price_momentum(symbol, lookback_minutes=MOMENTUM_LOOKBACK_MINUTES)
+    momentum = fetched["momentum"]
     if momentum["direction"] != "NEUTRAL":
         momentum_score = momentum["strength"]
         momentum_dir = momentum["direction"]
@@ -106,7 +205,7 @@ def calculate_confidence(symbol: str, up_token: str, client: ClobClient):
     # 2. Order Flow (Binance) - Weight: 0.15
     flow_score = 0.0
     flow_dir = "NEUTRAL"
-    order_flow = get_order_flow_analysis(symbol)
+    order_flow = fetched["order_flow"]
     # Scale: 0.55 or 0.45 = 1.0 strength (aggressive flow signal)
     flow_score = min(abs(order_flow["buy_pressure"] - 0.5) * 10.0, 1.0)
     flow_dir = "UP" if order_flow["buy_pressure"] > 0.5 else "DOWN"
@@ -114,7 +213,7 @@ def calculate_confidence(symbol: str, up_token: str, client: ClobClient):
     # 3. Divergence (Poly vs Binance) - Weight: 0.15
     divergence_score = 0.0
     divergence_dir = "NEUTRAL"
-    divergence = get_cross_exchange_divergence(symbol, p_up)
+    divergence = fetched["divergence"]
     # Scale: 0.1 divergence = 1.0 score
     divergence_score = min(abs(divergence["divergence"]) * 10.0, 1.0)
     divergence_dir = (
@@ -128,14 +227,14 @@ def calculate_confidence(symbol: str, up_token: str, client: ClobClient):
     # 4. VWAP / VWM - Weight: 0.10
     vwm_score = 0.0
     vwm_dir = "NEUTRAL"
-    vwm = get_volume_weighted_momentum(symbol)
+    vwm = fetched["vwm"]
     vwm_score = vwm["momentum_quality"]
     vwm_dir = "UP" if vwm["vwap_distance"] > 0 else "DOWN"
 
     # 5. Polymarket Native Momentum - Weight: 0.20 (New confirmed source)
     pm_mom_score = 0.0
     pm_mom_dir = "NEUTRAL"
-    pm_momentum = get_polymarket_momentum(up_token)
+    pm_momentum = fetched["pm_momentum"]
     if pm_momentum["direction"] != "NEUTRAL":
         pm_mom_score = pm_momentum["strength"]
         pm_mom_dir = pm_momentum["direction"]
@@ -155,7 +254,7 @@ def calculate_confidence(symbol: str, up_token: str, client: ClobClient):
     adx_dir = "NEUTRAL"
     adx_val = 0.0
     if ADX_ENABLED:
-        adx_val = get_adx_from_binance(symbol)
+        adx_val = fetched["adx"]
         if adx_val > 0:
             # Normalize ADX (25-50 range maps to 0.5-1.0 score)
             adx_score = min(adx_val / 50.0, 1.0)
@@ -574,7 +673,7 @@ def bfxd_allows_trade(symbol: str, direction: str) -> tuple[bool, str]:
         return True, "N/A"
 
     try:
-        r = requests.get(BFXD_URL, timeout=5)
+        r = http_client.get(BFXD_URL)
         r.raise_for_status()
         data = r.json()
 
@@ -0,0 +1,80 @@
+"""Stale-while-revalidate TTL cache for slow-changing remote values"""
+
+import time
+import threading
+from typing import Any, Callable, Dict, Hashable, Set, Tuple
+from src.utils.logger import log_error
+
+
+class TTLCache:
+    """
+    Caches loader results per key for `ttl` seconds. After expiry the stale
+    value is still returned immediately while a background thread refreshes
+    it, so callers only block on the very first load of a key. A failed
+    refresh keeps serving the previous value. Loaders signal failure by
+    raising; nothing is cached for a key whose first load fails.
+    """
+
+    def __init__(self, name: str, ttl: float):
+        self.name = name
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}  # key -> (loaded_at, value)
+        self._refreshing: Set[Hashable] = set()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "errors": 0}
+
+    def _count(self, stat: str):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Any]):
+        try:
+            value = loader()
+            with self._lock:
+                self._entries[key] = (time.time(), value)
+                self._stats["refreshes"] += 1
+        except Exception as e:
+            self._count("errors")
+            log_error(f"{self.name} cache refresh failed for {key}: {e}", include_traceback=False)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Get the cached value for key, loading it on a miss (loader may raise)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                loaded_at, value = entry
+                if time.time() - loaded_at < self.ttl:
+                    self._stats["hits"] += 1
+                    return value
+                self._stats["stale_hits"] += 1
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    threading.Thread(
+                        target=self._refresh, args=(key, loader), daemon=True
+                    ).start()
+                return value
+            self._stats["misses"] += 1
+
+        try:
+            value = loader()
+        except Exception:
+            self._count("errors")
+            raise
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+        return value
+
+    def get_stats(self) -> Dict[str, int]:
+        """Hit/stale-hit/miss/refresh/error counters"""
+        with self._lock:
+            return dict(self._stats)
+
+    def format_stats(self) -> str:
+        s = self.get_stats()
+        return (
+            f"{self.name}: {s['hits']} hit, {s['stale_hits']} stale, {s['misses']} miss, "
+            f"{s['refreshes']} refreshed, {s['errors']} err"
+        )
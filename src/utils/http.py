@@ -0,0 +1,118 @@
+"""Pooled HTTP transport shared by all REST integrations"""
+
+import time
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from src.config.settings import HTTP_POOL_SIZE, HTTP_RETRIES, HTTP_TIMEOUT_SEC
+
+
+class HttpClient:
+    """
+    Keeps one keep-alive requests.Session per host so repeated calls reuse
+    the TCP/TLS connection instead of handshaking every time. Pool sizes,
+    timeouts and retries are configured here, and every request is timed
+    into per-host latency counters.
+    """
+
+    def __init__(
+        self,
+        timeout: float = HTTP_TIMEOUT_SEC,
+        pool_size: int = HTTP_POOL_SIZE,
+        retries: int = HTTP_RETRIES,
+    ):
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.retries = retries
+        self._sessions: Dict[str, requests.Session] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def _create_session(self) -> requests.Session:
+        # Only idempotent GETs are retried, and only on connection errors or gateway failures
+        retry = Retry(
+            total=self.retries,
+            connect=self.retries,
+            read=0,
+            status=self.retries,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def session(self, host: str) -> requests.Session:
+        """Get (or create) the pooled session for a host"""
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self._create_session()
+                self._sessions[host] = session
+            return session
+
+    def _record(self, host: str, elapsed_ms: float, error: bool):
+        with self._lock:
+            stats = self._stats.setdefault(
+                host, {"count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            stats["count"] += 1
+            stats["errors"] += int(error)
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+    def request(
+        self, method: str, url: str, timeout: Optional[float] = None, **kwargs
+    ) -> requests.Response:
+        host = urlsplit(url).netloc
+        session = self.session(host)
+        start = time.perf_counter()
+        error = True
+        try:
+            if method == "GET":
+                response = session.get(url, timeout=timeout or self.timeout, **kwargs)
+            else:
+                response = session.post(url, timeout=timeout or self.timeout, **kwargs)
+            error = response.status_code >= 500
+            return response
+        finally:
+            self._record(host, (time.perf_counter() - start) * 1000.0, error)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-host request count, error count and average/max latency (ms)"""
+        with self._lock:
+            return {
+                host: {
+                    "count": s["count"],
+                    "errors": s["errors"],
+                    "avg_ms": s["total_ms"] / s["count"] if s["count"] else 0.0,
+                    "max_ms": s["max_ms"],
+                }
+                for host, s in self._stats.items()
+            }
+
+    def format_stats(self) -> str:
+        """One-line latency summary per host for logging"""
+        return " | ".join(
+            f"{host}: {s['count']} req, avg {s['avg_ms']:.0f}ms, max {s['max_ms']:.0f}ms, {s['errors']} err"
+            for host, s in sorted(self.get_stats().items())
+        )
+
+
+# Singleton instance
+http_client = HttpClient()
@@ -1,12 +1,12 @@
 """Logging utilities"""
 
 import os
-import requests
 import traceback
 from datetime import datetime
 from typing import Optional
 from zoneinfo import ZoneInfo
-from src.config.settings import LOG_FILE, ERROR_LOG_FILE, DISCORD_WEBHOOK, BASE_DIR
+from src.config.settings import LOG_FILE, ERROR_LOG_FILE, DISCORD_WEBHOOK, LOG_DIR
+from src.utils.http import http_client
 
 
 _current_log_file: str = LOG_FILE
@@ -37,7 +37,7 @@ def set_log_window(window_id: str = "") -> None:
             if len(parts) >= 6:
                 safe_id = "-".join(parts[:5])  # 2026-01-06_13-15-00
 
-        _current_log_file = os.path.join(BASE_DIR, "logs", f"window_{safe_id}.log")
+        _current_log_file = os.path.join(LOG_DIR, f"window_{safe_id}.log")
 
 
 def log(text: str) -> None:
@@ -104,6 +104,6 @@ def send_discord(msg: str) -> None:
     if not DISCORD_WEBHOOK:
         return
     try:
-        requests.post(DISCORD_WEBHOOK, json={"content": msg}, timeout=5)
+        http_client.post(DISCORD_WEBHOOK, json={"content": msg})
     except Exception:
         pass
@@ -0,0 +1,137 @@
+"""Local L2 order book rebuilt from Polymarket Market Channel events"""
+
+import time
+import threading
+from typing import Dict, List, Optional, Tuple
+
+PRICE_TOLERANCE = 1e-9
+
+
+class LocalOrderBook:
+    """
+    Full-depth book for one token: a `book` snapshot replaces it and
+    `price_change` events set the aggregate size at a price level (0 removes
+    the level). The book is only valid between a snapshot and the first
+    inconsistency - an event older than the book, a best bid/ask that
+    disagrees with the one the server reports after a change, or a crossed
+    book - after which it must be resynced from a fresh snapshot.
+    """
+
+    def __init__(self, asset_id: str):
+        self.asset_id = asset_id
+        self.bids: Dict[float, float] = {}  # price -> size
+        self.asks: Dict[float, float] = {}
+        self.market: Optional[str] = None
+        self.hash: Optional[str] = None
+        self.timestamp = 0  # Exchange timestamp (ms) of the last applied event
+        self.updated_at = 0.0  # Local time of the last applied event
+        self.valid = False
+        self._sorted: Optional[Tuple[list, list]] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _levels(levels) -> Dict[float, float]:
+        book = {}
+        for level in levels or []:
+            size = float(level["size"])
+            if size > 0:
+                book[float(level["price"])] = size
+        return book
+
+    def apply_snapshot(self, data: dict) -> bool:
+        """Replace the book with a `book` event / REST book payload"""
+        timestamp = int(data.get("timestamp") or 0)
+        with self._lock:
+            if self.valid and data.get("hash") and data.get("hash") == self.hash:
+                return True  # Same book we already hold
+            if self.valid and timestamp and timestamp < self.timestamp:
+                return False
+            self.bids = self._levels(data.get("bids", data.get("buys")))
+            self.asks = self._levels(data.get("asks", data.get("sells")))
+            self.market = data.get("market") or self.market
+            self.hash = data.get("hash")
+            self.timestamp = timestamp
+            self.updated_at = time.time()
+            self._sorted = None
+            self.valid = not self._crossed()
+            return self.valid
+
+    def apply_changes(
+        self,
+        changes: List[dict],
+        timestamp: int,
+        best_bid: Optional[float] = None,
+        best_ask: Optional[float] = None,
+        book_hash: Optional[str] = None,
+    ) -> bool:
+        """
+        Apply level updates from one price_change event. best_bid/best_ask
+        are the server's view after the change and are used to detect gaps.
+        Returns False if the book is (now) invalid and needs a resync.
+        """
+        with self._lock:
+            if not self.valid:
+                return False
+            if timestamp and timestamp < self.timestamp:
+                # Out-of-order delivery - the snapshot already covers it
+                return True
+            for change in changes:
+                side = self.bids if change.get("side") == "BUY" else self.asks
+                price, size = float(change["price"]), float(change["size"])
+                if size > 0:
+                    side[price] = size
+                else:
+                    side.pop(price, None)
+            self.timestamp = max(self.timestamp, timestamp)
+            self.updated_at = time.time()
+            self.hash = book_hash or self.hash
+            self._sorted = None
+            if self._crossed() or not self._matches(best_bid, best_ask):
+                self.valid = False
+            return self.valid
+
+    def invalidate(self):
+        with self._lock:
+            self.valid = False
+
+    def _crossed(self) -> bool:
+        return bool(self.bids and self.asks and max(self.bids) >= min(self.asks))
+
+    def _matches(self, best_bid: Optional[float], best_ask: Optional[float]) -> bool:
+        local_bid = max(self.bids) if self.bids else 0.0
+        local_ask = min(self.asks) if self.asks else 0.0
+        if best_bid is not None and abs(best_bid - local_bid) > PRICE_TOLERANCE:
+            return False
+        if best_ask is not None and abs(best_ask - local_ask) > PRICE_TOLERANCE:
+            return False
+        return True
+
+    def best(self) -> Tuple[Optional[float], Optional[float]]:
+        """Best bid and ask (None for an empty side)"""
+        with self._lock:
+            return (
+                max(self.bids) if self.bids else None,
+                min(self.asks) if self.asks else None,
+            )
+
+    def to_clob(self) -> dict:
+        """The book in CLOB REST /book shape (best level last on both sides)"""
+        with self._lock:
+            if self._sorted is None:
+                bids = [
+                    {"price": f"{p:g}", "size": f"{s:g}"} for p, s in sorted(self.bids.items())
+                ]
+                asks = [
+                    {"price": f"{p:g}", "size": f"{s:g}"}
+                    for p, s in sorted(self.asks.items(), reverse=True)
+                ]
+                self._sorted = (bids, asks)
+            bids, asks = self._sorted
+            return {
+                "market": self.market,
+                "asset_id": self.asset_id,
+                "timestamp": str(self.timestamp),
+                "hash": self.hash,
+                "bids": bids,
+                "asks": asks,
+            }
@@ -0,0 +1,81 @@
+"""Fixed-capacity NumPy tick history per Polymarket token"""
+
+import time
+from typing import Optional
+import numpy as np
+
+TICK_DTYPE = np.dtype(
+    [
+        ("ts", "f8"),
+        ("bid", "f8"),
+        ("ask", "f8"),
+        ("mid", "f8"),
+        ("last", "f8"),  # Last trade price (NaN until the first trade)
+    ]
+)
+
+
+class TickRingBuffer:
+    """
+    Preallocated ring of the last `capacity` ticks for one token. Every tick
+    is written twice, at i and i + capacity, so the most recent n ticks are
+    always one contiguous slice: append is O(1) and reads return read-only
+    views without copying. Memory is fixed at 2 * capacity * 40 bytes.
+
+    Each row is the token's full state after an update (bid/ask/mid/last
+    carried forward), oldest first. There is a single writer (the WebSocket
+    thread); a reader holding a view while the writer laps the whole ring
+    sees its oldest rows overwritten, so copy views that are kept around.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._data = np.full(2 * capacity, np.nan, dtype=TICK_DTYPE)
+        self._next = 0  # Slot (< capacity) the next tick is written to
+        self.count = 0  # Ticks written in total
+        self.bid = self.ask = self.last = float("nan")
+
+    def append(
+        self,
+        bid: Optional[float] = None,
+        ask: Optional[float] = None,
+        last: Optional[float] = None,
+        ts: Optional[float] = None,
+    ) -> None:
+        """Record a tick, carrying forward whichever values did not change"""
+        if bid is not None:
+            self.bid = bid
+        if ask is not None:
+            self.ask = ask
+        if last is not None:
+            self.last = last
+        row = (
+            time.time() if ts is None else ts,
+            self.bid,
+            self.ask,
+            (self.bid + self.ask) / 2.0,
+            self.last,
+        )
+        i = self._next
+        self._data[i] = row
+        self._data[i + self.capacity] = row
+        self._next = i + 1 if i + 1 < self.capacity else 0
+        self.count += 1
+
+    @property
+    def updated_at(self) -> float:
+        return float(self.latest(1)["ts"][0]) if self.count else 0.0
+
+    def latest(self, n: Optional[int] = None) -> np.ndarray:
+        """Read-only view of the last n ticks (all retained ticks by default)"""
+        size = min(self.count, self.capacity)
+        n = size if n is None else max(0, min(n, size))
+        end = self._next + self.capacity if self.count >= self.capacity else self._next
+        view = self._data[end - n : end]
+        view.flags.writeable = False
+        return view
+
+    def since(self, ts: float) -> np.ndarray:
+        """Read-only view of the retained ticks at or after ts"""
+        view = self.latest()
+        return view[int(np.searchsorted(view["ts"], ts, side="left")) :]
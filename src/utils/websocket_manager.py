@@ -5,10 +5,132 @@ import asyncio
 import threading
 import time
 import os
-from typing import Dict, List, Optional, Callable, Any, Union
+from collections import deque
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+import numpy as np
 import websockets
-from src.config.settings import CLOB_WSS_HOST, MARKETS
+from src.config.settings import (
+    CLOB_HOST,
+    CLOB_WSS_HOST,
+    MARKETS,
+    PM_HISTORY_BUCKET_SEC,
+    PM_HISTORY_WINDOW_SEC,
+    TICK_STORE_CAPACITY,
+    WS_STALE_WARN_SEC,
+)
+from src.utils.http import http_client
 from src.utils.logger import log, log_error
+from src.utils.order_book import LocalOrderBook
+from src.utils.tick_store import TickRingBuffer
+
+try:
+    import orjson
+
+    json_loads: Callable[[Union[str, bytes]], Any] = orjson.loads
+    DECODER = "orjson"
+except ImportError:
+    json_loads = json.loads
+    DECODER = "json"
+
+BOOK_IDLE_EVICT_SEC = 900  # Drop local books not updated for a full window
+TICK_IDLE_EVICT_SEC = 900  # Drop tick buffers of tokens quiet for a full window
+RATE_WINDOW_SEC = 60  # Message rate and max lag cover the last minute
+LAG_EWMA_ALPHA = 0.05
+
+
+class PriceSnapshot(NamedTuple):
+    """
+    A token's prices as of one update. Snapshots are immutable and replaced
+    whole, so a reader on another thread always sees a bid and ask from the
+    same event without taking a lock.
+    """
+
+    bid: Optional[float]
+    ask: Optional[float]
+    mid: Optional[float]
+    last: Optional[float]  # Last trade price
+    price: float  # Latest midpoint, or the last trade if that came after it
+    ts: float  # Local time of the update
+
+
+class ChannelStats:
+    """
+    Health counters for one WebSocket channel. Only the event loop thread
+    writes them; per-second buckets make the last-minute rate and max lag
+    readable from other threads without a lock.
+    """
+
+    def __init__(self):
+        self.connected = False
+        self.connects = 0
+        self.messages = 0  # Frames received
+        self.events = 0  # Events inside those frames
+        self.last_message_at = 0.0
+        self.lag_ms: Optional[float] = None  # EWMA of receive time - exchange timestamp
+        self.last_lag_ms: Optional[float] = None
+        self._secs = [0] * RATE_WINDOW_SEC
+        self._counts = [0] * RATE_WINDOW_SEC
+        self._max_lag = [0.0] * RATE_WINDOW_SEC
+
+    def _bucket(self, now: float) -> int:
+        sec = int(now)
+        i = sec % RATE_WINDOW_SEC
+        if self._secs[i] != sec:
+            self._secs[i] = sec
+            self._counts[i] = 0
+            self._max_lag[i] = 0.0
+        return i
+
+    def record_message(self, now: float):
+        self.messages += 1
+        self.last_message_at = now
+        self._counts[self._bucket(now)] += 1
+
+    def record_lag(self, now: float, exchange_ts: float):
+        """Lag of one event from its exchange timestamp (seconds or ms)"""
+        if exchange_ts > 1e12:
+            exchange_ts /= 1000.0
+        lag = (now - exchange_ts) * 1000.0
+        self.last_lag_ms = lag
+        self.lag_ms = (
+            lag
+            if self.lag_ms is None
+            else self.lag_ms + LAG_EWMA_ALPHA * (lag - self.lag_ms)
+        )
+        i = self._bucket(now)
+        if lag > self._max_lag[i]:
+            self._max_lag[i] = lag
+
+    def get_stats(self, now: float) -> Dict[str, Any]:
+        sec = int(now)
+        recent = [i for i, s in enumerate(self._secs) if sec - s < RATE_WINDOW_SEC]
+        return {
+            "connected": self.connected,
+            "connects": self.connects,
+            "reconnects": max(self.connects - 1, 0),
+            "messages": self.messages,
+            "events": self.events,
+            "msg_per_sec": sum(self._counts[i] for i in recent) / RATE_WINDOW_SEC,
+            "lag_ms": self.lag_ms,
+            "last_lag_ms": self.last_lag_ms,
+            "max_lag_ms": max((self._max_lag[i] for i in recent), default=0.0),
+            "last_message_age": (
+                now - self.last_message_at if self.last_message_at else None
+            ),
+        }
 
 
 class WebSocketManager:
@@ -17,12 +139,19 @@ class WebSocketManager:
     Handles real-time price updates and order notifications.
     """
 
-    def __init__(self):
+    def __init__(self, loads: Optional[Callable[[Union[str, bytes]], Any]] = None):
         # Base URL from settings: wss://ws-subscriptions-clob.polymarket.com
         self.wss_base_url = CLOB_WSS_HOST.rstrip("/")
-        self.prices: Dict[str, float] = {}  # token_id -> midpoint_price
-        self.bids: Dict[str, float] = {}  # token_id -> best_bid
-        self.asks: Dict[str, float] = {}  # token_id -> best_ask
+        # token_id -> latest PriceSnapshot, swapped as a single reference
+        self.snapshots: Dict[str, PriceSnapshot] = {}
+        # token_id -> (bucket start, last midpoint in bucket), oldest first
+        self.price_history: Dict[str, Deque[Tuple[float, float]]] = {}
+        self._history_lock = threading.Lock()
+        self.ticks: Dict[str, TickRingBuffer] = {}  # token_id -> tick history
+        self.books: Dict[str, LocalOrderBook] = {}  # token_id -> full-depth book
+        self._resyncing: Set[str] = set()
+        self.book_resyncs = 0
+        self.market_connected = False
         self.token_to_symbol: Dict[str, str] = {}
         self.callbacks: Dict[str, List[Callable]] = {
             "price": [],
@@ -33,6 +162,24 @@ class WebSocketManager:
         self._running = False
         self.subscribed_tokens: List[str] = []
         self.subscription_queue: asyncio.Queue = asyncio.Queue()
+        # orjson when installed (takes bytes directly), stdlib json otherwise
+        self._loads = loads or json_loads
+        self._event_handlers: Dict[str, Callable[[dict], Awaitable[None]]] = {
+            "book": self._on_book,
+            "price_change": self._on_price_change,
+            "best_bid_ask": self._on_best_bid_ask,
+            "last_trade_price": self._on_last_trade_price,
+        }
+        self._type_handlers: Dict[str, Callable[[dict], Awaitable[None]]] = {
+            "order": self._on_order,
+            "error": self._on_error,
+        }
+        self._market_cache = None
+        self.channel_stats: Dict[str, ChannelStats] = {
+            "market": ChannelStats(),
+            "user": ChannelStats(),
+        }
+        self.subscription_requests = 0
 
     def start(self):
         """Start the WebSocket manager in background threads"""
@@ -73,6 +220,8 @@ class WebSocketManager:
                     url, ping_interval=10, ping_timeout=10
                 ) as ws:
                     log(f"✅ WebSocket connected to Market Channel")
+                    self.market_connected = True
+                    self._channel_up("market")
                     if self.subscribed_tokens:
                         await self._subscribe_market(ws, self.subscribed_tokens)
 
@@ -90,7 +239,18 @@ class WebSocketManager:
                         exc = task.exception()
                         if exc is not None:
                             raise exc
+                self.market_connected = False
+                self.channel_stats["market"].connected = False
+                self._expire_streamed_quotes()
+                self._invalidate_books()
+                self._invalidate_quotes()
             except Exception as e:
+                # Streamed quotes go stale while disconnected - fall back to Gamma
+                self.market_connected = False
+                self.channel_stats["market"].connected = False
+                self._expire_streamed_quotes()
+                self._invalidate_books()
+                self._invalidate_quotes()
                 if self._running:
                     log_error(
                         f"Market WebSocket lost: {e}. Reconnecting in 5s...",
@@ -115,6 +275,7 @@ class WebSocketManager:
                     url, ping_interval=10, ping_timeout=10
                 ) as ws:
                     log(f"✅ WebSocket connected to User Channel")
+                    self._channel_up("user")
                     auth_data = {
                         "apiKey": api_key,
                         "secret": api_secret,
@@ -124,7 +285,7 @@ class WebSocketManager:
                     await ws.send(json.dumps(msg))
 
                     ping_task = asyncio.create_task(self._ping_loop(ws))
-                    recv_task = asyncio.create_task(self._receive_messages(ws))
+                    recv_task = asyncio.create_task(self._receive_messages(ws, "user"))
 
                     done, pending = await asyncio.wait(
                         [ping_task, recv_task], return_when=asyncio.FIRST_COMPLETED
@@ -135,7 +296,9 @@ class WebSocketManager:
                         exc = task.exception()
                         if exc is not None:
                             raise exc
+                self.channel_stats["user"].connected = False
             except Exception as e:
+                self.channel_stats["user"].connected = False
                 if self._running:
                     log_error(
                         f"User WebSocket lost: {e}. Reconnecting in 5s...",
@@ -143,6 +306,13 @@ class WebSocketManager:
                     )
                     await asyncio.sleep(5)
 
+    def _channel_up(self, channel: str):
+        stats = self.channel_stats[channel]
+        stats.connected = True
+        stats.connects += 1
+        if stats.connects > 1:
+            log(f"🔁 {channel.title()} Channel reconnect #{stats.connects - 1}")
+
     async def _ping_loop(self, ws):
         """Send PING every 10 seconds as per Quickstart"""
         while self._running:
@@ -155,6 +325,7 @@ class WebSocketManager:
             return
         msg = {"type": "market", "assets_ids": token_ids}
         await ws.send(json.dumps(msg))
+        self.subscription_requests += 1
         log(f"📡 Subscribed to {len(token_ids)} tokens on Market Channel")
 
     async def _process_market_subscription_queue(self, ws):
@@ -164,99 +335,308 @@ class WebSocketManager:
             await self._subscribe_market(ws, token_ids)
             self.subscription_queue.task_done()
 
-    async def _receive_messages(self, ws):
+    async def _receive_messages(self, ws, channel: str = "market"):
         """Continuous message reception loop"""
         async for message in ws:
             if not self._running:
                 break
             if message == "PONG":
                 continue
-            await self._handle_message(message)
+            await self._handle_message(message, channel)
 
-    async def _handle_message(self, message: Union[str, bytes]):
-        """Process incoming WSS messages"""
+    async def _handle_message(
+        self, message: Union[str, bytes], channel: str = "market"
+    ):
+        """Decode a WSS frame and dispatch each event it contains"""
         try:
-            if isinstance(message, bytes):
-                message = message.decode("utf-8")
-            if message in ["PONG", "PING"]:
+            now = time.time()
+            stats = self.channel_stats[channel]
+            stats.record_message(now)
+            if message in ("PONG", "PING", b"PONG", b"PING"):
                 return
-
             try:
-                data = json.loads(message)
-            except:
+                data = self._loads(message)
+            except Exception:
                 return
 
             if isinstance(data, list):
                 for item in data:
-                    await self._process_single_message(item)
+                    await self._process_single_message(item, stats, now)
             else:
-                await self._process_single_message(data)
+                await self._process_single_message(data, stats, now)
         except Exception as e:
             log_error(f"Error handling WSS message: {e}")
 
-    async def _process_single_message(self, data: Any):
-        """Process a single message object from WSS"""
+    async def _process_single_message(
+        self, data: Any, stats: Optional[ChannelStats] = None, now: float = 0.0
+    ):
+        """Route one event to its handler by event_type (or user-channel type)"""
         if not isinstance(data, dict):
             return
         try:
-            event_type = data.get("event_type")
-            if event_type in [
-                "book",
-                "price_change",
-                "best_bid_ask",
-                "last_trade_price",
-            ]:
-                asset_id = data.get("asset_id")
-                if not asset_id:
-                    return
-
-                if event_type == "best_bid_ask":
-                    b, a = data.get("best_bid"), data.get("best_ask")
-                    if b and a:
-                        self.prices[str(asset_id)] = (float(b) + float(a)) / 2.0
-                        self.bids[str(asset_id)] = float(b)
-                        self.asks[str(asset_id)] = float(a)
-                elif event_type == "price_change":
-                    for c in data.get("price_changes", []):
-                        aid, b, a = (
-                            c.get("asset_id"),
-                            c.get("best_bid"),
-                            c.get("best_ask"),
-                        )
-                        if aid and b and a and float(b) > 0:
-                            self.prices[str(aid)] = (float(b) + float(a)) / 2.0
-                            self.bids[str(aid)] = float(b)
-                            self.asks[str(aid)] = float(a)
-                            await self._trigger_price_callbacks(
-                                str(aid), self.prices[str(aid)]
-                            )
-                elif event_type == "last_trade_price":
-                    p = data.get("price")
-                    if p:
-                        self.prices[str(asset_id)] = float(p)
-
-                new_p = self.prices.get(str(asset_id))
-                if new_p and event_type != "price_change":
-                    await self._trigger_price_callbacks(str(asset_id), new_p)
-
-            elif data.get("type") == "order":
-                ev, order = data.get("event"), data.get("order", {})
-                for cb in self.callbacks["order"]:
-                    try:
-                        cb(ev, order)
-                    except:
-                        pass
-            elif data.get("type") == "error":
-                log_error(
-                    f"WebSocket API Error: {data.get('message')}",
-                    include_traceback=False,
-                )
+            if stats is not None:
+                stats.events += 1
+                ts = data.get("timestamp")
+                if ts:
+                    stats.record_lag(now, float(ts))
+            handler = self._event_handlers.get(data.get("event_type"))
+            if handler is None:
+                handler = self._type_handlers.get(data.get("type"))
+            if handler is not None:
+                await handler(data)
         except Exception as e:
             log_error(f"Error processing single WSS message: {e}")
 
+    def _set_quote(self, asset_id: str, bid: float, ask: float) -> float:
+        """Store a best bid/ask and fan it out; returns the midpoint"""
+        mid = (bid + ask) / 2.0
+        prev = self.snapshots.get(asset_id)
+        self.snapshots[asset_id] = PriceSnapshot(
+            bid, ask, mid, prev.last if prev else None, mid, time.time()
+        )
+        self._publish_quote(asset_id, bid, ask)
+        self._record_price(asset_id, mid)
+        self._record_tick(asset_id, bid=bid, ask=ask)
+        return mid
+
+    async def _on_book(self, data: dict):
+        asset_id = data.get("asset_id")
+        if not asset_id:
+            return
+        asset_id = str(asset_id)
+        book = self._book(asset_id)
+        if book.apply_snapshot(data):
+            self._quote_from_book(asset_id, book)
+        else:
+            self._request_resync(asset_id)
+        snap = self.snapshots.get(asset_id)
+        if snap and snap.price:
+            await self._trigger_price_callbacks(asset_id, snap.price)
+
+    async def _on_price_change(self, data: dict):
+        timestamp = int(data.get("timestamp") or 0)
+        # Current format: per-asset changes with the server's best bid/ask after each
+        for c in data.get("price_changes") or ():
+            asset_id = c.get("asset_id")
+            if not asset_id:
+                continue
+            asset_id = str(asset_id)
+            b, a = c.get("best_bid"), c.get("best_ask")
+            bid = float(b) if b else None
+            ask = float(a) if a else None
+            if not self._book(asset_id).apply_changes(
+                [c], timestamp, bid, ask, c.get("hash")
+            ):
+                self._request_resync(asset_id)
+            if bid and ask is not None:
+                mid = self._set_quote(asset_id, bid, ask)
+                await self._trigger_price_callbacks(asset_id, mid)
+        # Legacy format: one asset, list of level changes
+        if data.get("changes") and data.get("asset_id"):
+            asset_id = str(data["asset_id"])
+            if not self._book(asset_id).apply_changes(
+                data["changes"], timestamp, book_hash=data.get("hash")
+            ):
+                self._request_resync(asset_id)
+
+    async def _on_best_bid_ask(self, data: dict):
+        asset_id = data.get("asset_id")
+        if not asset_id:
+            return
+        asset_id = str(asset_id)
+        b, a = data.get("best_bid"), data.get("best_ask")
+        if b and a:
+            self._set_quote(asset_id, float(b), float(a))
+        snap = self.snapshots.get(asset_id)
+        if snap and snap.price:
+            await self._trigger_price_callbacks(asset_id, snap.price)
+
+    async def _on_last_trade_price(self, data: dict):
+        asset_id = data.get("asset_id")
+        if not asset_id:
+            return
+        asset_id = str(asset_id)
+        p = data.get("price")
+        if p:
+            price = float(p)
+            prev = self.snapshots.get(asset_id)
+            if prev:
+                self.snapshots[asset_id] = prev._replace(
+                    last=price, price=price, ts=time.time()
+                )
+            else:
+                self.snapshots[asset_id] = PriceSnapshot(
+                    None, None, None, price, price, time.time()
+                )
+            self._record_tick(asset_id, last=price)
+        snap = self.snapshots.get(asset_id)
+        if snap and snap.price:
+            await self._trigger_price_callbacks(asset_id, snap.price)
+
+    async def _on_order(self, data: dict):
+        ev, order = data.get("event"), data.get("order", {})
+        for cb in self.callbacks["order"]:
+            try:
+                cb(ev, order)
+            except:
+                pass
+
+    async def _on_error(self, data: dict):
+        log_error(
+            f"WebSocket API Error: {data.get('message')}",
+            include_traceback=False,
+        )
+
+    def _book(self, asset_id: str) -> LocalOrderBook:
+        book = self.books.get(asset_id)
+        if book is None:
+            cutoff = time.time() - BOOK_IDLE_EVICT_SEC
+            for token_id in [t for t, b in self.books.items() if b.updated_at < cutoff]:
+                del self.books[token_id]
+            book = self.books[asset_id] = LocalOrderBook(asset_id)
+        return book
+
+    def _request_resync(self, asset_id: str):
+        """Rebuild a book from a REST snapshot after a gap (one fetch at a time)"""
+        if asset_id in self._resyncing or not self._loop:
+            return
+        self._resyncing.add(asset_id)
+        self.book_resyncs += 1
+        asyncio.ensure_future(self._resync_book(asset_id), loop=self._loop)
+
+    async def _resync_book(self, asset_id: str):
+        try:
+            response = await self._loop.run_in_executor(
+                None,
+                lambda: http_client.get(f"{CLOB_HOST}/book", params={"token_id": asset_id}),
+            )
+            book = self._book(asset_id)
+            if response.status_code == 200 and book.apply_snapshot(response.json()):
+                self._quote_from_book(asset_id, book)
+        except Exception as e:
+            log_error(f"Order book resync failed for {asset_id[:10]}...: {e}", include_traceback=False)
+        finally:
+            self._resyncing.discard(asset_id)
+
+    def _invalidate_books(self):
+        for book in list(self.books.values()):
+            book.invalidate()
+
+    def _quote_from_book(self, asset_id: str, book: LocalOrderBook):
+        """Refresh the token's quote from a freshly loaded full book"""
+        bid, ask = book.best()
+        if bid is not None and ask is not None:
+            self._set_quote(asset_id, bid, ask)
+
+    def _invalidate_quotes(self):
+        """
+        Drop streamed bid/ask from every snapshot on disconnect, so a quiet
+        token's pre-disconnect quote is never served after reconnecting. The
+        last known price stays for display; get_quote() returns None until
+        the token's book or a new quote arrives.
+        """
+        for token_id, snap in list(self.snapshots.items()):
+            if snap.bid is not None or snap.ask is not None:
+                self.snapshots[token_id] = snap._replace(bid=None, ask=None, mid=None)
+
+    def get_order_book(self, token_id: str) -> Optional[dict]:
+        """
+        Local full-depth book in CLOB /book shape, or None if the market
+        channel is down or the book is missing / awaiting resync.
+        """
+        book = self.books.get(str(token_id))
+        if not self.market_connected or book is None or not book.valid:
+            return None
+        return book.to_clob()
+
+    def get_book_spread(self, token_id: str) -> Optional[float]:
+        """Best ask minus best bid from the local book (None if unavailable)"""
+        book = self.books.get(str(token_id))
+        if not self.market_connected or book is None or not book.valid:
+            return None
+        bid, ask = book.best()
+        if bid is None or ask is None:
+            return None
+        return round(ask - bid, 6)
+
+    def _record_price(self, asset_id: str, price: float):
+        """Append a midpoint to the token's bucketed price history"""
+        bucket = (time.time() // PM_HISTORY_BUCKET_SEC) * PM_HISTORY_BUCKET_SEC
+        with self._history_lock:
+            history = self.price_history.get(asset_id)
+            if history is None:
+                # New token (usually a new window) - drop tokens that went quiet
+                cutoff = bucket - PM_HISTORY_WINDOW_SEC
+                for token_id in [t for t, h in self.price_history.items() if h[-1][0] < cutoff]:
+                    del self.price_history[token_id]
+                maxlen = max(int(PM_HISTORY_WINDOW_SEC / PM_HISTORY_BUCKET_SEC), 1)
+                history = self.price_history[asset_id] = deque(maxlen=maxlen)
+            if history and history[-1][0] == bucket:
+                history[-1] = (bucket, price)
+            else:
+                history.append((bucket, price))
+
+    def get_price_history(self, token_id: str) -> List[Tuple[float, float]]:
+        """
+        Locally captured (bucket start, midpoint) history for a token within
+        PM_HISTORY_WINDOW_SEC, oldest first. Buckets only exist where the
+        price was updated.
+        """
+        cutoff = time.time() - PM_HISTORY_WINDOW_SEC
+        with self._history_lock:
+            history = self.price_history.get(str(token_id))
+            if not history:
+                return []
+            return [point for point in history if point[0] >= cutoff]
+
+    def _record_tick(
+        self,
+        asset_id: str,
+        bid: Optional[float] = None,
+        ask: Optional[float] = None,
+        last: Optional[float] = None,
+    ):
+        """Append the token's current bid/ask/last to its tick ring buffer"""
+        buffer = self.ticks.get(asset_id)
+        if buffer is None:
+            cutoff = time.time() - TICK_IDLE_EVICT_SEC
+            for token_id in [t for t, b in self.ticks.items() if b.updated_at < cutoff]:
+                del self.ticks[token_id]
+            buffer = self.ticks[asset_id] = TickRingBuffer(TICK_STORE_CAPACITY)
+        buffer.append(bid, ask, last)
+
+    def get_ticks(
+        self, token_id: str, n: Optional[int] = None, since: Optional[float] = None
+    ) -> Optional[np.ndarray]:
+        """
+        Read-only view of a token's recent ticks (fields ts, bid, ask, mid,
+        last; oldest first): the last n ticks, or those at or after `since`.
+        None if no tick has been seen for the token.
+        """
+        buffer = self.ticks.get(str(token_id))
+        if buffer is None:
+            return None
+        return buffer.since(since) if since is not None else buffer.latest(n)
+
+    def _publish_quote(self, asset_id: str, bid: float, ask: float):
+        """Keep the market metadata cache's outcome prices current"""
+        if self._market_cache is None:
+            from src.data.market_data.market_cache import market_cache
+
+            self._market_cache = market_cache
+        self._market_cache.apply_quote(asset_id, bid, ask)
+
+    def _expire_streamed_quotes(self):
+        from src.data.market_data.market_cache import market_cache
+
+        market_cache.expire_streamed()
+
     async def _trigger_price_callbacks(self, asset_id: str, price: float):
         """Execute all registered price callbacks"""
-        for cb in self.callbacks["price"]:
+        callbacks = self.callbacks["price"]
+        if not callbacks:
+            return
+        for cb in callbacks:
             try:
                 if asyncio.iscoroutinefunction(cb):
                     await cb(asset_id, price)
@@ -280,13 +660,39 @@ class WebSocketManager:
                 self.subscription_queue.put_nowait, new_tokens
             )
 
+    def get_snapshot(self, token_id: str) -> Optional[PriceSnapshot]:
+        """Latest PriceSnapshot for a token (None before its first update)"""
+        return self.snapshots.get(str(token_id))
+
+    def snapshot(self, token_ids: Iterable[str]) -> Dict[str, PriceSnapshot]:
+        """Latest PriceSnapshot of each token that has one, keyed by token ID"""
+        snapshots = self.snapshots
+        result = {}
+        for token_id in token_ids:
+            snap = snapshots.get(str(token_id))
+            if snap is not None:
+                result[str(token_id)] = snap
+        return result
+
+    def get_quote(self, token_id: str) -> Optional[PriceSnapshot]:
+        """
+        The token's snapshot if it carries a streamed best bid and ask and the
+        market channel is connected (quotes are current only while it is)
+        """
+        snap = self.snapshots.get(str(token_id))
+        if not self.market_connected or snap is None:
+            return None
+        return snap if snap.bid and snap.ask else None
+
     def get_price(self, token_id: str) -> Optional[float]:
         """Get the latest cached price for a token"""
-        return self.prices.get(str(token_id))
+        snap = self.snapshots.get(str(token_id))
+        return snap.price if snap else None
 
     def get_bid_ask(self, token_id: str) -> tuple[Optional[float], Optional[float]]:
-        """Get the latest cached bid and ask for a token"""
-        return self.bids.get(str(token_id)), self.asks.get(str(token_id))
+        """Get the latest cached bid and ask for a token (from one update)"""
+        snap = self.snapshots.get(str(token_id))
+        return (snap.bid, snap.ask) if snap else (None, None)
 
     def is_winning_side(
         self, token_id: str, side: str, target_price: float = None
@@ -295,7 +701,9 @@ class WebSocketManager:
         Determine if a position side is winning based on Polymarket outcome prices.
 
         UP and DOWN tokens have SEPARATE midpoint prices.
-        Uses get_outcome_prices() which caches bestBid/bestAsk from market API.
+        Uses get_outcome_prices(), whose bestBid/bestAsk are kept current from
+        this manager's streamed quotes and only fetched from Gamma while the
+        market channel is down.
 
         Args:
             token_id: The token ID to check (UP or DOWN token)
@@ -339,6 +747,52 @@ class WebSocketManager:
 
         return None
 
+    def feed_age(self) -> Optional[float]:
+        """Seconds since the last Market Channel frame (None before the first)"""
+        last = self.channel_stats["market"].last_message_at
+        return time.time() - last if last else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Per-channel rate, lag and reconnect counters, subscription sizes and
+        seconds since each subscribed token's last price update
+        """
+        now = time.time()
+        snapshots = self.snapshots
+        token_age = {}
+        for token_id in list(self.subscribed_tokens):
+            snap = snapshots.get(token_id)
+            token_age[token_id] = now - snap.ts if snap else None
+        return {
+            "channels": {
+                name: stats.get_stats(now) for name, stats in self.channel_stats.items()
+            },
+            "subscribed": len(token_age),
+            "subscription_requests": self.subscription_requests,
+            "token_age": token_age,
+            "books": len(self.books),
+            "book_resyncs": self.book_resyncs,
+        }
+
+    def format_stats(self) -> str:
+        """One-line feed health summary for logging"""
+        s = self.get_stats()
+        parts = []
+        for name, c in s["channels"].items():
+            line = f"{name}: {'up' if c['connected'] else 'down'}, {c['msg_per_sec']:.1f} msg/s"
+            if c["lag_ms"] is not None:
+                line += f", lag {c['lag_ms']:.0f}ms (max {c['max_lag_ms']:.0f}ms/{RATE_WINDOW_SEC}s)"
+            if c["last_message_age"] is not None:
+                line += f", last {c['last_message_age']:.1f}s ago"
+            parts.append(f"{line}, {c['reconnects']} reconnects")
+        ages = [a for a in s["token_age"].values() if a is not None]
+        quiet = sum(1 for a in ages if a > WS_STALE_WARN_SEC)
+        parts.append(
+            f"{s['subscribed']} tokens ({len(ages)} quoted, {quiet} quiet >{WS_STALE_WARN_SEC:.0f}s), "
+            f"{s['books']} books, {s['book_resyncs']} resyncs"
+        )
+        return " | ".join(parts)
+
     def register_callback(self, event_type: str, callback: Callable):
         """Register a function to be called on WSS events"""
         if event_type in self.callbacks:
@@ -0,0 +1,117 @@
+"""MarketMetadataCache field expiry: unfilled Gamma fields and streamed quotes"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+# Settings are read at import time and require a well-formed key
+os.environ.setdefault("PROXY_PK", "0x" + "11" * 32)
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp(prefix="polyflup-test-"))
+
+from src.data.market_data import market_cache as market_cache_module
+from src.data.market_data.market_cache import MarketMetadataCache
+
+SLUG = "btc-updown-15m-1792190700"
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self.payload
+
+
+def gamma_market(token_ids=None):
+    market = {"slug": SLUG, "conditionId": "0xabc", "outcomePrices": '["0.5", "0.5"]'}
+    if token_ids:
+        market["clobTokenIds"] = '["%s", "%s"]' % token_ids
+    return market
+
+
+class MissingTokenIdsTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = MarketMetadataCache(price_ttl=2.0)
+        self.now = 1000.0
+        clock = mock.patch.object(market_cache_module.time, "time", lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def serve(self, *payloads):
+        http = mock.patch.object(
+            market_cache_module.http_client,
+            "get",
+            side_effect=[FakeResponse(p) for p in payloads],
+        )
+        self.get = http.start()
+        self.addCleanup(http.stop)
+
+    def test_listed_without_tokens_then_tokens_appear(self):
+        self.serve(gamma_market(), gamma_market(("111", "222")))
+        self.assertIsNone(self.cache.get_token_ids(SLUG))
+
+        # Past the retry TTL the next read refetches and picks the IDs up
+        self.now += 2.5
+        self.assertEqual(self.cache.get_token_ids(SLUG), ("111", "222"))
+        self.assertEqual(self.get.call_count, 2)
+
+    def test_filled_token_ids_are_kept(self):
+        self.serve(gamma_market(("111", "222")))
+        self.assertEqual(self.cache.get_token_ids(SLUG), ("111", "222"))
+        self.now += 3600
+        self.assertEqual(self.cache.get_token_ids(SLUG), ("111", "222"))
+        self.assertEqual(self.get.call_count, 1)
+
+    def test_prefetch_skips_markets_without_token_ids(self):
+        self.serve([gamma_market()])
+        self.assertEqual(self.cache.prefetch([SLUG]), {})
+        self.assertIsNone(self.cache.peek(SLUG, "token_ids"))
+
+        self.serve([gamma_market(("111", "222"))])
+        self.assertEqual(
+            self.cache.prefetch([SLUG])[SLUG]["token_ids"], ("111", "222")
+        )
+
+
+class StreamedQuoteTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = MarketMetadataCache(price_ttl=2.0)
+        self.now = 1000.0
+        self.feed_age = 0.1
+        for target, attr, value in (
+            (market_cache_module.time, "time", lambda: self.now),
+            (market_cache_module.ws_manager, "feed_age", lambda: self.feed_age),
+        ):
+            patcher = mock.patch.object(target, attr, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.cache.store(SLUG, gamma_market(("111", "222")))
+        self.cache.apply_quote("111", 0.60, 0.62)
+        http = mock.patch.object(
+            market_cache_module.http_client,
+            "get",
+            return_value=FakeResponse(gamma_market(("111", "222"))),
+        )
+        self.get = http.start()
+        self.addCleanup(http.stop)
+
+    def test_live_feed_serves_streamed_quote(self):
+        self.now += 1.0
+        self.assertEqual(self.cache.get(SLUG, "best_bid"), 0.60)
+        self.assertEqual(self.get.call_count, 0)
+
+    def test_silent_feed_falls_back_to_gamma(self):
+        self.feed_age = 3600.0
+        self.assertEqual(self.cache.get(SLUG, "outcome_prices"), [0.5, 0.5])
+        self.assertEqual(self.get.call_count, 1)
+
+    def test_old_streamed_quote_falls_back_to_gamma(self):
+        self.now += 2.5
+        self.assertEqual(self.cache.get(SLUG, "outcome_prices"), [0.5, 0.5])
+        self.assertEqual(self.get.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()